@@ -0,0 +1,58 @@
+"""
+Benchmarks of the model selection regressors.
+"""
+
+import numpy as np
+
+from pyoptex._seed import set_seed
+from pyoptex.analysis import PValueDropRegressor, SamsRegressor
+from pyoptex.analysis.utils.fit import r2adj
+from pyoptex.utils import Factor
+from pyoptex.utils.model import model2Y2X, order_dependencies
+
+from .common import Benchmark, SEED, create_model, factor_names, simulate_data
+
+
+class _Regressor(Benchmark):
+    """
+    The common setup of the regressors: a quadratic model in
+    continuous factors, fitted on simulated data.
+    """
+    params = ([50, 200], [3, 6])
+    param_names = ['runs', 'factors']
+
+    def create_regressor(self, factors, Y2X, dependencies):
+        raise NotImplementedError('Must be implemented by the benchmark')
+
+    def setup(self, nruns, nfactors):
+        factors = [Factor(name) for name in factor_names(nfactors)]
+        model, Y2X = create_model(factors, 'quad')
+        self.regr = self.create_regressor(factors, Y2X, order_dependencies(model, factors))
+        self.data = simulate_data(nfactors, nruns)
+        set_seed(SEED)
+
+    def fit(self):
+        return self.regr.fit(self.data.drop(columns='Y'), self.data['Y'])
+
+    def time_fit(self, *args):
+        self.fit()
+
+    def track_r2adj(self, *args):
+        return r2adj(self.fit().fit_)
+
+    def track_terms(self, *args):
+        return len(self.fit().terms_)
+
+class PValueDrop(_Regressor):
+    def create_regressor(self, factors, Y2X, dependencies):
+        return PValueDropRegressor(
+            factors, Y2X, threshold=0.05, dependencies=dependencies, mode='weak'
+        )
+
+class Sams(_Regressor):
+    def create_regressor(self, factors, Y2X, dependencies):
+        return SamsRegressor(
+            factors, Y2X, dependencies=dependencies, mode='weak',
+            forced_model=np.array([0], np.int64),
+            model_size=6, nb_models=2000, skipn=500, tqdm=False
+        )
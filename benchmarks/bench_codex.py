@@ -0,0 +1,49 @@
+"""
+Benchmarks of the CODEX algorithm.
+"""
+
+from pyoptex._seed import set_seed
+from pyoptex.doe.cost_optimal import Factor
+from pyoptex.doe.cost_optimal.codex import (
+    create_cost_optimal_codex_design, create_parameters, default_fn
+)
+from pyoptex.doe.cost_optimal.cost import parallel_worker_cost
+from pyoptex.doe.cost_optimal.metric import Dopt
+
+from .common import Benchmark, SEED, create_factors, create_model
+
+
+class Codex(Benchmark):
+    """
+    A cost-optimal D-optimal design with an expensive
+    transition of the categorical factor.
+    """
+    params = ([3, 5], [2, 4], ['tfi', 'quad'])
+    param_names = ['factors', 'levels', 'order']
+
+    nsims = 100
+    nreps = 2
+
+    def setup(self, nfactors, levels, order):
+        kwargs = [dict()] + [dict(grouped=False) for _ in range(nfactors - 1)]
+        factors = create_factors(Factor, nfactors, levels, kwargs)
+        _, Y2X = create_model(factors, order)
+        costs = {str(f.name): (60 if i == 0 else 1) for i, f in enumerate(factors)}
+        cost = parallel_worker_cost(costs, factors, 3 * 4 * 60, 5)
+        fn = default_fn(self.nsims, factors, cost, Dopt(), Y2X)
+        self.params_ = create_parameters(factors, fn)
+
+        # Compile the numba functions outside of the timing
+        create_cost_optimal_codex_design(self.params_, nreps=1, nsims=1, validate=False)
+        set_seed(SEED)
+
+    def time_design(self, *args):
+        create_cost_optimal_codex_design(
+            self.params_, nreps=self.nreps, nsims=self.nsims, validate=False
+        )
+
+    def track_metric(self, *args):
+        _, state = create_cost_optimal_codex_design(
+            self.params_, nreps=self.nreps, nsims=self.nsims, validate=False
+        )
+        return state.metric
@@ -0,0 +1,93 @@
+"""
+Benchmarks of the evaluation of the designs.
+"""
+
+import numpy as np
+
+from pyoptex._seed import set_seed
+from pyoptex.doe import cost_optimal, fixed_structure
+from pyoptex.doe.cost_optimal.codex import (
+    create_cost_optimal_codex_design, create_parameters as create_codex_parameters, 
+    default_fn as default_codex_fn
+)
+from pyoptex.doe.cost_optimal.cost import parallel_worker_cost
+from pyoptex.doe.cost_optimal.evaluate import (
+    estimation_variance_matrix as codex_estimation_variance_matrix,
+    evaluate_metrics as codex_evaluate_metrics,
+    fraction_of_design_space as codex_fraction_of_design_space
+)
+from pyoptex.doe.fixed_structure import (
+    RandomEffect, create_fixed_structure_design, create_parameters, default_fn
+)
+from pyoptex.doe.fixed_structure.evaluate import (
+    estimation_variance_matrix, evaluate_metrics, fraction_of_design_space
+)
+
+from .common import Benchmark, SEED, create_factors, create_model
+
+
+class EvaluateFixedStructure(Benchmark):
+    """
+    The evaluation of a design generated by the
+    generic fixed structure algorithm.
+    """
+    params = ([40, 80], [3, 6])
+    param_names = ['runs', 'factors']
+    number = 0  # Determined by asv, as the evaluations are fast
+
+    def setup(self, nruns, nfactors):
+        set_seed(SEED)
+        re = RandomEffect(np.repeat(np.arange(nruns // 4), 4), ratio=1)
+        kwargs = [dict(re=re)] + [dict() for _ in range(nfactors - 1)]
+        factors = create_factors(fixed_structure.Factor, nfactors, 3, kwargs)
+        _, Y2X = create_model(factors, 'quad')
+        fn = default_fn(factors, fixed_structure.metric.Dopt(), Y2X)
+        self.params_ = create_parameters(factors, fn, nruns)
+        self.Y, _ = create_fixed_structure_design(self.params_, n_tries=1)
+        set_seed(SEED)
+
+    def time_evaluate_metrics(self, *args):
+        evaluate_metrics(self.Y, self.params_, [
+            fixed_structure.metric.Dopt(), fixed_structure.metric.Aopt(), 
+            fixed_structure.metric.Iopt()
+        ])
+
+    def time_fraction_of_design_space(self, *args):
+        fraction_of_design_space(self.Y, self.params_)
+
+    def time_estimation_variance_matrix(self, *args):
+        estimation_variance_matrix(self.Y, self.params_)
+
+class EvaluateCodex(Benchmark):
+    """
+    The evaluation of a design generated by the CODEX algorithm.
+    """
+    params = ([3, 5],)
+    param_names = ['factors']
+    number = 0  # Determined by asv, as the evaluations are fast
+
+    def setup(self, nfactors):
+        set_seed(SEED)
+        kwargs = [dict()] + [dict(grouped=False) for _ in range(nfactors - 1)]
+        factors = create_factors(cost_optimal.Factor, nfactors, 3, kwargs)
+        _, Y2X = create_model(factors, 'quad')
+        costs = {str(f.name): (60 if i == 0 else 1) for i, f in enumerate(factors)}
+        cost = parallel_worker_cost(costs, factors, 3 * 4 * 60, 5)
+        fn = default_codex_fn(100, factors, cost, cost_optimal.metric.Dopt(), Y2X)
+        self.params_ = create_codex_parameters(factors, fn)
+        self.Y, _ = create_cost_optimal_codex_design(
+            self.params_, nreps=1, nsims=100, validate=False
+        )
+        set_seed(SEED)
+
+    def time_evaluate_metrics(self, *args):
+        codex_evaluate_metrics(self.Y, self.params_, [
+            cost_optimal.metric.Dopt(), cost_optimal.metric.Aopt(), 
+            cost_optimal.metric.Iopt()
+        ])
+
+    def time_fraction_of_design_space(self, *args):
+        codex_fraction_of_design_space(self.Y, self.params_)
+
+    def time_estimation_variance_matrix(self, *args):
+        codex_estimation_variance_matrix(self.Y, self.params_)
@@ -0,0 +1,41 @@
+"""
+Benchmarks of the generic fixed structure algorithm.
+"""
+
+import numpy as np
+
+from pyoptex._seed import set_seed
+from pyoptex.doe.fixed_structure import (
+    Factor, RandomEffect, create_fixed_structure_design, create_parameters, default_fn
+)
+from pyoptex.doe.fixed_structure.metric import Dopt
+
+from .common import Benchmark, SEED, create_factors, create_model
+
+
+class FixedStructure(Benchmark):
+    """
+    A D-optimal design with a hard-to-change categorical factor,
+    grouped in blocks of four runs.
+    """
+    params = ([40, 80], [3, 6], [3, 5], ['tfi', 'quad'])
+    param_names = ['runs', 'factors', 'levels', 'order']
+
+    def setup(self, nruns, nfactors, levels, order):
+        re = RandomEffect(np.repeat(np.arange(nruns // 4), 4), ratio=1)
+        kwargs = [dict(re=re)] + [dict() for _ in range(nfactors - 1)]
+        factors = create_factors(Factor, nfactors, levels, kwargs)
+        _, Y2X = create_model(factors, order)
+        fn = default_fn(factors, Dopt(), Y2X)
+        self.params_ = create_parameters(factors, fn, nruns)
+
+        # Compile the numba functions outside of the timing
+        create_fixed_structure_design(self.params_, n_tries=1, max_it=1)
+        set_seed(SEED)
+
+    def time_design(self, *args):
+        create_fixed_structure_design(self.params_, n_tries=5)
+
+    def track_metric(self, *args):
+        _, state = create_fixed_structure_design(self.params_, n_tries=5)
+        return state.metric
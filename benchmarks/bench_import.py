@@ -0,0 +1,19 @@
+"""
+Benchmarks of the import time of the subpackages.
+"""
+
+
+class Import:
+    """
+    The import time in a new interpreter. Heavy optional dependencies
+    must only be imported when used.
+    """
+    params = ([
+        'pyoptex', 'pyoptex.analysis', 'pyoptex.doe.fixed_structure',
+        'pyoptex.doe.fixed_structure.splitk_plot', 'pyoptex.doe.cost_optimal.codex'
+    ],)
+    param_names = ['module']
+    repeat = (1, 5, 60.0)
+
+    def timeraw_import(self, module):
+        return f'import {module}'
@@ -0,0 +1,32 @@
+"""
+Benchmarks of the model matrix computations.
+"""
+
+import numpy as np
+
+from pyoptex.doe.fixed_structure import Factor
+
+from .common import SEED, create_factors, create_model
+
+
+class Model:
+    """
+    Computes the model matrix of a full quadratic model in 15 factors,
+    with and without an output buffer.
+    """
+    params = ([1, 16, 4096],)
+    param_names = ['nruns']
+
+    def setup(self, nruns):
+        factors = create_factors(Factor, 15, 3)
+        _, self.Y2X = create_model(factors, 'quad')
+        self.Y = np.random.default_rng(SEED).uniform(-1, 1, (nruns, self.Y2X.modelenc.shape[1]))
+
+        # Compile
+        self.X = self.Y2X(self.Y)
+
+    def time_allocate(self, nruns):
+        self.Y2X(self.Y)
+
+    def time_buffer(self, nruns):
+        self.Y2X(self.Y, out=self.X)
@@ -0,0 +1,43 @@
+"""
+Benchmarks of the split\\ :sup:`k`\\ -plot algorithm.
+"""
+
+from pyoptex._seed import set_seed
+from pyoptex.doe.fixed_structure import Factor
+from pyoptex.doe.fixed_structure.splitk_plot import (
+    Plot, create_parameters, create_splitk_plot_design, default_fn
+)
+from pyoptex.doe.fixed_structure.splitk_plot.metric import Dopt
+
+from .common import Benchmark, SEED, create_factors, create_model
+
+
+class SplitkPlot(Benchmark):
+    """
+    A D-optimal design of 80 runs with a categorical factor in the
+    highest stratum, a continuous factor in the middle stratum (if any), 
+    and the other continuous factors in the lowest stratum.
+    """
+    params = ([2, 3], [3, 6], [3, 5], ['tfi', 'quad'])
+    param_names = ['strata', 'factors', 'levels', 'order']
+
+    def setup(self, nstrata, nfactors, levels, order):
+        sizes = {2: (4, 20), 3: (4, 2, 10)}[nstrata]
+        plots = [Plot(level=i, size=s, ratio=1) for i, s in enumerate(sizes)]
+        kwargs = [dict(re=plots[-1]), dict(re=plots[-2])] \
+                    + [dict(re=plots[0]) for _ in range(nfactors - 2)]
+        factors = create_factors(Factor, nfactors, levels, kwargs)
+        _, Y2X = create_model(factors, order)
+        fn = default_fn(factors, Dopt(), Y2X)
+        self.params_ = create_parameters(factors, fn)
+
+        # Compile the numba functions outside of the timing
+        create_splitk_plot_design(self.params_, n_tries=1, max_it=1)
+        set_seed(SEED)
+
+    def time_design(self, *args):
+        create_splitk_plot_design(self.params_, n_tries=5)
+
+    def track_metric(self, *args):
+        _, state = create_splitk_plot_design(self.params_, n_tries=5)
+        return state.metric
@@ -0,0 +1,116 @@
+"""
+Common problem definitions of the benchmarks.
+"""
+
+import numpy as np
+import pandas as pd
+
+from pyoptex._seed import set_seed
+from pyoptex.utils.model import model2Y2X, partial_rsm_names
+
+# The seed of every benchmark
+SEED = 42
+
+class Benchmark:
+    """
+    The common settings of the benchmarks. Each sample times a single
+    call, as the design algorithms take seconds.
+    """
+    number = 1
+    repeat = (1, 3, 60.0)
+    timeout = 1800
+
+def factor_names(nfactors):
+    """
+    Generates the factor names.
+
+    Parameters
+    ----------
+    nfactors : int
+        The number of factors.
+
+    Returns
+    -------
+    names : list(str)
+        The names A, B, C, ...
+    """
+    return [chr(ord('A') + i) for i in range(nfactors)]
+
+def create_factors(Factor, nfactors, levels, kwargs=None):
+    """
+    Creates the factors of a problem. The first factor is
+    categorical, the others are continuous.
+
+    Parameters
+    ----------
+    Factor : type
+        The factor class of the design algorithm.
+    nfactors : int
+        The number of factors.
+    levels : int
+        The number of levels of the categorical factor.
+    kwargs : None or list(dict)
+        The additional keyword arguments of each factor.
+
+    Returns
+    -------
+    factors : list(Factor)
+        The factors.
+    """
+    kwargs = kwargs or [dict() for _ in range(nfactors)]
+    return [
+        Factor(name, type='categorical', levels=[f'L{j}' for j in range(levels)], **kwargs[i])
+        if i == 0 else Factor(name, type='continuous', **kwargs[i])
+        for i, name in enumerate(factor_names(nfactors))
+    ]
+
+def create_model(factors, order):
+    """
+    Creates a partial response surface model with the same
+    order for every factor.
+
+    Parameters
+    ----------
+    factors : list(Factor)
+        The factors.
+    order : str
+        The order of every factor, 'lin', 'tfi' or 'quad'.
+        The categorical factor is at most 'tfi'.
+
+    Returns
+    -------
+    model : pd.DataFrame
+        The model.
+    Y2X : func(Y)
+        The function converting the design matrix to the model matrix.
+    """
+    model = partial_rsm_names({
+        str(f.name): ('tfi' if order == 'quad' and f.is_categorical else order) 
+        for f in factors
+    })
+    return model, model2Y2X(model, factors)
+
+def simulate_data(nfactors, nruns, noise=1.0):
+    """
+    Simulates random data in continuous factors with a few
+    active main effects and a single two-factor interaction.
+
+    Parameters
+    ----------
+    nfactors : int
+        The number of factors, at least three.
+    nruns : int
+        The number of observations.
+    noise : float
+        The standard deviation of the noise.
+
+    Returns
+    -------
+    data : pd.DataFrame
+        The factors and response `Y`.
+    """
+    set_seed(SEED)
+    data = pd.DataFrame(np.random.rand(nruns, nfactors) * 2 - 1, columns=factor_names(nfactors))
+    data['Y'] = 5 + 2 * data['A'] + 3 * data['C'] - 4 * data['A'] * data['B'] \
+                    + np.random.normal(0, noise, nruns)
+    return data
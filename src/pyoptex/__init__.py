@@ -1,2 +1,10 @@
 # Define the version number
 __version__ = "1.0.0-rc4"
+
+def warmup(*args, **kwargs):
+    """
+    Compiles the numba functions of the design algorithms, see
+    :py:func:`warmup <pyoptex._warmup.warmup>`.
+    """
+    from ._warmup import warmup
+    return warmup(*args, **kwargs)
@@ -0,0 +1,33 @@
+"""
+Command line interface of pyoptex.
+"""
+
+import argparse
+
+from ._warmup import warmup
+
+
+def main():
+    """
+    Parses the command line arguments and runs the command.
+    """
+    parser = argparse.ArgumentParser(prog='python -m pyoptex')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    # Warm-up command
+    warm = commands.add_parser('warmup', help='Compile and cache the numba functions')
+    warm.add_argument(
+        '--algorithms', nargs='+', default=['fixed', 'splitk', 'codex'],
+        choices=['fixed', 'splitk', 'codex'], help='The algorithms to warm up'
+    )
+    warm.add_argument(
+        '--metrics', nargs='+', default=['Dopt', 'Aopt', 'Iopt'],
+        help='The metrics to warm up'
+    )
+
+    args = parser.parse_args()
+    if args.command == 'warmup':
+        warmup(args.algorithms, args.metrics)
+
+if __name__ == '__main__':
+    main()
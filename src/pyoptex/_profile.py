@@ -1,7 +1,281 @@
+"""
+Module for the instrumentation of the design algorithms.
+
+Every function decorated with :py:func:`profile <pyoptex._profile.profile>`
+records its number of calls, its cumulative and self time, and the number of metric
+evaluations performed during the call. The recording is disabled by default, and
+is enabled by
+
+* the :py:func:`profiling <pyoptex._profile.profiling>` context manager,
+* :py:func:`enable <pyoptex._profile.enable>` and :py:func:`disable <pyoptex._profile.disable>`,
+* the `PYOPTEX_PROFILE` environment variable, set to the path of the
+  JSON report written at exit. Set `PYOPTEX_PROFILE_TRACE` to the path
+  of a Chrome trace to additionally record every call.
+
+>>> with profiling(trace=True):
+>>>     Y, state = create_fixed_structure_design(params)
+>>> report()
+>>> write_trace('trace.json')
+
+The trace can be opened in `chrome://tracing`, `Perfetto <https://ui.perfetto.dev>`_
+or `speedscope <https://www.speedscope.app>`_. Only the calls in the current
+process are recorded, use `n_jobs=1` to profile the design algorithms.
+
+When running under line_profiler's kernprof, the decorator is replaced by
+the line profiler instead.
+"""
+
+import atexit
 import builtins
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+# The state of the registry
+_enabled = False
+_trace = False
+_lock = threading.Lock()
+_local = threading.local()
+_stats = dict()
+_events = []
+_start = time.perf_counter()
+
+def _frames():
+    """
+    Retrieves the stack of active profiled calls of the current thread.
+
+    Returns
+    -------
+    frames : list(list)
+        The name, start time, child time and number of evaluations
+        of each active call.
+    """
+    try:
+        return _local.frames
+    except AttributeError:
+        _local.frames = []
+        return _local.frames
+
+def _call(name, func, args, kwargs):
+    """
+    Calls and records a profiled function.
+
+    Parameters
+    ----------
+    name : str
+        The name of the function.
+    func : func
+        The function.
+    args : tuple
+        The positional arguments.
+    kwargs : dict
+        The keyword arguments.
+
+    Returns
+    -------
+    result : obj
+        The result of the function.
+    """
+    frames = _frames()
+    frame = [name, time.perf_counter(), 0.0, 0]
+    frames.append(frame)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        end = time.perf_counter()
+        frames.pop()
+        total = end - frame[1]
+
+        # Propagate to the caller
+        if frames:
+            frames[-1][2] += total
+            frames[-1][3] += frame[3]
+
+        with _lock:
+            # Update the statistics
+            stats = _stats.setdefault(name, [0, 0.0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += total
+            stats[2] += total - frame[2]
+            stats[3] += frame[3]
+
+            # Store the trace event
+            if _trace:
+                _events.append((name, frame[1], total, threading.get_ident()))
+
+def profile(func):
+    """
+    Decorator to record the calls of a function when profiling
+    is enabled. Otherwise, only a single check is added to every call.
+
+    Parameters
+    ----------
+    func : func
+        The function to profile.
+
+    Returns
+    -------
+    wrapper : func
+        The profiled function.
+    """
+    name = f'{func.__module__}.{func.__qualname__}'
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        return _call(name, func, args, kwargs)
+
+    return wrapper
+
+def count_evaluations(n=1):
+    """
+    Records `n` metric evaluations in the active profiled call
+    (and all its callers).
+
+    Parameters
+    ----------
+    n : int
+        The number of evaluations.
+    """
+    if _enabled:
+        frames = _frames()
+        if frames:
+            frames[-1][3] += n
+
+def enable(trace=False):
+    """
+    Enables the profiling.
+
+    Parameters
+    ----------
+    trace : bool
+        Whether to additionally record every call for
+        :py:func:`write_trace <pyoptex._profile.write_trace>`.
+    """
+    global _enabled, _trace
+    _enabled = True
+    _trace = trace
+
+def disable():
+    """
+    Disables the profiling. The recorded statistics are kept.
+    """
+    global _enabled, _trace
+    _enabled = False
+    _trace = False
+
+def reset():
+    """
+    Removes all recorded statistics and calls.
+    """
+    with _lock:
+        _stats.clear()
+        _events.clear()
+
+@contextlib.contextmanager
+def profiling(trace=False, clear=True):
+    """
+    Context manager to profile a block of code.
+
+    Parameters
+    ----------
+    trace : bool
+        Whether to additionally record every call for
+        :py:func:`write_trace <pyoptex._profile.write_trace>`.
+    clear : bool
+        Whether to remove the previously recorded statistics.
+    """
+    state = (_enabled, _trace)
+    if clear:
+        reset()
+    enable(trace)
+    try:
+        yield
+    finally:
+        if state[0]:
+            enable(state[1])
+        else:
+            disable()
+
+def report():
+    """
+    Creates the report of the recorded statistics, sorted by the
+    cumulative time. The times are in seconds.
+
+    Returns
+    -------
+    report : dict
+        A dictionary with the calls, cumulative time (total),
+        self time (self) and number of metric evaluations for
+        each profiled function.
+    """
+    with _lock:
+        stats = sorted(_stats.items(), key=lambda s: -s[1][1])
+    return {
+        name: dict(calls=s[0], total=s[1], self=s[2], evaluations=s[3])
+        for name, s in stats
+    }
+
+def write_report(path):
+    """
+    Writes the :py:func:`report <pyoptex._profile.report>` as JSON.
+
+    Parameters
+    ----------
+    path : str
+        The path of the report.
+    """
+    with open(path, 'w') as f:
+        json.dump(report(), f, indent=2)
+
+def write_trace(path):
+    """
+    Writes the recorded calls in the Chrome trace event format,
+    which can also be imported in speedscope. Requires profiling
+    with `trace=True`.
+
+    Parameters
+    ----------
+    path : str
+        The path of the trace.
+    """
+    pid = os.getpid()
+    with _lock:
+        events = [
+            dict(name=name, ph='X', ts=(start - _start) * 1e6, dur=dur * 1e6, pid=pid, tid=tid)
+            for name, start, dur, tid in _events
+        ]
+    with open(path, 'w') as f:
+        json.dump(dict(traceEvents=events, displayTimeUnit='ms'), f)
+
+def _write_at_exit(report_path, trace_path):
+    """
+    Writes the report and trace at the exit of the process,
+    configured by the environment variables.
+
+    Parameters
+    ----------
+    report_path : None or str
+        The path of the report.
+    trace_path : None or str
+        The path of the trace.
+    """
+    if report_path:
+        write_report(report_path)
+    if trace_path:
+        write_trace(trace_path)
 
-try:
+if hasattr(builtins, 'profile'):
+    # Running under the line profiler
     profile = builtins.profile
-except AttributeError:
-    # No line profiler, provide a pass-through version
-    def profile(func): return func
+elif os.environ.get('PYOPTEX_PROFILE') or os.environ.get('PYOPTEX_PROFILE_TRACE'):
+    # Enabled by the environment
+    enable(trace=bool(os.environ.get('PYOPTEX_PROFILE_TRACE')))
+    atexit.register(
+        _write_at_exit, os.environ.get('PYOPTEX_PROFILE'),
+        os.environ.get('PYOPTEX_PROFILE_TRACE')
+    )
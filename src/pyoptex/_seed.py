@@ -2,6 +2,10 @@ import numba
 import numpy as np
 
 
+@numba.njit(cache=True)
+def _set_numba_seed(value):
+    np.random.seed(value)
+
 def set_seed(n):
     """
     Sets the seed of the program for both numpy and numba.
@@ -12,7 +16,32 @@ def set_seed(n):
         The seed.
     """
     np.random.seed(n)
-    @numba.njit
-    def _set_seed(value):
-        np.random.seed(value)
-    _set_seed(n)
\ No newline at end of file
+    _set_numba_seed(n)
+
+def generate_seeds(n, seed=None):
+    """
+    Generates `n` independent seeds from a single master seed.
+    Each seed can be used to initialize its own reproducible
+    random stream using :py:func:`set_seed <pyoptex._seed.set_seed>`.
+
+    Parameters
+    ----------
+    n : int
+        The number of seeds to generate.
+    seed : None or int
+        The master seed. If None, the master seed is drawn
+        from the global numpy random state, which makes the
+        seeds reproducible after a call to 
+        :py:func:`set_seed <pyoptex._seed.set_seed>`.
+
+    Returns
+    -------
+    seeds : list(int)
+        The list of generated seeds.
+    """
+    if seed is None:
+        seed = np.random.randint(0, np.iinfo(np.int32).max)
+    return [
+        int(s.generate_state(1)[0]) 
+        for s in np.random.SeedSequence(seed).spawn(n)
+    ]
@@ -0,0 +1,144 @@
+"""
+Module for the warm-up of the numba compiled functions.
+"""
+
+import time
+
+import numpy as np
+
+
+def _warmup_fixed(metrics):
+    """
+    Generates a small design with the generic fixed structure algorithm
+    for each metric.
+
+    Parameters
+    ----------
+    metrics : list(str)
+        The names of the metrics.
+    """
+    from .doe.constraints import parse_constraints_script
+    from .doe.fixed_structure import (
+        Factor, RandomEffect, create_fixed_structure_design, create_parameters, default_fn
+    )
+    from .doe.fixed_structure import metric as metrics_
+    from .utils.model import model2Y2X, partial_rsm_names
+
+    # Define the factors
+    nruns = 16
+    re = RandomEffect(np.repeat(np.arange(8), 2), ratio=1)
+    factors = [
+        Factor('A', re, type='categorical', levels=['L1', 'L2', 'L3']),
+        Factor('B', type='continuous'),
+        Factor('C', type='continuous'),
+    ]
+    Y2X = model2Y2X(partial_rsm_names({'A': 'tfi', 'B': 'quad', 'C': 'quad'}), factors)
+    constraints = parse_constraints_script('(`A` == "L1") & (`B` < -0.5)', factors)
+
+    for name in metrics:
+        metric = getattr(metrics_, name)(**({'n': 1024} if name == 'Iopt' else {}))
+        fn = default_fn(factors, metric, Y2X, constraints=constraints)
+        params = create_parameters(factors, fn, nruns, continuous=(name == 'Dopt'))
+        create_fixed_structure_design(params, n_tries=1, max_it=1)
+
+def _warmup_splitk(metrics):
+    """
+    Generates a small split-plot design with the
+    split\\ :sup:`k`\\ -plot algorithm for each metric.
+
+    Parameters
+    ----------
+    metrics : list(str)
+        The names of the metrics.
+    """
+    from .doe.constraints import parse_constraints_script
+    from .doe.fixed_structure import Factor
+    from .doe.fixed_structure.splitk_plot import (
+        Plot, create_parameters, create_splitk_plot_design, default_fn
+    )
+    from .doe.fixed_structure.splitk_plot import metric as metrics_
+    from .utils.model import model2Y2X, partial_rsm_names
+
+    # Define the factors
+    etc = Plot(level=0, size=4, ratio=1)
+    htc = Plot(level=1, size=4, ratio=1)
+    factors = [
+        Factor('A', htc, type='categorical', levels=['L1', 'L2', 'L3']),
+        Factor('B', etc, type='continuous'),
+        Factor('C', etc, type='continuous'),
+    ]
+    Y2X = model2Y2X(partial_rsm_names({'A': 'tfi', 'B': 'quad', 'C': 'quad'}), factors)
+    constraints = parse_constraints_script('(`A` == "L1") & (`B` < -0.5)', factors)
+
+    for name in metrics:
+        metric = getattr(metrics_, name)(**({'n': 1024} if name == 'Iopt' else {}))
+        fn = default_fn(factors, metric, Y2X, constraints=constraints)
+        params = create_parameters(factors, fn, continuous=(name == 'Dopt'))
+        create_splitk_plot_design(params, n_tries=1, max_it=1)
+
+def _warmup_codex(metrics):
+    """
+    Generates a small design with the CODEX algorithm for each metric.
+
+    Parameters
+    ----------
+    metrics : list(str)
+        The names of the metrics.
+    """
+    from .doe.constraints import parse_constraints_script
+    from .doe.cost_optimal import Factor
+    from .doe.cost_optimal import metric as metrics_
+    from .doe.cost_optimal.codex import (
+        create_cost_optimal_codex_design, create_parameters, default_fn
+    )
+    from .doe.cost_optimal.cost import parallel_worker_cost
+    from .utils.model import model2Y2X, partial_rsm_names
+
+    # Define the factors
+    factors = [
+        Factor('A', type='categorical', levels=['L1', 'L2', 'L3']),
+        Factor('B', type='continuous', grouped=False),
+        Factor('C', type='continuous', grouped=False),
+    ]
+    Y2X = model2Y2X(partial_rsm_names({'A': 'tfi', 'B': 'quad', 'C': 'quad'}), factors)
+    constraints = parse_constraints_script('(`A` == "L1") & (`B` < -0.5)', factors)
+    cost = parallel_worker_cost({'A': 10, 'B': 1, 'C': 1}, factors, 200, 5)
+
+    nsims = 10
+    for name in metrics:
+        metric = getattr(metrics_, name)(**({'n': 1024} if name == 'Iopt' else {}))
+        fn = default_fn(nsims, factors, cost, metric, Y2X, constraints=constraints)
+        params = create_parameters(factors, fn)
+        create_cost_optimal_codex_design(params, nreps=1, nsims=nsims, validate=False)
+
+def warmup(algorithms=('fixed', 'splitk', 'codex'), metrics=('Dopt', 'Aopt', 'Iopt'),
+           verbose=True):
+    """
+    Compiles the numba functions of the design algorithms by generating
+    a small design with each algorithm and metric. The machine code of the
+    functions is stored in numba's on-disk cache, such that later
+    processes skip the compilation.
+
+    The functions generated for a specific model and constraints
+    are only persisted when the on-disk cache is enabled, see
+    :py:mod:`cache <pyoptex.utils.cache>`.
+
+    Parameters
+    ----------
+    algorithms : iterable(str)
+        The algorithms to warm up: 'fixed' for the generic fixed structure
+        algorithm, 'splitk' for the split\\ :sup:`k`\\ -plot algorithm, and
+        'codex' for the CODEX algorithm.
+    metrics : iterable(str)
+        The names of the metrics to warm up.
+    verbose : bool
+        Whether to print the time of each algorithm.
+    """
+    fns = {'fixed': _warmup_fixed, 'splitk': _warmup_splitk, 'codex': _warmup_codex}
+    assert all(a in fns for a in algorithms), f'Algorithms must be in {tuple(fns)}'
+
+    for a in algorithms:
+        start = time.time()
+        fns[a](list(metrics))
+        if verbose:
+            print(f'Warmed up {a} in {time.time() - start:.1f}s')
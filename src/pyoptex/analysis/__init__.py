@@ -1,5 +1,21 @@
-from .estimators.simple_model import SimpleRegressor
-from .estimators.p_value_drop_model import PValueDropRegressor
-from .estimators.sams.estimator import SamsRegressor
+import importlib
 
-from .utils.plot import plot_res_diagnostics
+# The public objects and their modules, imported on first access
+_LAZY = {
+    'SimpleRegressor': '.estimators.simple_model',
+    'PValueDropRegressor': '.estimators.p_value_drop_model',
+    'SamsRegressor': '.estimators.sams.estimator',
+    'plot_res_diagnostics': '.utils.plot',
+}
+
+__all__ = list(_LAZY)
+
+def __getattr__(name):
+    if name in _LAZY:
+        obj = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
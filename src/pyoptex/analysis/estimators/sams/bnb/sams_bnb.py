@@ -3,7 +3,6 @@ Module for the SAMS branch-and-bound code.
 """
 
 import numpy as np
-from scipy import sparse
 
 from .bnb import BnB
 from .....utils.model import permitted_dep_add
@@ -26,6 +25,8 @@ def sparsify(models, nterms):
     sparse_matrix : `scipy.sparse.csc_matrix`
         The sparse csc matrix.
     """
+    from scipy import sparse
+
     return sparse.csc_matrix((
                 np.ones(models.size, dtype=np.bool_), 
                 (np.repeat(np.arange(len(models)), models.shape[1]), models.flatten())
@@ -4,9 +4,7 @@ Module for the SAMS regressor.
 
 import numpy as np
 import pandas as pd
-import ruptures as rpt
 from functools import reduce
-from sklearn.cluster import KMeans
 from tqdm import tqdm
 
 from ....utils.design import obs_var_from_Zs
@@ -466,6 +464,9 @@ class SamsRegressor(MultiRegressionMixin):
         y : np.array(1d)
             The normalized output variable.
         """
+        import ruptures as rpt
+        from sklearn.cluster import KMeans
+
         # Some final validation
         assert np.all(self.forced_model < self.n_encoded_features_), 'The forced model must have integers smaller than the number of parameters in X'
         if self.mode is not None:
@@ -600,6 +601,9 @@ class SamsRegressor(MultiRegressionMixin):
         fig : :py:class:`plotly.graph_objects.Figure`
             The Plotly Figure object of the raster plot.
         """
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
         assert self.is_fitted, 'You must fit the regressor before plotting the selection plot'
 
         # Extract top raster terms
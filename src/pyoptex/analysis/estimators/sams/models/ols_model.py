@@ -3,7 +3,6 @@ Module for the SAMS OLS modelling.
 """
 
 import numpy as np
-import statsmodels.api as sm
 
 from .model import Model, ModelResults
 
@@ -77,6 +76,8 @@ class OlsModel(Model):
             The sum of squared residuals divided by the degrees
             of freedom (= X.shape[0] - X.shape[1]).
         """
+        import statsmodels.api as sm
+
         # Fit OLS (performance in numpy with fallback for nearly singular designs)
         params, se, n, _ = np.linalg.lstsq(X, y, rcond=None)
 
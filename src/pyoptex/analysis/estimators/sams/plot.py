@@ -3,8 +3,6 @@ Module for SAMS plotting functions.
 """
 
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 
 def plot_raster(results, terms, skipn=0, metric_name='metric',
@@ -48,6 +46,9 @@ def plot_raster(results, terms, skipn=0, metric_name='metric',
     fig : :py:class:`plotly.graph_objects.Figure`
         A Plotly figure object of the raster.
     """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
     # Order the results ascending
     idx = np.argsort(results['metric'])
     results = results[idx]
@@ -2,9 +2,6 @@ from functools import cached_property
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
-from sklearn.metrics import r2_score
-from statsmodels.regression.mixed_linear_model import VCSpec
 
 from ...utils.design import obs_var_from_Zs
 
@@ -37,6 +34,8 @@ def r2adj(fit):
     r2adj : float
         The adjust r-squared of the results.
     """
+    import statsmodels.api as sm
+
     if fit.k_fe < len(fit.params):
         # Extract Xnumber of observations
         nobs = len(fit.model.exog)
@@ -94,6 +93,8 @@ def fit_ols(X, y):
         The statsmodels regression results with some additional
         attributes.
     """
+    import statsmodels.api as sm
+
     fit = sm.OLS(y, X).fit()
     fit.k_fe = len(fit.params)
     fit.vcomp = np.array([], dtype=np.float64)
@@ -130,6 +131,10 @@ def fit_mixedlm(X, y, groups):
         The statsmodels Mixed LM results with some additional
         attributes.
     """
+    import statsmodels.api as sm
+    from sklearn.metrics import r2_score
+    from statsmodels.regression.mixed_linear_model import VCSpec
+
     # Retrieve dummy encoding for each group
     dummies = [pd.get_dummies(group) for group in groups]
 
@@ -3,10 +3,6 @@ Module for analysis plotting utilities.
 """
 
 import numpy as np 
-import scipy.stats as spstats
-import plotly.graph_objects as go
-from plotly.colors import DEFAULT_PLOTLY_COLORS
-from plotly.subplots import make_subplots
 
 
 def plot_res_diagnostics(df, y_true='y', y_pred='pred', textcols=(), color=None):
@@ -49,6 +45,11 @@ def plot_res_diagnostics(df, y_true='y', y_pred='pred', textcols=(), color=None)
     fig : :py:class:`plotly.graph_objects.Figure`
         The plotly figure with the residual diagnostics.
     """
+    import plotly.graph_objects as go
+    import scipy.stats as spstats
+    from plotly.colors import DEFAULT_PLOTLY_COLORS
+    from plotly.subplots import make_subplots
+
     # Define the colors
     if color is not None:
         unique_colors = df[color].unique()
@@ -6,11 +6,67 @@ import re
 
 import numba
 import numpy as np
-from numba.typed import List
 
+from ..utils import cache
 from ..utils.numba import numba_all_axis1
-from ..utils.design import encode_design
 
+# The compiled constraint functions by key
+_compiled = dict()
+
+# The module of a constraint function in the on-disk cache
+_CONSTRAINT_MODULE = """import numba
+import numpy as np
+
+from pyoptex.utils.numba import numba_all_axis1
+
+
+@numba.njit(cache=True)
+def constraint(Y__):
+    return {source}
+"""
+
+def compile_constraint(source):
+    """
+    Compiles the source of a constraint to a numba function. The
+    source is generated from the constraint tree, and is therefore 
+    normalized (fully parenthesized), and contains the encoding
+    and normalization of the factors.
+
+    The compiled functions are memoized by their source. When the on-disk cache
+    is enabled, see :py:mod:`cache <pyoptex.utils.cache>`, the source is
+    additionally written to a module in the cache and compiled with `cache=True`,
+    such that numba persists the machine code across processes.
+
+    Parameters
+    ----------
+    source : str
+        The expression of the constraint in `Y__`.
+
+    Returns
+    -------
+    constraint : func(Y)
+        The compiled function. The source
+        of the function is stored in its `source` attribute.
+    """
+    key = cache.cache_key('constraint', source)
+    constraint = _compiled.get(key)
+    if constraint is not None:
+        return constraint
+
+    # Load the module from the on-disk cache
+    module = cache.load_module(key, _CONSTRAINT_MODULE.format(source=source))
+    if module is not None:
+        constraint = module.constraint
+
+    # Compile in-process
+    if constraint is None:
+        constraint = numba.njit(eval(
+            f'lambda Y__: {source}', {'numba_all_axis1': numba_all_axis1, 'np': np}
+        ))
+
+    constraint.source = source
+    _compiled[key] = constraint
+    return constraint
 
 def parse_constraints_script(script, factors, exclude=True, eps=1e-6):
     """
@@ -153,8 +209,9 @@ class Col:
         constraint : func(Y)
             A function which returns True when the constraints are violated
             for that run. Y is a decoded design, but normalized design matrix.
+            See :py:func:`compile_constraint <pyoptex.doe.constraints.compile_constraint>`.
         """
-        return numba.njit(eval(f'lambda Y__: {str(self)}'))
+        return compile_constraint(str(self))
 
     def _encode(self):
         """
@@ -188,8 +245,43 @@ class Col:
         constraint : func(Y)
             A function which returns True when the constraints are violated
             for that run. Y is a encoded design design matrix.
+            See :py:func:`compile_constraint <pyoptex.doe.constraints.compile_constraint>`.
+        """
+        return compile_constraint(self._encode())
+
+    def _cols(self):
         """
-        return numba.njit(eval(f'lambda Y__: {self._encode()}', {'numba_all_axis1': numba_all_axis1, 'np': np}))
+        Retrieves the indices of the factors referenced by this constraint.
+
+        Returns
+        -------
+        cols : set(int)
+            The indices of the factors.
+        """
+        return set() if self.is_constant else {self.col}
+
+    def feasibility(self, factors, max_size=2**20):
+        """
+        Retrieves a precomputed feasibility table of the coordinates
+        for the encoded design matrix.
+
+        Parameters
+        ----------
+        factors : list(:py:class:`Factor <pyoptex.utils.factor.Factor>`)
+            The list of factors in the design.
+        max_size : int
+            The maximum number of entries in the table.
+
+        Returns
+        -------
+        table : None or :py:class:`FeasibilityTable <pyoptex.doe.constraints.FeasibilityTable>`
+            The feasibility table, or None if it would have more than
+            `max_size` entries.
+        """
+        cols = sorted(self._cols())
+        if np.prod([len(factors[i].coords_) for i in cols], dtype=np.float64) > max_size:
+            return None
+        return FeasibilityTable(self, factors)
 
     ##############################################
 
@@ -305,6 +397,8 @@ class UnaryCol(Col):
         return f'{self.prefix}{str(self.col)}{self.suffix}'
     def _encode(self):
         return f'{self.prefix}{self.col._encode()}{self.suffix}'
+    def _cols(self):
+        return self.col._cols()
 
 
 class BinaryCol(Col):
@@ -319,6 +413,9 @@ class BinaryCol(Col):
     def _encode(self):
         return f'({self.col._encode()} {self.sep} {self.col2._encode()})'
 
+    def _cols(self):
+        return self.col._cols() | self.col2._cols()
+
 
 class CompCol(BinaryCol):
     def _str(self, col1, col2):
@@ -339,8 +436,7 @@ class CompCol(BinaryCol):
     def __encode__(self, col1, col2):
         assert col1.is_categorical and col2.is_constant, 'Can only compare constant and categorical column'
         if not col1.pre_normalized_encoded_:
-            encoded = encode_design(np.array([[col1.factor.normalize(col2.col)]]), np.array([len(col1.factor.levels)]), 
-                                    List([col1.factor.coords_]))[0]
+            encoded = col1.factor.coords_[col1.factor.normalize(col2.col)]
             col2.col_encoded_ = f'np.array({list(encoded)})'
             col1.pre_normalized_encoded_ = True
         return f'numba_all_axis1({col1._encode()} {self.sep} {col2._encode()})'
@@ -354,6 +450,121 @@ class CompCol(BinaryCol):
             return f'({self.col._encode()} {self.sep} {self.col2._encode()})'
 
 
+class FeasibilityTable:
+    """
+    A precomputed table indicating which combinations of coordinates
+    satisfy the constraints. The constraints are evaluated once on 
+    every combination of the coordinates of the factors referenced in the 
+    constraint tree. Factors which are not referenced are always feasible.
+
+    Each run of an encoded design matrix is represented by an index
+    in the table, see 
+    :py:func:`index <pyoptex.doe.constraints.FeasibilityTable.index>`.
+    The feasible coordinates of a factor, given the other
+    coordinates of the run, are a simple lookup, see
+    :py:func:`feasible <pyoptex.doe.constraints.FeasibilityTable.feasible>`.
+    When the coordinates of a run change, only the index of that
+    run must be recomputed.
+
+    Attributes
+    ----------
+    cols : np.array(1d)
+        The indices of the referenced factors.
+    coords : list(np.array(2d))
+        The encoded coordinates of each factor.
+    colstart : np.array(1d)
+        The start column of each factor in the encoded design matrix.
+    strides : np.array(1d)
+        The stride in the table of each factor, zero if not referenced.
+    table : np.array(1d)
+        True where the combination of coordinates is feasible.
+    """
+
+    def __init__(self, constraint, factors):
+        """
+        Evaluates the constraints on every combination of coordinates.
+
+        Parameters
+        ----------
+        constraint : :py:class:`Col <pyoptex.doe.constraints.Col>`
+            The root constraint.
+        factors : list(:py:class:`Factor <pyoptex.utils.factor.Factor>`)
+            The list of factors in the design.
+        """
+        # Extract the encoded coordinates
+        self.coords = [f.coords_ for f in factors]
+        self.colstart = np.concatenate((
+            [0], np.cumsum([c.shape[1] for c in self.coords])
+        )).astype(np.int64)
+
+        # Compute the strides of the referenced factors
+        self.cols = np.array(sorted(constraint._cols()), dtype=np.int64)
+        self.strides = np.zeros(len(factors), dtype=np.int64)
+        size = 1
+        for i in self.cols[::-1]:
+            self.strides[i] = size
+            size *= len(self.coords[i])
+
+        # Create every combination of coordinates
+        Y = np.zeros((size, self.colstart[-1]), dtype=np.float64)
+        for i in self.cols:
+            digits = (np.arange(size) // self.strides[i]) % len(self.coords[i])
+            Y[:, self.colstart[i]:self.colstart[i+1]] = self.coords[i][digits]
+
+        # Evaluate the constraints
+        self.table = ~constraint.encode()(Y)
+
+    def index(self, Y):
+        """
+        Computes the index in the table of each run.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The encoded design matrix.
+
+        Returns
+        -------
+        idx : np.array(1d)
+            The index of each run, or -1 if any referenced
+            coordinate is not part of the coordinates of its factor.
+        """
+        idx = np.zeros(len(Y), dtype=np.int64)
+        for i in self.cols:
+            # Match the coordinates
+            match = np.all(
+                np.expand_dims(Y[:, self.colstart[i]:self.colstart[i+1]], 1) == self.coords[i],
+                axis=2
+            )
+            digits = np.where(np.any(match, axis=1), np.argmax(match, axis=1), -len(self.table))
+            idx += digits * self.strides[i]
+        return np.where(idx >= 0, idx, -1)
+
+    def feasible(self, idx, col):
+        """
+        Retrieves which coordinates of a factor are feasible
+        given the other coordinates of each run.
+
+        Parameters
+        ----------
+        idx : np.array(1d)
+            The (non-negative) index of each run.
+        col : int
+            The index of the factor.
+
+        Returns
+        -------
+        feasible : np.array(2d)
+            For each run, whether each coordinate of the factor is feasible.
+        """
+        # Remove the current coordinate (if referenced)
+        ncoords, stride = len(self.coords[col]), self.strides[col]
+        base = idx - ((idx // max(stride, 1)) % ncoords) * stride
+
+        # Lookup every coordinate
+        return self.table[np.expand_dims(base, 1) + np.arange(ncoords) * stride]
+
+
 """A function always returning False"""
 no_constraints = Col('np.zeros(len(Y__), dtype=np.bool_)', None)
 
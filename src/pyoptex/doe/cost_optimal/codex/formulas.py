@@ -44,6 +44,86 @@ def ce_update_vinv(Vinv, Zi, b, ratios):
     
     return Zi, Vinv
 
+def ce_update_M(M, Vinv, Zi, b, ratios, X, rows, Xrows):
+    """
+    Computes the update to the information matrices 
+    :math:`M = X^T V^{-1} X` based on the change of the model
+    matrix in `rows`, and the iterative application of the required 
+    operations in `b` as low-rank updates. Vinv itself is not updated, 
+    see :py:func:`apply_vinv_updates <pyoptex.doe.cost_optimal.codex.formulas.apply_vinv_updates>`.
+
+    Parameters
+    ----------
+    M : np.array(3d)
+        The current information matrices.
+    Vinv : np.array(3d)
+        The current inverses of the observation covariance matrix.
+    Zi : np.array(1d) or None
+        The current grouping matrix
+    b : list(tuple(row_start, row_stop, group_from, group_to))
+        A list of operations to apply changing the groups of certain rows.
+    ratios : np.array(1d)
+        The variance ratios of this column.
+    X : np.array(2d)
+        The new model matrix.
+    rows : np.array(1d) or int
+        The changed rows of the model matrix.
+    Xrows : np.array(2d) or np.array(1d)
+        The original values of these rows.
+
+    Returns
+    -------
+    Zi : np.array(1d) or None
+        The new grouping matrix (non-ascending)
+    M : np.array(3d)
+        The updated information matrices.
+    updates : list(tuple(np.array(3d), np.array(3d), np.array(3d)))
+        The low-rank updates of Vinv.
+    """
+    # Update M for the change in the model matrix
+    rows = np.atleast_1d(rows)
+    E = X[rows] - Xrows.reshape(len(rows), -1)
+    G = E.T @ (Vinv[:, rows] @ X - 0.5 * Vinv[:, rows[:, np.newaxis], rows] @ E)
+    M = M + G + np.swapaxes(G, -2, -1)
+
+    # Loop over all updates
+    updates = []
+    if len(b) > 0:
+        Zi = np.copy(Zi)
+    for x in b:
+        # Expand update
+        row_start, row_end, group_from, group_to = x
+
+        # Update M and Zi
+        A, K, B = group_update_lowrank(Vinv, updates, Zi, x, ratios)
+        M = M - (X.T @ A) @ (K @ (np.swapaxes(B, -2, -1) @ X))
+        updates.append((A, K, B))
+        Zi[row_start:row_end] = group_to
+
+    return Zi, M, updates
+
+def apply_vinv_updates(Vinv, updates):
+    """
+    Applies the low-rank updates of
+    :py:func:`ce_update_M <pyoptex.doe.cost_optimal.codex.formulas.ce_update_M>`
+    to Vinv.
+
+    Parameters
+    ----------
+    Vinv : np.array(3d)
+        The current inverses of the observation covariance matrix.
+    updates : list(tuple(np.array(3d), np.array(3d), np.array(3d)))
+        The low-rank updates of Vinv.
+
+    Returns
+    -------
+    Vinv : np.array(3d)
+        The updated inverses observation covariance matrix.
+    """
+    for A, K, B in updates:
+        Vinv = Vinv - A @ (K @ np.swapaxes(B, -2, -1))
+    return Vinv
+
 def insert_update_vinv(Vinv, Zs, pos, a, b, ratios):
     """
     Computes the update to Vinv based on the insertion of a row
@@ -136,6 +216,50 @@ def remove_update_vinv(Vinv, Zs, pos, b, ratios):
 
     return Zsn, Vinvn
 
+def vinv_drift(Vinv, Zs, ratios, Q):
+    """
+    Estimates the numerical drift of the inverses of the observation
+    covariance matrices after repeated update formulas, as the relative
+    residual :math:`||V V^{-1} Q - Q|| / ||Q||` of the probe vectors Q.
+    V is computed as in 
+    :py:func:`obs_var_from_Zs <pyoptex.utils.design.obs_var_from_Zs>`, 
+    but never formed. This requires O(N^2) operations per probe, instead
+    of the O(N^3) operations of a refactorization.
+
+    Parameters
+    ----------
+    Vinv : np.array(3d)
+        The current inverses of the observation covariance matrix.
+    Zs : list(np.array(1d) or None)
+        The grouping matrices of all factors.
+    ratios : np.array(2d)
+        The variance ratios of the factors in each row.
+    Q : np.array(2d)
+        The probe vectors as columns.
+
+    Returns
+    -------
+    drift : float
+        The largest relative residual over all sets of variance ratios.
+    """
+    # Only the grouped factors
+    Zs = [Zi for Zi in Zs if Zi is not None]
+
+    drift = 0
+    for Vinvi, r in zip(Vinv, ratios):
+        # Compute V @ (Vinv @ Q) - Q
+        P = Vinvi @ Q
+        R = P - Q
+        for j, Zi in enumerate(Zs):
+            G = np.zeros((Zi[-1] + 1, Q.shape[1]))
+            np.add.at(G, Zi, P)
+            R += r[j] * G[Zi]
+
+        # Relative residual
+        drift = max(drift, np.linalg.norm(R) / np.linalg.norm(Q))
+
+    return drift
+
 ###################################
 
 def detect_block_end_from_start(groups, start):
@@ -199,6 +323,50 @@ def group_update_vinv(Vinv, Zi, b, ratios):
 
     return Vinv
 
+@profile
+def group_update_lowrank(Vinv, updates, Zi, b, ratios):
+    """
+    Part of update formulas, see article for information. Computes
+    the update of :py:func:`group_update_vinv <pyoptex.doe.cost_optimal.codex.formulas.group_update_vinv>`
+    as :math:`V^{-1} - A K B^T`, with `Vinv` after the previous `updates`,
+    without forming the new matrix.
+    """
+    # Expand change
+    row_start, row_end, group_from, group_to = b
+
+    # The affected rows
+    S = (Zi == group_from) | (Zi == group_to)
+    S[row_start:row_end] = True
+    S = np.flatnonzero(S)
+    R = (S >= row_start) & (S < row_end)
+
+    # Create V (transposed), restricted to the affected rows
+    V = np.zeros((len(S), 2))
+    V[Zi[S] == group_from, 0] = -1
+    V[Zi[S] == group_to, 0] = 1
+    V[R, 0] = 2*(1 + V[R, 0])
+    V[R, 1] = 1
+
+    # Create U, restricted to the affected rows
+    U = np.zeros((ratios.shape[0], len(S), 2))
+    U[:, R, 0] = ratios[:, np.newaxis]
+    U[:, ~R, 1] = ratios[:, np.newaxis] * V[~R, 0]
+
+    # Multiply by Vinv after the previous updates
+    VU = Vinv[:, :, S] @ U
+    VV = Vinv[:, :, S] @ V
+    for A, K, B in updates:
+        BS = np.swapaxes(B[:, S], -2, -1)
+        VU -= A @ (K @ (BS @ U))
+        VV -= A @ (K @ (BS @ V))
+
+    # Compute the inner matrix
+    P = V.T @ VU[:, S]
+    P[:, [0, 1], [0, 1]] += 1
+    PpDinv = np.linalg.inv(P)
+
+    return VU, PpDinv, VV
+
 @profile
 def add_update_vinv(Vinv, Zs, a, pos, ratios):
     """
@@ -260,7 +428,7 @@ def del_vinv_update(Vinv, pos, ratios):
 # Expanded multiplications with R and S
 # Slower than regular matrix multiplications
 
-@numba.njit
+@numba.njit(cache=True)
 def inv_PpD_numba(P, ratios=1):
     """
     Part of update formulas, see article for information.
@@ -273,7 +441,7 @@ def inv_PpD_numba(P, ratios=1):
     return out
 
 
-@numba.njit
+@numba.njit(cache=True)
 def _group_update_vinv(Vinv, Zi, b, ratios):
     """
     Part of update formulas, see article for information.
@@ -4,12 +4,14 @@ Module for all insert functions of the CODEX algorithm
 
 import numpy as np
 
-from ...._profile import profile
+from ...._profile import profile, count_evaluations
 from ....utils.numba import numba_insert_axis0
 from ....utils.design import force_Zi_asc, obs_var_from_Zs
 from .formulas import (NO_UPDATE, detect_block_end_from_start,
                        insert_update_vinv)
 from .simulation import State
+from ..cost import cost_insert
+from ..cov import no_cov
 from ..utils import obs_var_Zs
 
 
@@ -72,7 +74,34 @@ def groups_insert(Yn, Zs, pos, colstart):
 
     return a, b
 
-def _insert_position(new_run, pos, state, params, new_X=None):
+def _groups_key(Zs, a, b):
+    """
+    Identifies the groups after inserting a run, as computed by
+    :py:func:`groups_insert <pyoptex.doe.cost_optimal.codex.insert.groups_insert>`, 
+    up to the order of the runs. Insertions with the same key result
+    in the same groups, e.g., when the run joins the same group, or forms 
+    a new group without breaking up another group.
+
+    Parameters
+    ----------
+    Zs : list(np.array(1d) or None)
+        The grouping matrices of the old design (before insertion)
+    a : np.array(1d)
+        For each factor, the group that run belongs to
+    b : list(tuple(row_start, row_end, group_from, group_to))
+        A list of additional group changes per factor.
+
+    Returns
+    -------
+    key : tuple
+        The key of the groups after insertion.
+    """
+    return tuple(
+        None if Zi is None else (int(ai) if ai <= Zi[-1] else -1, bi)
+        for Zi, ai, bi in zip(Zs, a, b)
+    )
+
+def _insert_position(new_run, pos, state, params, new_X=None, costs=None, metric=None):
     """
     Inserts a new run at the specified position and returns a new state.
 
@@ -88,6 +117,10 @@ def _insert_position(new_run, pos, state, params, new_X=None):
         The simulation parameters.
     new_X : np.array(1, 1d)
         The model matrix part of that run = x2fx(new_run)
+    costs : None or list(tuple(np.array(1d), float, np.array(1d)))
+        The costs of the new design, if already computed.
+    metric : None or float
+        The metric of the new design, if already computed.
     
     Returns
     -------
@@ -123,18 +156,17 @@ def _insert_position(new_run, pos, state, params, new_X=None):
         )
 
     # Update costs
-    costs = params.fn.cost(Y, params)
-    cost_Y = np.sum(costs, axis=1)
+    if costs is None:
+        costs = cost_insert(params.fn.cost, Y, state.costs, pos, params)
+    cost_Y = np.array([np.sum(c) for c, _, _ in costs])
+    max_cost = np.array([m for _, m, _ in costs])
 
     # Compute the new metric
-    metric = params.fn.metric.call(Y, X, Zs, Vinv, costs)
+    if metric is None:
+        metric = params.fn.metric.call(Y, X, Zs, Vinv, costs)
+        count_evaluations()
 
-    # Collect stats
-    params.stats['insert_loc'][params.stats['it']] = pos
-
-    return State(Y, X, Zs, Vinv, metric, cost_Y, costs)
-
-###################################################
+    return State(Y, X, Zs, Vinv, metric, cost_Y, costs, max_cost)
 
 def insert_last(new_run, state, params):
     """
@@ -154,6 +186,9 @@ def insert_last(new_run, state, params):
     new_state : :py:class:`State <pyoptex.doe.cost_optimal.utils.State>`
         The new state after inserting the run at the last position.
     """
+    # Collect stats
+    params.stats['insert_loc'][params.stats['it']] = len(state.Y)
+
     # Insert in last position
     return _insert_position(new_run, len(state.Y), state, params)
 
@@ -163,6 +198,16 @@ def insert_optimal(new_run, state, params):
     Inserts a new run in the optimal position by simultaneously
     maximizing the metric and minimizing the cost increase.
 
+    The costs of all positions are computed incrementally, see
+    :py:func:`cost_insert <pyoptex.doe.cost_optimal.cost.cost_insert>`.
+    When the metric is
+    :py:attr:`order invariant <pyoptex.doe.cost_optimal.metric.Metric.order_invariant>`
+    and has no covariates, it is only evaluated once for all positions with identical 
+    groups after insertion, see
+    :py:func:`groups_insert <pyoptex.doe.cost_optimal.codex.insert.groups_insert>`. 
+    Without hard-to-change factors, this is a single evaluation. Only the state
+    of the optimal position is created.
+
     Parameters
     ----------
     new_run : np.array(1, 1d)
@@ -181,60 +226,55 @@ def insert_optimal(new_run, state, params):
     new_X = params.fn.Y2X(new_run)
     nprior = len(params.prior)
 
+    # Share the metric between positions with identical groups
+    shared = getattr(params.fn.metric, 'order_invariant', False) \
+                and getattr(params.fn.metric, 'cov', None) is no_cov
+    grouped = any(Zi is not None for Zi in state.Zs)
+    metrics = dict()
+
+    # The relative cost of the current design
+    # pylint: disable=line-too-long
+    mt_state = np.sum(state.cost_Y / state.max_cost * np.array([c.size for c, _, _ in state.costs])) / len(state.Y)
+
     ############################################################
 
     # Find ideal insert position
     best_metric = 0
     exceeds_budget = True
     best_state = state
+    best = None
 
     # Loop over all possible positions
     for k in range(state.Y.shape[0], nprior-1, -1):
         # Insert run
         Yn = numba_insert_axis0(state.Y, k, new_run[0])
-        Xn = numba_insert_axis0(state.X, k, new_X[0])
-
-        # Compute new observation variance
-        if any(Zi is not None for Zi in state.Zs):
-            if params.use_formulas:
-                a, b = groups_insert(Yn, state.Zs, k, params.colstart)
-                Zsn, Vinvn = insert_update_vinv(
-                    state.Vinv, state.Zs, k, a, b, params.ratios
-                )
-                Zsn = tuple(
-                    force_Zi_asc(Zi) if Zi is not None else None 
-                    for Zi in Zsn
-                )
-            else:
-                Zsn = obs_var_Zs(Yn, params.colstart, params.grouped_cols)
-                Vinvn = np.array([
-                    np.linalg.inv(obs_var_from_Zs(Zsn, len(Yn), ratios)) 
-                    for ratios in params.ratios
-                ])
-        else:
-            # Shortcut as there are no hard-to-vary factors
-            Zsn = state.Zs
-            Vinvn = np.broadcast_to(
-                np.eye(len(Yn)), 
-                (state.Vinv.shape[0], len(Yn), len(Yn))
-            )
 
         # Compute cost increase
-        costsn = params.fn.cost(Yn, params)
+        costsn = cost_insert(params.fn.cost, Yn, state.costs, k, params)
         cost_Yn = np.array([np.sum(c) for c, _, _ in costsn])
         max_cost = np.array([m for _, m, _ in costsn])
 
         # Compute metric
-        metricn = params.fn.metric.call(Yn, Xn, Zsn, Vinvn, costsn)
-
-        # Create the new state
-        staten = State(Yn, Xn, Zsn, Vinvn, metricn, cost_Yn, costsn, max_cost)
+        staten = None
+        if shared:
+            if grouped:
+                key = _groups_key(state.Zs, *groups_insert(Yn, state.Zs, k, params.colstart))
+            else:
+                key = None
+            if key not in metrics:
+                metrics[key] = _insert_position(
+                    new_run, k, state, params, new_X, costs=costsn
+                ).metric
+            metricn = metrics[key]
+        else:
+            staten = _insert_position(new_run, k, state, params, new_X, costs=costsn)
+            metricn = staten.metric
 
         # Target
         # pylint: disable=line-too-long
-        mt = np.sum(staten.cost_Y / staten.max_cost * np.array([c.size for c, _, _ in staten.costs])) / len(staten.Y) \
-                - np.sum(state.cost_Y / state.max_cost * np.array([c.size for c, _, _ in state.costs])) / len(state.Y)
-        metric_temp = (staten.metric - state.metric) / (mt / len(state.costs))
+        mt = np.sum(cost_Yn / max_cost * np.array([c.size for c, _, _ in costsn])) / len(Yn) \
+                - mt_state
+        metric_temp = (metricn - state.metric) / (mt / len(state.costs))
 
         # Exceeds budget
         exceeds_budget_temp = np.any(cost_Yn > max_cost)
@@ -244,10 +284,18 @@ def insert_optimal(new_run, state, params):
                 or (exceeds_budget and not exceeds_budget_temp):
             best_metric = metric_temp
             best_state = staten
+            best = (k, costsn, metricn)
             exceeds_budget = exceeds_budget_temp
             params.stats['insert_loc'][params.stats['it']] = k
 
     ############################################################
 
+    # Create the state of the optimal position
+    if best is not None and best_state is None:
+        k, costsn, metricn = best
+        best_state = _insert_position(
+            new_run, k, state, params, new_X, costs=costsn, metric=metricn
+        )
+
     # Insert in position
     return best_state
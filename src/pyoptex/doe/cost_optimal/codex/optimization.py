@@ -4,12 +4,15 @@ Module for all optimizaters of the CODEX algorithm
 
 import numpy as np
 
-from ...._profile import profile
+from ...._profile import profile, count_evaluations
 from ....utils.numba import numba_any_axis1, numba_diff_axis0
 from ....utils.design import force_Zi_asc, obs_var_from_Zs
 from ...utils.init import full_factorial
-from .formulas import ce_update_vinv, detect_block_end_from_start
+from .formulas import (
+    ce_update_vinv, ce_update_M, apply_vinv_updates, detect_block_end_from_start
+)
 from .simulation import State
+from ..cost import cost_update
 from ..utils import obs_var_Zs
 
 
@@ -103,6 +106,32 @@ def adapt_groups(groups, Y, colstart, row_start, row_end):
         for i in range(colstart.size - 1)
     ]
 
+def information_state(state, params):
+    """
+    Adds the information matrices :math:`M = X^T V^{-1} X` to the
+    state if the metric can be computed from them, see
+    :py:func:`call_information <pyoptex.doe.cost_optimal.metric.Metric.call_information>`.
+    The optimizers then evaluate the changes to the design as
+    low-rank updates of M, instead of updating Vinv.
+
+    Parameters
+    ----------
+    state : :py:class:`State <pyoptex.doe.cost_optimal.utils.State>`
+        The state.
+    params : :py:class:`Parameters <pyoptex.doe.cost_optimal.utils.Parameters>`
+        The simulation parameters.
+
+    Returns
+    -------
+    state : :py:class:`State <pyoptex.doe.cost_optimal.utils.State>`
+        The state with M, or without if not supported.
+    """
+    if params.use_formulas:
+        M = state.M if state.M is not None else state.X.T @ state.Vinv @ state.X
+        if params.fn.metric.call_information(M) is not None:
+            return state._replace(M=M)
+    return state._replace(M=None)
+
 class Optimizer:
     """
     Applies the optimizer on the design every
@@ -196,6 +225,16 @@ def ce_optimizer(state, params):
     """
     nprior = len(params.prior)
 
+    # Use the information matrices if possible
+    state = information_state(state, params)
+
+    # Index the feasibility of each run
+    feasibility = params.fn.feasibility
+    if feasibility is not None:
+        idx = feasibility.index(state.Y)
+    else:
+        idx = np.full(len(state.Y), -1, dtype=np.int64)
+
     # Loop over all coordinates
     for row in range(state.Y.shape[0] - 1, nprior-1, -1):
         for col in range(params.colstart.size - 1):
@@ -206,10 +245,15 @@ def ce_optimizer(state, params):
             # Store original coordinate
             co = Ycoord
 
+            # Lookup the feasible coordinates
+            lookup = idx[row] >= 0
+            if lookup:
+                feasible = feasibility.feasible(idx[row:row+1], col)[0]
+
             # Loop over possible coordinates
-            for coord in params.coords[col]:
-                # Skip original coordinate
-                if np.any(co != coord):
+            for c, coord in enumerate(params.coords[col]):
+                # Skip original and infeasible coordinates
+                if np.any(co != coord) and (not lookup or feasible[c]):
                     # Initialize accept
                     accept = False
 
@@ -217,11 +261,11 @@ def ce_optimizer(state, params):
                     state.Y[row, params.colstart[col]:params.colstart[col+1]] = coord
 
                     # Check the constraints
-                    if not params.fn.constraints(state.Y[row:row+1])[0]:
+                    if lookup or not params.fn.constraints(state.Y[row:row+1])[0]:
                         state.X[row] = params.fn.Y2X(state.Y[row:row+1])
 
                         # Compute costs
-                        new_costs = params.fn.cost(state.Y, params)
+                        new_costs = cost_update(params.fn.cost, state.Y, state.costs, row, row+1, params)
                         new_cost = np.array([np.sum(c) for c, _, _ in new_costs])
                         max_cost = np.array([m for _, m, _ in new_costs])
 
@@ -233,34 +277,50 @@ def ce_optimizer(state, params):
                                 state.Y[:, params.colstart[col]:params.colstart[col+1]], 
                                 row, row+1
                             )
-                            if len(b) == 0:
-                                Zsn = state.Zs
-                                Vinvn = state.Vinv
+                            if state.M is not None:
+                                # Low-rank update of the information matrices
+                                Zin, Mn, updates = ce_update_M(
+                                    state.M, state.Vinv, state.Zs[col], b, 
+                                    params.ratios[:, col], state.X, row, Xrow
+                                )
+                                Zsn = state.Zs if len(b) == 0 else tuple([
+                                    Zi if i != col else force_Zi_asc(Zin) 
+                                    for i, Zi in enumerate(state.Zs)
+                                ])
+
+                                # Check metric
+                                new_metric = params.fn.metric.call_information(Mn)
+                                count_evaluations()
                             else:
-                                if params.use_formulas:
-                                    Zin, Vinvn = ce_update_vinv(
-                                        np.copy(state.Vinv), 
-                                        np.copy(state.Zs[col]), 
-                                        b, params.ratios[:, col]
-                                    )
-                                    Zsn = tuple([
-                                        Zi if i != col else force_Zi_asc(Zin) 
-                                        for i, Zi in enumerate(state.Zs)
-                                    ])
+                                if len(b) == 0:
+                                    Zsn = state.Zs
+                                    Vinvn = state.Vinv
                                 else:
-                                    Zsn = obs_var_Zs(
-                                        state.Y, params.colstart, 
-                                        params.grouped_cols
-                                    )
-                                    Vinvn = np.array([
-                                        np.linalg.inv(obs_var_from_Zs(Zsn, len(state.Y), ratios)) 
-                                        for ratios in params.ratios
-                                    ])
-
-                            # Check metric
-                            new_metric = params.fn.metric.call(
-                                state.Y, state.X, Zsn, Vinvn, new_costs
-                            )
+                                    if params.use_formulas:
+                                        Zin, Vinvn = ce_update_vinv(
+                                            np.copy(state.Vinv), 
+                                            np.copy(state.Zs[col]), 
+                                            b, params.ratios[:, col]
+                                        )
+                                        Zsn = tuple([
+                                            Zi if i != col else force_Zi_asc(Zin) 
+                                            for i, Zi in enumerate(state.Zs)
+                                        ])
+                                    else:
+                                        Zsn = obs_var_Zs(
+                                            state.Y, params.colstart, 
+                                            params.grouped_cols
+                                        )
+                                        Vinvn = np.array([
+                                            np.linalg.inv(obs_var_from_Zs(Zsn, len(state.Y), ratios)) 
+                                            for ratios in params.ratios
+                                        ])
+
+                                # Check metric
+                                new_metric = params.fn.metric.call(
+                                    state.Y, state.X, Zsn, Vinvn, new_costs
+                                )
+                                count_evaluations()
 
                             # Compute accept
                             accept = new_metric > state.metric
@@ -270,12 +330,21 @@ def ce_optimizer(state, params):
                         # Store metric and design
                         Ycoord = coord
                         Xrow = np.copy(state.X[row])
+                        if feasibility is not None:
+                            idx[row:row+1] = feasibility.index(state.Y[row:row+1])
 
                         # Update the state
-                        state = State(
-                            state.Y, state.X, Zsn, Vinvn, new_metric, 
-                            new_cost, new_costs, max_cost
-                        )
+                        if state.M is not None:
+                            Vinvn = apply_vinv_updates(state.Vinv, updates)
+                            state = State(
+                                state.Y, state.X, Zsn, Vinvn, new_metric, 
+                                new_cost, new_costs, max_cost, Mn
+                            )
+                        else:
+                            state = State(
+                                state.Y, state.X, Zsn, Vinvn, new_metric, 
+                                new_cost, new_costs, max_cost
+                            )
 
                     else:
                         # Reset values
@@ -338,6 +407,16 @@ def ce_struct_optimizer(state, params):
     """
     nprior = len(params.prior)
 
+    # Use the information matrices if possible
+    state = information_state(state, params)
+
+    # Index the feasibility of each run
+    feasibility = params.fn.feasibility
+    if feasibility is not None:
+        idx = feasibility.index(state.Y)
+    else:
+        idx = np.full(len(state.Y), -1, dtype=np.int64)
+
     # Loop over all coordinates
     for col in range(params.colstart.size - 1):
         # Detect blocks
@@ -363,11 +442,16 @@ def ce_struct_optimizer(state, params):
             # Store original coordinate
             co = Ycoord
 
+            # Lookup the feasible coordinates
+            lookup = np.all(idx[rows] >= 0)
+            if lookup:
+                feasible = np.all(feasibility.feasible(idx[rows], col), axis=0)
+
             # Loop over possible coordinates
-            for coord in params.coords[col]:
+            for c, coord in enumerate(params.coords[col]):
 
-                # Short-circuit original coordinate
-                if np.any(co != coord):
+                # Short-circuit original and infeasible coordinates
+                if np.any(co != coord) and (not lookup or feasible[c]):
 
                     # Initialize accept
                     accept = False
@@ -376,11 +460,13 @@ def ce_struct_optimizer(state, params):
                     state.Y[rows, params.colstart[col]:params.colstart[col+1]] = coord
 
                     # Check constraints
-                    if not np.any(params.fn.constraints(state.Y[rows])):
+                    if lookup or not np.any(params.fn.constraints(state.Y[rows])):
                         state.X[rows] = params.fn.Y2X(state.Y[rows])
 
                         # Compute costs
-                        new_costs = params.fn.cost(state.Y, params)
+                        new_costs = cost_update(
+                            params.fn.cost, state.Y, state.costs, rows[0], rows[-1]+1, params
+                        )
                         new_cost = np.array([np.sum(c) for c, _, _ in new_costs])
                         max_cost = np.array([m for _, m, _ in new_costs])
                         
@@ -391,34 +477,50 @@ def ce_struct_optimizer(state, params):
                                 state.Y[:, params.colstart[col]:params.colstart[col+1]], 
                                 rows[0], rows[-1]+1
                             )
-                            if len(b) == 0:
-                                Zsn = state.Zs
-                                Vinvn = state.Vinv
+                            if state.M is not None:
+                                # Low-rank update of the information matrices
+                                Zin, Mn, updates = ce_update_M(
+                                    state.M, state.Vinv, state.Zs[col], b, 
+                                    params.ratios[:, col], state.X, rows, Xrows
+                                )
+                                Zsn = state.Zs if len(b) == 0 else tuple([
+                                    Zi if i != col else force_Zi_asc(Zin) 
+                                    for i, Zi in enumerate(state.Zs)
+                                ])
+
+                                # Check metric
+                                new_metric = params.fn.metric.call_information(Mn)
+                                count_evaluations()
                             else:
-                                if params.use_formulas:
-                                    Zin, Vinvn = ce_update_vinv(
-                                        np.copy(state.Vinv), 
-                                        np.copy(state.Zs[col]), 
-                                        b, params.ratios[:, col]
-                                    )
-                                    Zsn = tuple([
-                                        Zi if i != col else force_Zi_asc(Zin) 
-                                        for i, Zi in enumerate(state.Zs)
-                                    ])
+                                if len(b) == 0:
+                                    Zsn = state.Zs
+                                    Vinvn = state.Vinv
                                 else:
-                                    Zsn = obs_var_Zs(
-                                        state.Y, params.colstart, 
-                                        params.grouped_cols
-                                    )
-                                    Vinvn = np.array([
-                                        np.linalg.inv(obs_var_from_Zs(Zsn, len(state.Y), ratios)) 
-                                        for ratios in params.ratios
-                                    ])
-
-                            # Compute new metric
-                            new_metric = params.fn.metric.call(
-                                state.Y, state.X, Zsn, Vinvn, new_costs
-                            )
+                                    if params.use_formulas:
+                                        Zin, Vinvn = ce_update_vinv(
+                                            np.copy(state.Vinv), 
+                                            np.copy(state.Zs[col]), 
+                                            b, params.ratios[:, col]
+                                        )
+                                        Zsn = tuple([
+                                            Zi if i != col else force_Zi_asc(Zin) 
+                                            for i, Zi in enumerate(state.Zs)
+                                        ])
+                                    else:
+                                        Zsn = obs_var_Zs(
+                                            state.Y, params.colstart, 
+                                            params.grouped_cols
+                                        )
+                                        Vinvn = np.array([
+                                            np.linalg.inv(obs_var_from_Zs(Zsn, len(state.Y), ratios)) 
+                                            for ratios in params.ratios
+                                        ])
+
+                                # Compute new metric
+                                new_metric = params.fn.metric.call(
+                                    state.Y, state.X, Zsn, Vinvn, new_costs
+                                )
+                                count_evaluations()
 
                             # Compute accept
                             accept = new_metric > state.metric
@@ -428,12 +530,21 @@ def ce_struct_optimizer(state, params):
                         # Store metric and design
                         Ycoord = coord
                         Xrows = np.copy(state.X[rows])
+                        if feasibility is not None:
+                            idx[rows] = feasibility.index(state.Y[rows])
 
                         # Update the state
-                        state = State(
-                            state.Y, state.X, Zsn, Vinvn, new_metric, 
-                            new_cost, new_costs, max_cost
-                        )
+                        if state.M is not None:
+                            Vinvn = apply_vinv_updates(state.Vinv, updates)
+                            state = State(
+                                state.Y, state.X, Zsn, Vinvn, new_metric, 
+                                new_cost, new_costs, max_cost, Mn
+                            )
+                        else:
+                            state = State(
+                                state.Y, state.X, Zsn, Vinvn, new_metric, 
+                                new_cost, new_costs, max_cost
+                            )
                     else:
                         # Reset values
                         state.Y[rows, params.colstart[col]:params.colstart[col+1]] = Ycoord
@@ -520,7 +631,7 @@ def pe_optimizer(state, params):
                     state.X[row] = params.fn.Y2X(state.Y[row:row+1])
 
                     # Compute costs
-                    new_costs = params.fn.cost(state.Y, params)
+                    new_costs = cost_update(params.fn.cost, state.Y, state.costs, row, row+1, params)
                     new_cost = np.array([np.sum(c) for c, _, _ in new_costs])
                     max_cost = np.array([m for _, m, _ in new_costs])
 
@@ -562,6 +673,7 @@ def pe_optimizer(state, params):
                         new_metric = params.fn.metric.call(
                             state.Y, state.X, Zsn, Vinvn, new_costs
                         )
+                        count_evaluations()
 
                         # Compute accept
                         accept = new_metric > state.metric
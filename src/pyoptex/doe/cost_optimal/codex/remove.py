@@ -4,10 +4,11 @@ Module for all metrics of the CODEX algorithm
 
 import numpy as np
 
-from ...._profile import profile
+from ...._profile import profile, count_evaluations
 from ....utils.design import force_Zi_asc, obs_var_from_Zs
 from .formulas import detect_block_end_from_start, remove_update_vinv
 from .simulation import State
+from ..cost import cost_remove
 from ..utils import obs_var_Zs
 
 
@@ -54,6 +55,70 @@ def groups_remove(Yn, Zs, pos, colstart):
 
 ###################################################
 
+def _remove_position(pos, state, params, costs=None, metric=None):
+    """
+    Removes the run at the specified position and returns a new state.
+
+    Parameters
+    ----------
+    pos : int
+        The position of the run to remove.
+    state : :py:class:`State <pyoptex.doe.cost_optimal.utils.State>`
+        The state from which to start.
+    params : :py:class:`Parameters <pyoptex.doe.cost_optimal.utils.Parameters>`
+        The simulation parameters.
+    costs : None or list(tuple(np.array(1d), float, np.array(1d)))
+        The costs of the new design, if already computed.
+    metric : None or float
+        The metric of the new design, if already computed.
+
+    Returns
+    -------
+    new_state : :py:class:`State <pyoptex.doe.cost_optimal.utils.State>`
+        The new state after removing the run at that position.
+    """
+    # Define new design
+    Y = np.delete(state.Y, pos, axis=0)
+    X = np.delete(state.X, pos, axis=0)
+
+    # Compute Zs and Vinv
+    if any(Zi is not None for Zi in state.Zs):
+        if params.use_formulas:
+            b = groups_remove(Y, state.Zs, pos, params.colstart)
+            Zs, Vinv = remove_update_vinv(
+                state.Vinv, state.Zs, pos, b, params.ratios
+            )
+            Zs = tuple(
+                force_Zi_asc(Zi) if Zi is not None else None 
+                for Zi in Zs
+            )
+        else:
+            Zs = obs_var_Zs(Y, params.colstart, params.grouped_cols)
+            Vinv = np.array([
+                np.linalg.inv(obs_var_from_Zs(Zs, len(Y), ratios)) 
+                for ratios in params.ratios
+            ])
+    else:
+        # Shortcut as there are no hard-to-vary factors
+        Zs = state.Zs
+        Vinv = np.broadcast_to(
+            np.eye(len(Y)), 
+            (state.Vinv.shape[0], len(Y), len(Y))
+        )
+
+    # Compute cost reduction
+    if costs is None:
+        costs = cost_remove(params.fn.cost, Y, state.costs, pos, params)
+    cost_Y = np.array([np.sum(c) for c, _, _ in costs])
+    max_cost = np.array([m for _, m, _ in costs])
+
+    # Compute new metric
+    if metric is None:
+        metric = params.fn.metric.call(Y, X, Zs, Vinv, costs)
+        count_evaluations()
+
+    return State(Y, X, Zs, Vinv, metric, cost_Y, costs, max_cost)
+
 @profile
 def remove_optimal_onebyone(state, params, prevent_insert=False):
     """
@@ -61,6 +126,13 @@ def remove_optimal_onebyone(state, params, prevent_insert=False):
     are selected and removed one-by-one for minimal metric loss and 
     maximal cost reduction.
 
+    All candidates are scored at once by 
+    :py:func:`call_remove <pyoptex.doe.cost_optimal.metric.Metric.call_remove>`
+    and the incremental costs. Only the candidates which merge two groups,
+    or all candidates if the metric does not support it, are 
+    evaluated on the new design. The new state is only created 
+    for the removed run.
+
     Parameters
     ----------
     state : :py:class:`State <pyoptex.doe.cost_optimal.utils.State>`
@@ -76,6 +148,7 @@ def remove_optimal_onebyone(state, params, prevent_insert=False):
         The new state after inserting the run.
     """
     nprior = len(params.prior)
+    grouped = any(Zi is not None for Zi in state.Zs)
 
     # Temporary variables
     keep = np.ones(len(state.Y), dtype=np.bool_)
@@ -89,74 +162,66 @@ def remove_optimal_onebyone(state, params, prevent_insert=False):
         # Loop initialization
         best_metric = np.inf
         best_state = state
+        best_costs = None
         best_k = -1
 
         # Compute bottleneck indices
         idx = np.unique(np.concatenate([idx for _, _, idx in state.costs]))
         idx = idx[idx >= nprior]
 
+        # Score all runs by downdates
+        metrics = params.fn.metric.call_remove(
+            state.Y, state.X, state.Zs, state.Vinv, state.costs, idx
+        )
+        if metrics is not None:
+            count_evaluations()
+
+        # Relative cost of the current design
+        # pylint: disable=line-too-long
+        mt_state = np.sum(state.cost_Y / state.max_cost * np.array([c.size for c, _, _ in state.costs])) / len(state.Y)
+
         # Loop over all available runs
-        for k in idx:
+        for j, k in enumerate(idx):
             # Set keep to false
             keep[k] = False
 
             # Define new design
             Yn = state.Y[keep[:len(state.Y)]]
-            Xn = state.X[keep[:len(state.Y)]]
-
-            # Compute Zsn and Vinvn
-            if any(Zi is not None for Zi in state.Zs):
-                if params.use_formulas:
-                    b = groups_remove(Yn, state.Zs, k, params.colstart)
-                    Zsn, Vinvn = remove_update_vinv(
-                        state.Vinv, state.Zs, k, b, params.ratios
-                    )
-                    Zsn = tuple(
-                        force_Zi_asc(Zi) if Zi is not None else None 
-                        for Zi in Zsn
-                    )
-                else:
-                    Zsn = obs_var_Zs(Yn, params.colstart, params.grouped_cols)
-                    Vinvn = np.array([
-                        np.linalg.inv(obs_var_from_Zs(Zsn, len(Yn), ratios)) 
-                        for ratios in params.ratios
-                    ])
-            else:
-                # Shortcut as there are no hard-to-vary factors
-                Zsn = state.Zs
-                Vinvn = np.broadcast_to(
-                    np.eye(len(Yn)), 
-                    (state.Vinv.shape[0], len(Yn), len(Yn))
-                )
 
             # Compute cost reduction
-            costsn = params.fn.cost(Yn, params)
+            costsn = cost_remove(params.fn.cost, Yn, state.costs, k, params)
             cost_Yn = np.array([np.sum(c) for c, _, _ in costsn])
             max_cost = np.array([m for _, m, _ in costsn])
 
-            # Compute new metric
-            metricn = params.fn.metric.call(Yn, Xn, Zsn, Vinvn, costsn)
-
-            # Create new state
-            staten = State(Yn, Xn, Zsn, Vinvn, metricn, cost_Yn, costsn, max_cost)
+            # Compute new metric, fully if groups are merged
+            if metrics is not None and not (grouped and any(
+                len(bi) > 0 for bi in groups_remove(Yn, state.Zs, k, params.colstart)
+            )):
+                staten = None
+                metricn = metrics[j]
+            else:
+                staten = _remove_position(k, state, params, costs=costsn)
+                metricn = staten.metric
                 
             # Compute metric loss per cost
             # pylint: disable=line-too-long
-            mt = np.sum(state.cost_Y / state.max_cost * np.array([c.size for c, _, _ in state.costs])) / len(state.Y) \
-                - np.sum(staten.cost_Y / staten.max_cost * np.array([c.size for c, _, _ in staten.costs])) / len(staten.Y)
-            metric_temp = (state.metric - staten.metric) / (mt / len(state.costs))
+            mt = mt_state - np.sum(cost_Yn / max_cost * np.array([c.size for c, _, _ in costsn])) / len(Yn)
+            metric_temp = (state.metric - metricn) / (mt / len(state.costs))
 
             # Minimize
             if (metric_temp < best_metric or np.isinf(best_metric)) \
                     and (k != insert_loc or not prevent_insert or insert_loc < 0):
                 best_metric = metric_temp
                 best_state = staten
+                best_costs = costsn
                 best_k = k
             
             # Set keep to true
             keep[k] = True
 
-        # Drop the run
+        # Drop the run (with the exact metric of the new design)
+        if best_k >= 0 and best_state is None:
+            best_state = _remove_position(best_k, state, params, costs=best_costs)
         state = best_state
         if best_k == insert_loc:
             params.stats['removed_insert'][params.stats['it']] = True
@@ -2,17 +2,21 @@
 Module for simulation function of the CODEX algorithm
 """
 
+import time
+
 import numpy as np
-from tqdm import tqdm
+from tqdm import tqdm as tqdm_
 
-from ...._profile import profile
+from ...._profile import profile, count_evaluations
 from ....utils.design import obs_var_from_Zs
 from ..utils import State, obs_var_Zs
 from ..validation import validate_state
+from .formulas import vinv_drift
 
 
 @profile
-def simulate(params, nsims=100, validate=False):
+def simulate(params, nsims=100, validate=False, tqdm=True, deadline=None,
+             vinv_tol=1e-8, vinv_refresh=100):
     """
     Performs the simulated annealing algorithm (SA). 
     This is the main loop calling all of the operators.
@@ -25,6 +29,20 @@ def simulate(params, nsims=100, validate=False):
         The number of simulation iterations, accepted or rejected.
     validate : bool
         Whether to validate intermediate steps. Mostly used for debugging purposes.
+    tqdm : bool
+        Whether to use tqdm to track the progress.
+    deadline : None or float
+        The time, as a timestamp of `time.time()`, at which to stop the
+        simulations. The final optimization of the best state is 
+        performed at least once.
+    vinv_tol : float
+        The tolerance on the numerical drift of the update formulas, estimated
+        by :py:func:`vinv_drift <pyoptex.doe.cost_optimal.codex.formulas.vinv_drift>`
+        after every accepted iteration. Above the tolerance, the inverses of the 
+        observation covariance matrices and the metric are recomputed from scratch.
+    vinv_refresh : int
+        The number of accepted iterations after which Vinv is recomputed
+        regardless of the drift.
 
     Returns
     -------
@@ -34,10 +52,13 @@ def simulate(params, nsims=100, validate=False):
     """
     # Initialize stats
     params.stats['it'] = 0
+    params.stats['sims'] = 0
     params.stats['rejections'] = 0
     params.stats['insert_loc'] = -1 * np.ones(nsims, dtype=np.int64)
     params.stats['removed_insert'] = np.zeros(nsims, dtype=np.bool_)
     params.stats['metrics'] = np.zeros(nsims, dtype=np.float64)
+    params.stats['vinv_drift'] = np.full(nsims, np.nan, dtype=np.float64)
+    params.stats['vinv_refresh'] = np.zeros(nsims, dtype=np.bool_)
     
     # Initialize functions
     params.fn.temp.reset()
@@ -60,6 +81,7 @@ def simulate(params, nsims=100, validate=False):
     cost_Y = np.array([np.sum(c) for c, _, _ in costs])
     max_cost = np.array([m for _, m, _ in costs])
     metric = params.fn.metric.call(Y, X, Zs, Vinv, costs)
+    count_evaluations()
     state = State(Y, X, Zs, Vinv, metric, cost_Y, costs, max_cost)
     validate and validate_state(state, params)
 
@@ -74,9 +96,17 @@ def simulate(params, nsims=100, validate=False):
     )
     validate and validate_state(best_state, params)
 
+    # Probes for the drift of Vinv (independent of the global random state)
+    probes = np.random.default_rng(0)
+    accepts = 0
+
     #######################################################################
 
-    for i in tqdm(range(nsims)):
+    for i in tqdm_(range(nsims), disable=(not tqdm)):
+        # Stop at the deadline
+        if deadline is not None and time.time() >= deadline:
+            break
+
         # Set iteration
         params.stats['it'] = i
 
@@ -115,18 +145,30 @@ def simulate(params, nsims=100, validate=False):
             params.fn.temp.accepted()
             params.fn.restart.accepted()
 
-            # Fix numerical issues with inverse update formulas
-            Vinv = np.array([
-                np.linalg.inv(obs_var_from_Zs(state.Zs, len(state.Y), ratios)) 
-                for ratios in params.ratios
-            ])
-            metric = params.fn.metric.call(
-                state.Y, state.X, state.Zs, Vinv, state.costs
-            )
-            state = State(
-                state.Y, state.X, state.Zs, Vinv, metric, 
-                state.cost_Y, state.costs, state.max_cost
+            # Estimate the numerical drift of the update formulas
+            accepts += 1
+            drift = vinv_drift(
+                state.Vinv, state.Zs, params.ratios, 
+                probes.standard_normal((len(state.Y), 2))
             )
+            params.stats['vinv_drift'][i] = drift
+
+            # Fix numerical issues with inverse update formulas
+            if drift > vinv_tol or accepts >= vinv_refresh:
+                Vinv = np.array([
+                    np.linalg.inv(obs_var_from_Zs(state.Zs, len(state.Y), ratios)) 
+                    for ratios in params.ratios
+                ])
+                metric = params.fn.metric.call(
+                    state.Y, state.X, state.Zs, Vinv, state.costs
+                )
+                count_evaluations()
+                state = State(
+                    state.Y, state.X, state.Zs, Vinv, metric, 
+                    state.cost_Y, state.costs, state.max_cost
+                )
+                params.stats['vinv_refresh'][i] = True
+                accepts = 0
 
             # Set the best state
             cost_transition = (
@@ -143,6 +185,7 @@ def simulate(params, nsims=100, validate=False):
         # Restart policy
         state = params.fn.restart.call(state, best_state)
         validate and validate_state(state, params)
+        params.stats['sims'] = i + 1
 
     # Final optimization
     optimized = True
@@ -151,7 +194,8 @@ def simulate(params, nsims=100, validate=False):
         for opt in params.fn.final_optimizers:
             best_state = opt.call(best_state, params, force=True)
             validate and validate_state(best_state, params)
-        optimized = best_state.metric > best_metric
+        optimized = best_state.metric > best_metric \
+                        and (deadline is None or time.time() < deadline)
 
     # Final validation
     try:
@@ -2,12 +2,17 @@
 Module for the interface to run the CODEX algorithm
 """
 
+import time
+
 import numpy as np
 import pandas as pd
 from numba.typed import List
+from tqdm import tqdm
 
 from ...constraints import no_constraints, mixture_constraints
 from ....utils.design import decode_design, encode_design
+from ...._seed import generate_seeds
+from ...utils.parallel import get_n_jobs, run_tries
 from ..init import init_feasible
 from ..utils import Factor, Parameters
 from .utils import FunctionSet
@@ -124,7 +129,7 @@ def default_fn(
         Y2X, init, cost, metric, constraints.encode(), 
         sample, temperature,
         accept, restart, insert, remove, 
-        optimizers, final_optimizers
+        optimizers, final_optimizers, constraints.feasibility(factors)
     )
 
 def create_parameters(factors, fn, prior=None, use_formulas=True):
@@ -213,7 +218,8 @@ def create_parameters(factors, fn, prior=None, use_formulas=True):
 
     return params
 
-def create_cost_optimal_codex_design(params, nreps=10, nsims=7500, validate=True):
+def create_cost_optimal_codex_design(params, nreps=10, nsims=7500, validate=True,
+                                     n_jobs=1, seed=None, time_budget=None):
     """
     Creates an optimal design for the specified factors, using the CODEX algorithm.
 
@@ -227,6 +233,23 @@ def create_cost_optimal_codex_design(params, nreps=10, nsims=7500, validate=True
         The number of simulations (annealing steps) to run the algorithm for.
     validate : bool
         Whether to validate each state.
+    n_jobs : int
+        The number of processes over which to distribute the repetitions.
+        -1 uses all available CPUs. The numba functions and the metric
+        are initialized only once, before creating the processes.
+    seed : None or int
+        The master seed from which the seed of each repetition is
+        generated. If None, it is drawn from the global numpy random state.
+        Without a `time_budget`, the result is identical for any number
+        of jobs. With a time budget, the number of completed repetitions
+        and simulations depends on the timing.
+    time_budget : None or float
+        The wall-clock time in seconds after which to stop and return the 
+        best design found. A repetition which is still running at that time
+        stops its simulations. No new repetitions are launched once
+        the remaining time is shorter than their mean duration.
+        `nreps` and `nsims` are the maximum number of repetitions and
+        simulations.
 
     Returns
     -------
@@ -237,22 +260,61 @@ def create_cost_optimal_codex_design(params, nreps=10, nsims=7500, validate=True
         The state corresponding to the returned design. 
         Contains the encoded design, model matrix, 
         costs, metric, etc.
+        The work performed is stored in `params.stats`: the number of
+        completed repetitions (`nreps`), the number of simulations of
+        each repetition (`nsims`), and the elapsed time in seconds (`elapsed`).
     """
     assert nreps > 0, 'Must specify at least one repetition for the algorithm'
+    assert time_budget is None or time_budget > 0, 'The time budget must be positive'
+
+    # Compute the deadline
+    start = time.time()
+    deadline = start + time_budget if time_budget is not None else None
+
+    # Initialize the metric once for all repetitions
+    params.fn.metric.init(params)
+
+    # Generate a seed for each repetition
+    seeds = generate_seeds(nreps, seed)
+    serial = (get_n_jobs(n_jobs, nreps) == 1)
+
+    # Single repetition
+    def _simulate(i, deadline):
+        try:
+            state = simulate(params, nsims=nsims, validate=validate, tqdm=serial, deadline=deadline)
+        except ValueError as e:
+            print(e)
+            state = None
+        return state, params.stats['sims']
+
+    # Compile all functions with a single simulation
+    def _warmup():
+        simulate(params, nsims=1, validate=False, tqdm=False)
 
     # Simulation
-    best_state = simulate(params, nsims=nsims, validate=validate)
+    best_state = None
+    sims = []
     try:
-        for i in range(nreps-1):
-            try:
-                state = simulate(params, nsims=nsims, validate=validate)
-                if state.metric > best_state.metric:
+        with tqdm(total=nreps, disable=serial) as pbar:
+            for state, nsim in run_tries(_simulate, seeds, n_jobs, pbar=pbar, 
+                                         warmup=_warmup, deadline=deadline):
+                sims.append(nsim)
+                if state is not None \
+                        and (best_state is None or state.metric > best_state.metric):
                     best_state = state
-            except ValueError as e:
-                print(e)
     except KeyboardInterrupt:
+        if best_state is None:
+            raise
         print('Interrupted: returning current results')
 
+    # Store the performed work
+    params.stats['nreps'] = len(sims)
+    params.stats['nsims'] = np.array(sims, dtype=np.int64)
+    params.stats['elapsed'] = time.time() - start
+
+    if best_state is None:
+        raise ValueError('No repetition resulted in a valid design')
+
     # Decode the design
     Y = decode_design(best_state.Y, params.effect_types, coords=params.coords)
     Y = pd.DataFrame(Y, columns=[str(f.name) for f in params.factors])
@@ -127,11 +127,107 @@ def cost_fn(*args, **kwargs):
             return __cost_fn(f, *args, **kwargs)
         return wrapper
 
+def cost_update(cost, Y, costs, start, end, params):
+    """
+    Computes the costs after altering the runs `start` until `end`
+    of the design. When the cost function provides an 
+    `update(Y, costs, start, end, params)` attribute, such as the transition
+    costs of this module, only the altered runs and their successor are 
+    recomputed. Otherwise, the costs are computed from scratch.
+
+    Parameters
+    ----------
+    cost : func(Y, params)
+        The cost function.
+    Y : np.array(2d)
+        The altered encoded design matrix.
+    costs : list(tuple(np.array(1d), float, np.array(1d)))
+        The costs of the design before altering the runs.
+    start : int
+        The first altered run.
+    end : int
+        The run after the last altered run.
+    params : :py:class:`Parameters <pyoptex.doe.cost_optimal.utils.Parameters>`
+        The simulation parameters.
+
+    Returns
+    -------
+    costs : list(tuple(np.array(1d), float, np.array(1d)))
+        The costs of the altered design.
+    """
+    if hasattr(cost, 'update'):
+        return cost.update(Y, costs, start, end, params)
+    return cost(Y, params)
+
+def cost_insert(cost, Y, costs, pos, params):
+    """
+    Computes the costs after inserting a run at position `pos`
+    in the design. When the cost function provides an 
+    `insert(Y, costs, pos, params)` attribute, only the inserted run
+    and its successor are computed. Otherwise, the costs 
+    are computed from scratch.
+
+    Parameters
+    ----------
+    cost : func(Y, params)
+        The cost function.
+    Y : np.array(2d)
+        The encoded design matrix with the inserted run.
+    costs : list(tuple(np.array(1d), float, np.array(1d)))
+        The costs of the design before inserting the run.
+    pos : int
+        The position of the inserted run.
+    params : :py:class:`Parameters <pyoptex.doe.cost_optimal.utils.Parameters>`
+        The simulation parameters.
+
+    Returns
+    -------
+    costs : list(tuple(np.array(1d), float, np.array(1d)))
+        The costs of the design with the inserted run.
+    """
+    if hasattr(cost, 'insert'):
+        return cost.insert(Y, costs, pos, params)
+    return cost(Y, params)
+
+def cost_remove(cost, Y, costs, pos, params):
+    """
+    Computes the costs after removing the run at position `pos`
+    from the design. When the cost function provides a 
+    `remove(Y, costs, pos, params)` attribute, only the successor of the removed
+    run is recomputed. Otherwise, the costs are computed from scratch.
+
+    Parameters
+    ----------
+    cost : func(Y, params)
+        The cost function.
+    Y : np.array(2d)
+        The encoded design matrix without the removed run.
+    costs : list(tuple(np.array(1d), float, np.array(1d)))
+        The costs of the design before removing the run.
+    pos : int
+        The position of the removed run.
+    params : :py:class:`Parameters <pyoptex.doe.cost_optimal.utils.Parameters>`
+        The simulation parameters.
+
+    Returns
+    -------
+    costs : list(tuple(np.array(1d), float, np.array(1d)))
+        The costs of the design without the removed run.
+    """
+    if hasattr(cost, 'remove'):
+        return cost.remove(Y, costs, pos, params)
+    return cost(Y, params)
+
 ############################################################
 
 def combine_costs(costs):
     """
-    Combine multiple cost functions together.
+    Combine multiple cost functions together. When every cost function
+    supports the incremental updates of 
+    :py:func:`cost_update <pyoptex.doe.cost_optimal.cost.cost_update>`,
+    :py:func:`cost_insert <pyoptex.doe.cost_optimal.cost.cost_insert>` and
+    :py:func:`cost_remove <pyoptex.doe.cost_optimal.cost.cost_remove>`,
+    so does the combined cost function.
 
     Parameters
     ----------
@@ -143,14 +239,287 @@ def combine_costs(costs):
     cost_fn : func(Y, params)
         The combined cost function for the simulation algorithm.
     """
+    costs = list(costs)
+
+    # The number of costs of each cost function
+    sizes = [None] * len(costs)
+
     def _cost(Y, params):
-        return [c for cf in costs for c in cf(Y, params)]
+        out = []
+        for i, cf in enumerate(costs):
+            c = cf(Y, params)
+            sizes[i] = len(c)
+            out.extend(c)
+        return out
+
+    def _split(costs_):
+        # Split the costs per cost function
+        bounds = np.cumsum([0] + sizes)
+        return [costs_[bounds[i]:bounds[i+1]] for i in range(len(costs))]
+
+    def _update(Y, costs_, start, end, params):
+        return [
+            c for cf, cs in zip(costs, _split(costs_)) 
+                for c in cf.update(Y, cs, start, end, params)
+        ]
+
+    def _insert(Y, costs_, pos, params):
+        return [
+            c for cf, cs in zip(costs, _split(costs_)) 
+                for c in cf.insert(Y, cs, pos, params)
+        ]
+
+    def _remove(Y, costs_, pos, params):
+        return [
+            c for cf, cs in zip(costs, _split(costs_)) 
+                for c in cf.remove(Y, cs, pos, params)
+        ]
 
     # pylint: disable=line-too-long
     _cost.__doc__ = 'This is a combined cost function of:\n* ' + '\n* '.join(cf.__name__ for cf in costs)
 
+    # Incremental updates (the costs are always computed from scratch first)
+    if all(hasattr(cf, a) for cf in costs for a in ('update', 'insert', 'remove')):
+        _cost.update, _cost.insert, _cost.remove = _update, _insert, _remove
+
     return _cost
 
+############################################################
+
+@numba.njit(cache=True)
+def _discount_cost(Y, costs, base_cost, cc, start, end):
+    """
+    Computes the transition costs according to 
+    :py:func:`discount_cost <pyoptex.doe.cost_optimal.cost.discount_cost>`
+    of the runs `start` until `end`.
+
+    Parameters
+    ----------
+    Y : np.array(2d)
+        The encoded design matrix.
+    costs : np.array(1d)
+        The transition cost of each encoded column.
+    base_cost : float
+        The base cost of a run.
+    cc : np.array(1d)
+        The cost of each run, updated in-place.
+    start : int
+        The first run to compute.
+    end : int
+        The run after the last run to compute.
+    """
+    # Initialize costs
+    if start == 0 and end > 0:
+        cc[0] = base_cost
+
+    # Loop for each cost
+    for i in range(max(start, 1), end):
+        # Extract runs
+        old_run = Y[i-1]
+        new_run = Y[i]
+
+        # Detect change in runs
+        c = 0
+        for j in range(old_run.size):
+            if old_run[j] != new_run[j] and costs[j] > c:
+                c = costs[j]
+
+        # Set base cost
+        c = max(c, base_cost)
+
+        # Set the cost
+        cc[i] = c
+
+@numba.njit(cache=True)
+def _additive_cost(Y, colstart, costs, base_cost, cc, start, end):
+    """
+    Computes the transition costs according to 
+    :py:func:`additive_cost <pyoptex.doe.cost_optimal.cost.additive_cost>`
+    of the runs `start` until `end`.
+
+    Parameters
+    ----------
+    Y : np.array(2d)
+        The encoded design matrix.
+    colstart : np.array(1d)
+        The start column of each factor in the encoded design matrix.
+    costs : np.array(1d)
+        The transition cost of each factor.
+    base_cost : float
+        The base cost of a run.
+    cc : np.array(1d)
+        The cost of each run, updated in-place.
+    start : int
+        The first run to compute.
+    end : int
+        The run after the last run to compute.
+    """
+    # Initialize the costs
+    if start == 0 and end > 0:
+        cc[0] = base_cost
+
+    for i in range(max(start, 1), end):
+        # Base cost of a run
+        tc = base_cost
+
+        # Define the old / new run for transition
+        old_run = Y[i-1]
+        new_run = Y[i]
+
+        # Additive costs
+        for j in range(colstart.size-1):
+            if np.any(old_run[colstart[j]:colstart[j+1]] != new_run[colstart[j]:colstart[j+1]]):
+                tc += costs[j]
+
+        cc[i] = tc
+
+@numba.njit(cache=True)
+def _scaled_cost(Y, colstart, is_continuous, base_costs, scale_costs, execution_cost, additive,
+                 cc, start, end):
+    """
+    Computes the transition costs according to 
+    :py:func:`scaled_parallel_worker_cost <pyoptex.doe.cost_optimal.cost.scaled_parallel_worker_cost>`
+    or :py:func:`scaled_single_worker_cost <pyoptex.doe.cost_optimal.cost.scaled_single_worker_cost>`
+    of the runs `start` until `end`.
+
+    Parameters
+    ----------
+    Y : np.array(2d)
+        The encoded design matrix.
+    colstart : np.array(1d)
+        The start column of each factor in the encoded design matrix.
+    is_continuous : np.array(1d)
+        Whether each factor is continuous.
+    base_costs : np.array(2d)
+        The positive and negative base transition cost of each factor.
+    scale_costs : np.array(2d)
+        The positive and negative scaling transition cost of each factor.
+    execution_cost : float
+        The execution cost of a run.
+    additive : bool
+        Whether to sum the transition costs of the factors, or
+        to take the maximum.
+    cc : np.array(1d)
+        The cost of each run, updated in-place.
+    start : int
+        The first run to compute.
+    end : int
+        The run after the last run to compute.
+    """
+    # Initialize the costs
+    if start == 0 and end > 0:
+        cc[0] = execution_cost
+
+    for i in range(max(start, 1), end):
+        # Define the old / new run for transition
+        old_run = Y[i-1]
+        new_run = Y[i]
+
+        # Additive costs
+        cc_ = np.zeros(colstart.size-1)
+        for j in range(colstart.size-1):
+            # Check for a transition
+            if np.any(old_run[colstart[j]:colstart[j+1]] != new_run[colstart[j]:colstart[j+1]]):
+                # Check if continuous or categorical factor
+                if is_continuous[j]:
+                    diff = new_run[colstart[j]] - old_run[colstart[j]]
+                    if diff > 0:
+                        # Positive transition
+                        cc_[j] = base_costs[j][0] + scale_costs[j][0] * diff
+                    else:
+                        # Negative transition
+                        cc_[j] = base_costs[j][1] - scale_costs[j][1] * diff
+                else:
+                    # Categorical base cost
+                    cc_[j] = base_costs[j][0]
+                
+        # Sum the costs, or take the maximum as most-hard-to-change
+        if additive:
+            cc[i] = np.sum(cc_) + execution_cost
+        else:
+            cc[i] = np.max(cc_) + execution_cost
+
+@numba.njit(cache=True)
+def _changes_cost(Y, cols, cc, start, end):
+    """
+    Computes the changes according to 
+    :py:func:`max_changes_cost <pyoptex.doe.cost_optimal.cost.max_changes_cost>`
+    of the runs `start` until `end`.
+
+    Parameters
+    ----------
+    Y : np.array(2d)
+        The encoded design matrix.
+    cols : np.array(1d)
+        The encoded columns of the factor.
+    cc : np.array(1d)
+        The cost of each run, updated in-place.
+    start : int
+        The first run to compute.
+    end : int
+        The run after the last run to compute.
+    """
+    # No change in the first run
+    if start == 0 and end > 0:
+        cc[0] = 0
+
+    for i in range(max(start, 1), end):
+        cc[i] = 0
+        for j in cols:
+            if Y[i, j] != Y[i-1, j]:
+                cc[i] = 1
+                break
+
+def _transition_cost(kernel, max_cost):
+    """
+    Creates a cost function from a kernel computing the cost of a range of runs, 
+    where the cost of each run only depends on the run and its predecessor.
+    The cost function supports the incremental updates of
+    :py:func:`cost_update <pyoptex.doe.cost_optimal.cost.cost_update>`,
+    :py:func:`cost_insert <pyoptex.doe.cost_optimal.cost.cost_insert>` and
+    :py:func:`cost_remove <pyoptex.doe.cost_optimal.cost.cost_remove>`, 
+    which only recompute the runs with a different predecessor.
+
+    Parameters
+    ----------
+    kernel : func(Y, cc, start, end)
+        Computes the cost of the runs `start` until `end` of the
+        encoded design matrix `Y` in `cc`.
+    max_cost : float
+        The budget available for this cost function.
+
+    Returns
+    -------
+    cost_fn : func(Y, params)
+        The cost function.
+    """
+    def _cost(Y):
+        cc = np.empty(len(Y))
+        kernel(Y, cc, 0, len(Y))
+        return [(cc, max_cost, np.arange(len(Y)))]
+
+    def _update(Y, costs, start, end, params):
+        # pylint: disable=unused-argument
+        cc = np.copy(costs[0][0])
+        kernel(Y, cc, start, min(end + 1, len(Y)))
+        return [(cc, max_cost, costs[0][2])]
+
+    def _insert(Y, costs, pos, params):
+        # pylint: disable=unused-argument
+        cc = np.insert(costs[0][0], pos, 0)
+        kernel(Y, cc, pos, min(pos + 2, len(Y)))
+        return [(cc, max_cost, np.arange(len(Y)))]
+
+    def _remove(Y, costs, pos, params):
+        # pylint: disable=unused-argument
+        cc = np.delete(costs[0][0], pos)
+        kernel(Y, cc, pos, min(pos + 1, len(Y)))
+        return [(cc, max_cost, np.arange(len(Y)))]
+
+    fn = cost_fn(_cost, denormalize=False, decoded=False, contains_params=False)
+    fn.update, fn.insert, fn.remove = _update, _insert, _remove
+    return fn
+
 def discount_cost(costs, factors, max_cost, base_cost=1):
     """
     Create a transition cost function according to the formula C = max(c1, c2, ..., base). 
@@ -179,38 +548,14 @@ def discount_cost(costs, factors, max_cost, base_cost=1):
             for c in ([costs[str(f.name)]] 
             if f.is_continuous 
             else [costs[str(f.name)]]*(len(f.levels)-1))
-    ])
+    ], dtype=np.float64)
+    base_cost = float(base_cost)
 
     # Define the transition costs
-    @numba.njit
-    def _cost(Y):
-        """Internal cost function according to 
-        :py:function:`discount_cost <pyoptex.doe.cost_optimal.cost.discount_cost>`"""
-        # Initialize costs
-        cc = np.zeros(len(Y))
-        cc[0] = base_cost
-
-        # Loop for each cost
-        for i in range(1, len(Y)):
-            # Extract runs
-            old_run = Y[i-1]
-            new_run = Y[i]
-
-            # Detect change in runs
-            c = 0
-            for j in range(old_run.size):
-                if old_run[j] != new_run[j] and costs[j] > c:
-                    c = costs[j]
-
-            # Set base cost
-            c = max(c, base_cost)
-
-            # Set the cost
-            cc[i] = c
+    def _kernel(Y, cc, start, end):
+        _discount_cost(Y, costs, base_cost, cc, start, end)
 
-        return [(cc, max_cost, np.arange(len(Y)))]
-
-    return cost_fn(_cost, denormalize=False, decoded=False, contains_params=False)
+    return _transition_cost(_kernel, max_cost)
 
 def parallel_worker_cost(transition_costs, factors, max_cost, execution_cost=1):
     """
@@ -265,34 +610,14 @@ def additive_cost(costs, factors, max_cost, base_cost=1):
     # Compute the column starts
     effect_types = np.array([1 if f.is_continuous else len(f.levels) for f in factors])
     colstart = np.concatenate(([0], np.cumsum(np.where(effect_types == 1, 1, effect_types - 1))))
-    costs = np.array([costs[str(f.name)] for f in factors])
+    costs = np.array([costs[str(f.name)] for f in factors], dtype=np.float64)
+    base_cost = float(base_cost)
 
     # Define the transition costs
-    @numba.njit
-    def _cost(Y):
-        # Initialize the costs
-        cc = np.zeros(len(Y))
-        cc[0] = base_cost
-
-        for i in range(1, len(Y)):
-            # Base cost of a run
-            tc = base_cost
-
-            # Define the old / new run for transition
-            old_run = Y[i-1]
-            new_run = Y[i]
-
-            # Additive costs
-            for j in range(colstart.size-1):
-                if np.any(old_run[colstart[j]:colstart[j+1]] != new_run[colstart[j]:colstart[j+1]]):
-                    tc += costs[j]
-
-            cc[i] = tc
+    def _kernel(Y, cc, start, end):
+        _additive_cost(Y, colstart, costs, base_cost, cc, start, end)
 
-        # Return the costs
-        return [(cc, max_cost, np.arange(len(Y)))]
-
-    return cost_fn(_cost, denormalize=False, decoded=False, contains_params=False)
+    return _transition_cost(_kernel, max_cost)
 
 def single_worker_cost(transition_costs, factors, max_cost, execution_cost=1):
     """
@@ -385,49 +710,21 @@ def scaled_parallel_worker_cost(transition_costs, factors, max_cost, execution_c
     base_costs = np.array([
         [transition_costs[str(f.name)][0], transition_costs[str(f.name)][1]] 
         for f in factors
-    ])
+    ], dtype=np.float64)
     scale_costs = np.array([
         [transition_costs[str(f.name)][2] / 2, transition_costs[str(f.name)][3] / 2]
         for f in factors
-    ])
+    ], dtype=np.float64)
+    execution_cost = float(execution_cost)
 
     # Define the transition costs
-    @numba.njit
-    def _cost(Y):
-        # Initialize the costs
-        cc = np.zeros(len(Y))
-        cc[0] = execution_cost
-
-        for i in range(1, len(Y)):
-            # Define the old / new run for transition
-            old_run = Y[i-1]
-            new_run = Y[i]
-
-            # Additive costs
-            cc_ = np.zeros(colstart.size-1)
-            for j in range(colstart.size-1):
-                # Check for a transition
-                if np.any(old_run[colstart[j]:colstart[j+1]] != new_run[colstart[j]:colstart[j+1]]):
-                    # Check if continuous or categorical factor
-                    if is_continuous[j]:
-                        diff = new_run[colstart[j]] - old_run[colstart[j]]
-                        if diff > 0:
-                            # Positive transition
-                            cc_[j] = base_costs[j][0] + scale_costs[j][0] * diff
-                        else:
-                            # Negative transition
-                            cc_[j] = base_costs[j][1] - scale_costs[j][1] * diff
-                    else:
-                        # Categorical base cost
-                        cc_[j] = base_costs[j][0]
-                    
-            # Take the maximum as most-hard-to-change
-            cc[i] = np.max(cc_) + execution_cost
-
-        # Return the costs
-        return [(cc, max_cost, np.arange(len(Y)))]
+    def _kernel(Y, cc, start, end):
+        _scaled_cost(
+            Y, colstart, is_continuous, base_costs, scale_costs, 
+            execution_cost, False, cc, start, end
+        )
 
-    return cost_fn(_cost, denormalize=False, decoded=False, contains_params=False)
+    return _transition_cost(_kernel, max_cost)
 
 def scaled_single_worker_cost(transition_costs, factors, max_cost, execution_cost=1):
     """
@@ -492,49 +789,21 @@ def scaled_single_worker_cost(transition_costs, factors, max_cost, execution_cos
     base_costs = np.array([
         [transition_costs[str(f.name)][0], transition_costs[str(f.name)][1]] 
         for f in factors
-    ])
+    ], dtype=np.float64)
     scale_costs = np.array([
         [transition_costs[str(f.name)][2] / 2, transition_costs[str(f.name)][3] / 2]
         for f in factors
-    ])
+    ], dtype=np.float64)
+    execution_cost = float(execution_cost)
 
     # Define the transition costs
-    @numba.njit
-    def _cost(Y):
-        # Initialize the costs
-        cc = np.zeros(len(Y))
-        cc[0] = execution_cost
-
-        for i in range(1, len(Y)):
-            # Define the old / new run for transition
-            old_run = Y[i-1]
-            new_run = Y[i]
-
-            # Additive costs
-            cc_ = np.zeros(colstart.size-1)
-            for j in range(colstart.size-1):
-                # Check for a transition
-                if np.any(old_run[colstart[j]:colstart[j+1]] != new_run[colstart[j]:colstart[j+1]]):
-                    # Check if continuous or categorical factor
-                    if is_continuous[j]:
-                        diff = new_run[colstart[j]] - old_run[colstart[j]]
-                        if diff > 0:
-                            # Positive transition
-                            cc_[j] = base_costs[j][0] + scale_costs[j][0] * diff
-                        else:
-                            # Negative transition
-                            cc_[j] = base_costs[j][1] - scale_costs[j][1] * diff
-                    else:
-                        # Categorical base cost
-                        cc_[j] = base_costs[j][0]
-                    
-            # Take the maximum as most-hard-to-change
-            cc[i] = np.sum(cc_) + execution_cost
-
-        # Return the costs
-        return [(cc, max_cost, np.arange(len(Y)))]
+    def _kernel(Y, cc, start, end):
+        _scaled_cost(
+            Y, colstart, is_continuous, base_costs, scale_costs, 
+            execution_cost, True, cc, start, end
+        )
 
-    return cost_fn(_cost, denormalize=False, decoded=False, contains_params=False)
+    return _transition_cost(_kernel, max_cost)
 
 def fixed_runs_cost(max_runs):
     """
@@ -552,10 +821,11 @@ def fixed_runs_cost(max_runs):
     cost_fn : func(Y, params)
         The cost function.
     """
-    def _cost_fn(Y):
-        return [(np.ones(len(Y)), max_runs, np.arange(len(Y)))]
+    def _kernel(Y, cc, start, end):
+        # pylint: disable=unused-argument
+        cc[start:end] = 1
 
-    return cost_fn(_cost_fn, denormalize=False, decoded=False, contains_params=False)
+    return _transition_cost(_kernel, max_runs)
 
 def max_changes_cost(factor, factors, max_changes):
     """
@@ -587,12 +857,10 @@ def max_changes_cost(factor, factors, max_changes):
     # Determine the columns of the factor
     if isinstance(factor, str):
         factor = [str(f.name) for f in factors].index(factor)
-    factor = slice(colstart[factor], colstart[factor+1])
+    cols = np.arange(colstart[factor], colstart[factor+1])
 
     # Create cost function
-    def _cost_fn(Y):
-        changes = np.zeros(len(Y))
-        changes[1:] = np.any(np.diff(Y[:, factor], axis=0), axis=1).astype(int)
-        return [(changes, max_changes, np.arange(len(Y)))]
+    def _kernel(Y, cc, start, end):
+        _changes_cost(Y, cols, cc, start, end)
 
-    return cost_fn(_cost_fn, denormalize=False, decoded=False, contains_params=False)
+    return _transition_cost(_kernel, max_changes)
@@ -4,9 +4,6 @@ Module containing all the evaluation functions, specific to the CODEX algorithm
 
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-from plotly.colors import DEFAULT_PLOTLY_COLORS
-from plotly.subplots import make_subplots
 
 from ...utils.design import encode_design, obs_var_from_Zs
 from ...utils.model import model2encnames
@@ -106,7 +103,7 @@ def fraction_of_design_space(Y, params, N=10000):
     costs = params.fn.cost(Y, params)
 
     # Initialize Iopt
-    iopt = Iopt(n=N, cov=params.fn.metric.cov)
+    iopt = Iopt(n=N, cov=params.fn.metric.cov, exact=False)
     iopt.init(params)
 
     # Compute information matrix
@@ -148,6 +145,9 @@ def plot_fraction_of_design_space(Y, params, N=10000):
     fig : :py:class:`plotly.graph_objects.Figure`
         The plotly figure with the fraction of design space plot.
     """
+    import plotly.graph_objects as go
+    from plotly.colors import DEFAULT_PLOTLY_COLORS
+
     # Compute prediction variances
     pred_var = fraction_of_design_space(Y, params, N=N)
 
@@ -252,6 +252,9 @@ def plot_estimation_variance_matrix(Y, params, model=None):
     fig : :py:class:`plotly.graph_objects.Figure`
         The plotly figure of a heatmap of the parameter estimation covariance matrix.
     """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
     # Compute estimation variance matrix
     Minv = estimation_variance_matrix(Y, params)
 
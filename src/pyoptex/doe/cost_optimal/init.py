@@ -5,7 +5,8 @@ Module for all init functions of the cost optimal designs
 import numpy as np
 from tqdm import tqdm
 
-from ..utils.init import full_factorial, init_single_unconstrained
+from ..utils.init import full_factorial, init_single_unconstrained, init_qmc
+from .cost import cost_insert
 
 
 def greedy_cost_minimization(Y, params):
@@ -30,6 +31,7 @@ def greedy_cost_minimization(Y, params):
     Yn[:nprior] = params.prior
     chosen = np.zeros(len(Y), dtype=np.bool_)
     chosen[:nprior] = True
+    prev_costs = params.fn.cost(Yn[:nprior], params) if nprior > 0 else None
 
     # Iteratively use greedy cost minimization
     for i in range(nprior, len(Y)):
@@ -39,10 +41,13 @@ def greedy_cost_minimization(Y, params):
         # # Initialize all costs
         costs = [None] * non_chosen.size
 
-        # Compute all costs
+        # Compute all costs (appending a run)
         for k in range(non_chosen.size):
             Yn[i] = Y[non_chosen[k]]
-            costs[k] = params.fn.cost(Yn[:i+1], params)
+            if prev_costs is None:
+                costs[k] = params.fn.cost(Yn[:i+1], params)
+            else:
+                costs[k] = cost_insert(params.fn.cost, Yn[:i+1], prev_costs, i, params)
 
         # Compute the total cost of each operation
         costs_Y = np.array([
@@ -54,12 +59,13 @@ def greedy_cost_minimization(Y, params):
         # Chose the index
         Yn[i] = Y[min_cost_idx]
         chosen[min_cost_idx] = True
+        prev_costs = costs[np.argmin(costs_Y)]
 
     return Yn
 
 ################################################
 
-def init(params, n=1, complete=False):
+def init(params, n=1, complete=False, qmc=False):
     """
     Initialize a design with `n` randomly sampled runs. They must
     be within the constraints.
@@ -74,12 +80,27 @@ def init(params, n=1, complete=False):
         False means use the coordinates and prior specified in params, 
         otherwise, no coords or prior are used. 
         Can be used to perform a complete sample of the design space.
+    qmc : bool
+        Whether to sample from scrambled Sobol sequences, see
+        :py:func:`init_qmc <pyoptex.doe.utils.init.init_qmc>`.
+        The number of sampled runs is then rounded up to a multiple of eight.
     
     Returns
     -------
     run : np.array(2d)
         The resulting design.
     """
+    # Quasi-random sampling
+    if qmc:
+        if complete:
+            return init_qmc(params.colstart, None, params.effect_types, params.fn.constraints, n)
+        nprior = len(params.prior)
+        return np.concatenate((
+            params.prior,
+            init_qmc(params.colstart, params.coords, params.effect_types, 
+                     params.fn.constraints, max(n - nprior, 0))
+        ))
+
     # Initialize
     run = np.zeros((n, params.colstart[-1]), dtype=np.float64)
     invalid = np.ones(n, dtype=np.bool_)
@@ -4,11 +4,41 @@ Module for all metrics of the cost optimal designs.
 
 import numpy as np
 
-from ...utils.comp import outer_integral
+from ..utils.moments import exact_moments, sample_moments, moments_key
 from .cov import no_cov
 from .init import init
 
 
+def _remove_downdates(X, Vinv, pos):
+    """
+    Computes the information matrices and the downdates of removing
+    each of the runs in `pos`, without changing the groups of the remaining runs.
+    The information matrix after removing run k is 
+    :math:`M - u_k u_k^T` with :math:`u_k = X^T V^{-1} e_k / \\sqrt{V^{-1}_{kk}}`.
+
+    Parameters
+    ----------
+    X : np.array(2d)
+        The model matrix
+    Vinv : np.array(3d)
+        The inverses of the multiple covariance matrices for each
+        set of a-priori variance ratios.
+    pos : np.array(1d)
+        The indices of the runs to remove.
+
+    Returns
+    -------
+    M : np.array(3d)
+        The information matrices.
+    U : np.array(3d)
+        The downdates, with the runs as last axis.
+    """
+    VX = Vinv @ X
+    M = X.T @ VX
+    U = np.swapaxes(VX[:, pos], -2, -1) / np.sqrt(Vinv[:, pos, pos])[:, np.newaxis]
+    return M, U
+
+
 class Metric:
     """
     The base class for a metric
@@ -18,7 +48,15 @@ class Metric:
     cov : func(Y, X, Zs, Vinv, costs)
         A function computing the covariate parameters
         and potential extra random effects.
+    order_invariant : bool
+        Whether the metric, without covariates, only depends on the 
+        runs and their groups, and not on their order or costs. This allows
+        the insertion of a run to evaluate the metric once for all positions
+        with identical groups, see
+        :py:func:`insert_optimal <pyoptex.doe.cost_optimal.codex.insert.insert_optimal>`.
     """
+    order_invariant = False
+
     def __init__(self, cov=None):
         """
         Creates the metric
@@ -66,6 +104,60 @@ class Metric:
         """
         raise NotImplementedError('Must implement a call function')
 
+    def call_information(self, M):
+        """
+        Computes the metric from the information matrices
+        :math:`M = X^T V^{-1} X` of a design. Used by the
+        optimizers to evaluate low-rank updates of the design, see
+        :py:func:`ce_optimizer <pyoptex.doe.cost_optimal.codex.optimization.ce_optimizer>`.
+
+        Parameters
+        ----------
+        M : np.array(3d)
+            The information matrices for each set of 
+            a-priori variance ratios.
+
+        Returns
+        -------
+        metric : None or float
+            The value of the criterion, or None if not supported.
+            The metric is then computed from the design.
+        """
+        return None
+
+    def call_remove(self, Y, X, Zs, Vinv, costs, pos):
+        """
+        Computes the metric after removing each of the runs in `pos`
+        separately, without changing the groups of the remaining runs.
+        Used by 
+        :py:func:`remove_optimal_onebyone <pyoptex.doe.cost_optimal.codex.remove.remove_optimal_onebyone>`
+        to score all removal candidates at once.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The design matrix
+        X : np.array(2d)
+            The model matrix
+        Zs : list(np.array(1d))
+            The grouping matrices
+        Vinv : np.array(3d)
+            The inverses of the multiple covariance matrices for each
+            set of a-priori variance ratios.
+        costs : list(np.array(1d), float, np.array(1d))
+            The list of different costs.
+        pos : np.array(1d)
+            The indices of the runs to remove.
+
+        Returns
+        -------
+        metric : None or np.array(1d)
+            The value of the criterion after each removal, or None
+            if not supported. The metric is then computed from the
+            new design.
+        """
+        return None
+
 class Dopt(Metric):
     """
     The D-optimality criterion.
@@ -77,6 +169,8 @@ class Dopt(Metric):
         A function computing the covariate parameters
         and potential extra random effects.
     """
+    order_invariant = True
+
     def call(self, Y, X, Zs, Vinv, costs):
         """
         Computes the D-optimality criterion for a given design.
@@ -106,8 +200,93 @@ class Dopt(Metric):
         M = X.T @ Vinv @ X
 
         # Compute geometric mean of determinants
+        return self._call_information(M)
+
+    def _call_information(self, M):
+        """
+        Computes the D-optimality criterion from the information matrices.
+
+        Parameters
+        ----------
+        M : np.array(3d)
+            The information matrices.
+
+        Returns
+        -------
+        metric : float
+            The D-optimality criterion.
+        """
         return np.power(
             np.prod(np.maximum(np.linalg.det(M), 0)), 
+            1/(M.shape[-1] * len(M))
+        )
+
+    def call_information(self, M):
+        """
+        Computes the D-optimality criterion from the information matrices
+        :math:`M = X^T V^{-1} X` of a design without covariates.
+
+        Parameters
+        ----------
+        M : np.array(3d)
+            The information matrices for each set of 
+            a-priori variance ratios.
+
+        Returns
+        -------
+        metric : None or float
+            The D-optimality criterion, or None with covariates.
+        """
+        if self.cov is not no_cov:
+            return None
+        return self._call_information(M)
+
+    def call_remove(self, Y, X, Zs, Vinv, costs, pos):
+        """
+        Computes the D-optimality criterion after removing each of the runs 
+        in `pos` separately, without changing the groups of the remaining runs,
+        using rank-one downdates of the information matrix.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The design matrix
+        X : np.array(2d)
+            The model matrix
+        Zs : list(np.array(1d))
+            The grouping matrices
+        Vinv : np.array(3d)
+            The inverses of the multiple covariance matrices for each
+            set of a-priori variance ratios.
+        costs : list(np.array(1d), float, np.array(1d))
+            The list of different costs.
+        pos : np.array(1d)
+            The indices of the runs to remove.
+
+        Returns
+        -------
+        metric : None or np.array(1d)
+            The D-optimality criterion after each removal, or None
+            with covariates or for a singular design.
+        """
+        # Covariates may depend on the order of the runs
+        if self.cov is not no_cov:
+            return None
+
+        # Compute the downdates
+        M, U = _remove_downdates(X, Vinv, pos)
+
+        # No inverse for singular designs
+        if np.linalg.matrix_rank(M[0]) < M.shape[1]:
+            return None
+
+        # Matrix determinant lemma
+        h = np.sum(U * np.linalg.solve(M, U), axis=1)
+        det = np.linalg.det(M)[:, np.newaxis] * (1 - h)
+
+        # Compute geometric mean of determinants
+        return np.power(
+            np.prod(np.maximum(det, 0), axis=0), 
             1/(X.shape[1] * len(Vinv))
         )
 
@@ -124,6 +303,8 @@ class Aopt(Metric):
     W : np.array(1d)
         A weights matrix for the trace of the inverse of the information matrix.
     """
+    order_invariant = True
+
     def __init__(self, cov=None, W=None):
         """
         Creates the metric
@@ -167,6 +348,23 @@ class Aopt(Metric):
         _, X, _, Vinv = self.cov(Y, X, Zs, Vinv, costs)
         M = X.T @ Vinv @ X
 
+        # Compute the average trace
+        return self._call_information(M)
+
+    def _call_information(self, M):
+        """
+        Computes the A-optimality criterion from the information matrices.
+
+        Parameters
+        ----------
+        M : np.array(3d)
+            The information matrices.
+
+        Returns
+        -------
+        metric : float
+            The negative of the A-optimality criterion.
+        """
         # Check if invertible (more stable than relying on inverse)
         if np.linalg.matrix_rank(M[0]) >= M.shape[1]:
             # Extrace variances
@@ -184,6 +382,83 @@ class Aopt(Metric):
             return -trace
         return -np.inf
 
+    def call_information(self, M):
+        """
+        Computes the A-optimality criterion from the information matrices
+        :math:`M = X^T V^{-1} X` of a design without covariates.
+
+        Parameters
+        ----------
+        M : np.array(3d)
+            The information matrices for each set of 
+            a-priori variance ratios.
+
+        Returns
+        -------
+        metric : None or float
+            The negative of the A-optimality criterion, or None with covariates.
+        """
+        if self.cov is not no_cov:
+            return None
+        return self._call_information(M)
+
+    def call_remove(self, Y, X, Zs, Vinv, costs, pos):
+        """
+        Computes the A-optimality criterion after removing each of the runs 
+        in `pos` separately, without changing the groups of the remaining runs,
+        using rank-one downdates of the information matrix.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The design matrix
+        X : np.array(2d)
+            The model matrix
+        Zs : list(np.array(1d))
+            The grouping matrices
+        Vinv : np.array(3d)
+            The inverses of the multiple covariance matrices for each
+            set of a-priori variance ratios.
+        costs : list(np.array(1d), float, np.array(1d))
+            The list of different costs.
+        pos : np.array(1d)
+            The indices of the runs to remove.
+
+        Returns
+        -------
+        metric : None or np.array(1d)
+            The negative of the A-optimality criterion after each
+            removal, or None with covariates.
+        """
+        # Covariates may depend on the order of the runs
+        if self.cov is not no_cov:
+            return None
+
+        # Compute the downdates
+        M, U = _remove_downdates(X, Vinv, pos)
+
+        # Singular designs remain singular
+        if np.linalg.matrix_rank(M[0]) < M.shape[1]:
+            return np.full(len(pos), -np.inf)
+
+        # Sherman-Morrison update of the variances
+        Minv = np.linalg.inv(M)
+        S = Minv @ U
+        d = 1 - np.sum(U * S, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            diag = np.diagonal(Minv, axis1=-2, axis2=-1)[..., np.newaxis] \
+                    + np.square(S) / d[:, np.newaxis]
+
+        # Weight
+        if self.W is not None:
+            diag *= self.W[:, np.newaxis]
+
+        # Compute average
+        trace = np.mean(np.sum(diag, axis=1), axis=0)
+
+        # Invert for minimization, singular after removal
+        return np.where(d[0] > 1e-10, -trace, -np.inf)
+
 class Iopt(Metric):
     """
     The I-optimality criterion.
@@ -202,15 +477,26 @@ class Iopt(Metric):
         and potential extra random effects.
     moments : np.array(2d)
         The moments matrix.
-    samples : np.array(2d)
-        The covariate expanded samples for the moments matrix.
+    samples : None or np.array(2d)
+        The covariate expanded samples for the moments matrix, or None
+        if the moments matrix is computed exactly.
     n : int
         The number of samples.
     complete : bool
         Whether to initialize the samples between -1 and 1, 
         or from the given coordinates.
+    exact : bool
+        Whether to compute the moments matrix exactly when possible.
+    qmc : bool
+        Whether to sample from scrambled Sobol sequences.
+    tol : None or float
+        The required standard error of the moments matrix.
+    error : np.array(2d)
+        The standard error of each element of the moments matrix.
     """
-    def __init__(self, n=10000, cov=None, complete=True):
+    order_invariant = True
+
+    def __init__(self, n=10000, cov=None, complete=True, exact=True, qmc=True, tol=None):
         """
         Creates the metric
 
@@ -224,12 +510,29 @@ class Iopt(Metric):
         complete : bool
             Whether to use the fixed coordinates or initialize
             the moments matrix from completely random samples.
+        exact : bool
+            Whether to compute the moments matrix exactly for
+            polynomial models without constraints or covariates, see
+            :py:func:`exact_moments <pyoptex.doe.utils.moments.exact_moments>`.
+            Otherwise, it is estimated from `n` samples.
+        qmc : bool
+            Whether to draw the samples from scrambled Sobol sequences
+            instead of independent random runs, see
+            :py:func:`init_qmc <pyoptex.doe.utils.init.init_qmc>`.
+        tol : None or float
+            The required standard error of the elements of the moments matrix. 
+            If specified, `n` is the maximum number of samples, see
+            :py:func:`sample_moments <pyoptex.doe.utils.moments.sample_moments>`.
         """
         super().__init__(cov)
         self.moments = None
         self.samples = None
+        self.error = None
         self.n = n
         self.complete = complete
+        self.exact = exact
+        self.qmc = qmc
+        self.tol = tol
         self.initialized_ = False
 
     def init(self, params):
@@ -243,18 +546,31 @@ class Iopt(Metric):
             The simulation parameters
         """
         if not self.initialized_:
-            # Create the random samples
-            samples = init(params, self.n, complete=self.complete)
-            self.samples = params.fn.Y2X(samples)
-
-            # Add random covariates
-            _, self.samples, _, _ = self.cov(
-                samples, self.samples, None, None, None, random=True
-            )
+            # Compute the exact moments matrix (the prior is part of incomplete samples)
+            if self.exact and self.cov is no_cov and (self.complete or len(params.prior) == 0):
+                self.moments = exact_moments(params, complete=self.complete)
+                if self.moments is not None:
+                    self.error = np.zeros_like(self.moments)
+                    self.initialized_ = True
+                    return
+
+            # Create the random samples with random covariates
+            def sample(n):
+                samples = init(params, n, complete=self.complete, qmc=self.qmc)
+                _, X, _, _ = self.cov(
+                    samples, params.fn.Y2X(samples), None, None, None, random=True
+                )
+                return X
 
             # Compute moments matrix and normalization factor
             # Correct up to volume factor (Monte Carlo integration), can be ignored
-            self.moments = outer_integral(self.samples)  
+            key = moments_key(
+                params, self.n, self.tol, self.complete, self.qmc, 
+                params.prior if not self.complete else None
+            ) if self.cov is no_cov else None
+            self.samples, self.moments, self.error = sample_moments(
+                sample, self.n, self.tol, key=key
+            )
 
             # Sets the initialized_ parameter
             self.initialized_ = True
@@ -286,6 +602,23 @@ class Iopt(Metric):
         _, X, _, Vinv = self.cov(Y, X, Zs, Vinv, costs)
         M = X.T @ Vinv @ X
 
+        # Compute the average prediction variance
+        return self._call_information(M)
+
+    def _call_information(self, M):
+        """
+        Computes the I-optimality criterion from the information matrices.
+
+        Parameters
+        ----------
+        M : np.array(3d)
+            The information matrices.
+
+        Returns
+        -------
+        metric : float
+            The negative of the I-optimality criterion.
+        """
         # Check if invertible (more stable than relying on inverse)
         if np.linalg.matrix_rank(M[0]) >= M.shape[1]:
             # Compute average trace (normalized)
@@ -293,7 +626,7 @@ class Iopt(Metric):
                 M, 
                 np.broadcast_to(
                     self.moments, 
-                    (Vinv.shape[0], *self.moments.shape)
+                    (M.shape[0], *self.moments.shape)
                 )
             ), axis1=-2, axis2=-1))
 
@@ -301,6 +634,79 @@ class Iopt(Metric):
             return -trace 
         return -np.inf
 
+    def call_information(self, M):
+        """
+        Computes the I-optimality criterion from the information matrices
+        :math:`M = X^T V^{-1} X` of a design without covariates.
+
+        Parameters
+        ----------
+        M : np.array(3d)
+            The information matrices for each set of 
+            a-priori variance ratios.
+
+        Returns
+        -------
+        metric : None or float
+            The negative of the I-optimality criterion, or None with covariates.
+        """
+        if self.cov is not no_cov:
+            return None
+        return self._call_information(M)
+
+    def call_remove(self, Y, X, Zs, Vinv, costs, pos):
+        """
+        Computes the I-optimality criterion after removing each of the runs 
+        in `pos` separately, without changing the groups of the remaining runs,
+        using rank-one downdates of the information matrix.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The design matrix
+        X : np.array(2d)
+            The model matrix
+        Zs : list(np.array(1d))
+            The grouping matrices
+        Vinv : np.array(3d)
+            The inverses of the multiple covariance matrices for each
+            set of a-priori variance ratios.
+        costs : list(np.array(1d), float, np.array(1d))
+            The list of different costs.
+        pos : np.array(1d)
+            The indices of the runs to remove.
+
+        Returns
+        -------
+        metric : None or np.array(1d)
+            The negative of the I-optimality criterion after each
+            removal, or None with covariates.
+        """
+        # Covariates may depend on the order of the runs
+        if self.cov is not no_cov:
+            return None
+
+        # Compute the downdates
+        M, U = _remove_downdates(X, Vinv, pos)
+
+        # Singular designs remain singular
+        if np.linalg.matrix_rank(M[0]) < M.shape[1]:
+            return np.full(len(pos), -np.inf)
+
+        # Sherman-Morrison update of the prediction variances
+        Minv = np.linalg.inv(M)
+        S = Minv @ U
+        d = 1 - np.sum(U * S, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            trace = np.trace(Minv @ self.moments, axis1=-2, axis2=-1)[:, np.newaxis] \
+                    + np.sum(S * (self.moments @ S), axis=1) / d
+
+        # Compute average trace
+        trace = np.mean(trace, axis=0)
+
+        # Invert for minimization, singular after removal
+        return np.where(d[0] > 1e-10, -trace, -np.inf)
+
 class Aliasing(Metric):
     """
     The sum of squares criterion for the weighted alias matrix.
@@ -321,6 +727,8 @@ class Aliasing(Metric):
     alias : np.array(1d)
         The indices of the effects in the model matrix to alias to.
     """
+    order_invariant = True
+
     def __init__(self, effects, alias, cov=None, W=None):
         """
         Creates the metric
@@ -15,7 +15,7 @@ from ..constraints import no_constraints
 
 FunctionSet = namedtuple('FunctionSet', 'Y2X init cost metric constraints', defaults=(None,)*4 + (no_constraints,))
 Parameters = namedtuple('Parameters', 'fn factors colstart coords ratios effect_types grouped_cols prior stats use_formulas')
-State = namedtuple('State', 'Y X Zs Vinv metric cost_Y costs max_cost')
+State = namedtuple('State', 'Y X Zs Vinv metric cost_Y costs max_cost M', defaults=(None,))
 __Factor__ = namedtuple('__Factor__', 'name grouped ratio type min max levels coords', 
                         defaults=(None, True, 1, 'cont', -1, 1, None, None))
 class Factor(FactorMixin, __Factor__):
@@ -79,7 +79,7 @@ def obs_var_Zs(Yenc, colstart, grouped_cols=None):
 
     return tuple(Zs)
 
-@numba.njit
+@numba.njit(cache=True)
 def obs_var(Yenc, colstart, ratios=None, grouped_cols=None):
     """
     Directly computes the observation matrix from the design. Is similar to
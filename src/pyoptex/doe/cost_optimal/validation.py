@@ -49,6 +49,11 @@ def validate_state(state, params, eps=1e-6):
         vinv = np.linalg.inv(obs_var_from_Zs(state.Zs, len(state.Y), params.ratios[i]))
         assert np.all(np.abs(state.Vinv[i] - vinv) < eps), f'(validation) Vinv[{i}] does not match: {np.linalg.norm(state.Vinv[i] - vinv)}'
 
+    # Validate the information matrices
+    if state.M is not None:
+        M = state.X.T @ state.Vinv @ state.X
+        assert np.all(np.abs(state.M - M) < eps * (1 + np.abs(M))), f'(validation) Information matrices M do not match: {np.linalg.norm(state.M - M)}'
+
     # Validate costs
     costs = params.fn.cost(state.Y, params)
 
@@ -0,0 +1,193 @@
+"""
+Module for the continuous coordinate optimization of the coordinate-exchange algorithms.
+"""
+
+import numpy as np
+from numpy.polynomial import chebyshev, polynomial
+
+from ..._profile import profile, count_evaluations
+
+
+def _cheb_nodes(n):
+    """
+    Computes the Chebyshev nodes of the first kind on [-1, 1].
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+
+    Returns
+    -------
+    nodes : np.array(1d)
+        The nodes.
+    """
+    return np.cos((2 * np.arange(n) + 1) * np.pi / (2 * n))
+
+def poly_degrees(factors, Y2X, colstart, max_degree=6, n=5, eps=1e-8):
+    """
+    Detects, for each factor, the degree of the model matrix
+    as a polynomial in the coordinate of that factor. The model matrix is
+    evaluated along the coordinate for a few random runs.
+
+    Only continuous factors without explicit levels are considered.
+    Mixture components and factors for which the model is not a polynomial
+    up to `max_degree` are marked by -1.
+
+    Parameters
+    ----------
+    factors : list(:py:class:`Factor <pyoptex.doe.fixed_structure.utils.Factor>`)
+        The factors of the experiment.
+    Y2X : func
+        The function converting from the design matrix to the
+        model matrix.
+    colstart : np.array(1d)
+        The start column of each factor in the encoded design matrix.
+    max_degree : int
+        The maximum detected degree.
+    n : int
+        The number of random runs.
+    eps : float
+        The relative tolerance of the polynomial fit.
+
+    Returns
+    -------
+    degrees : np.array(1d)
+        The degree for each factor, or -1.
+    """
+    # Random runs from the coordinates of each factor
+    rng = np.random.default_rng(0)
+    Yb = np.concatenate([
+        f.coords_[rng.integers(len(f.coords_), size=n)] for f in factors
+    ], axis=1)
+
+    # Use one more node than required to verify the fit
+    t = _cheb_nodes(max_degree + 2)
+
+    degrees = -np.ones(len(factors), dtype=np.int64)
+    for i, f in enumerate(factors):
+        if not f.is_continuous or f.is_mixture or f.levels is not None:
+            continue
+
+        # Evaluate the model matrix along the coordinate
+        Y = np.repeat(np.expand_dims(Yb, 0), len(t), axis=0)
+        Y[:, :, colstart[i]] = np.expand_dims(t, 1)
+        Xt = Y2X(Y.reshape(-1, Y.shape[-1])).reshape(len(t), -1)
+        tol = eps * max(np.max(np.abs(Xt)), 1)
+
+        # Find the lowest exact degree
+        for d in range(max_degree + 1):
+            coef = polynomial.polyfit(t, Xt, d)
+            if np.max(np.abs(polynomial.polyval(t, coef).T - Xt)) < tol:
+                degrees[i] = d
+                break
+
+    return degrees
+
+@profile
+def optimal_coords(Y, X, params, update, degree, coords, eps=1e-8):
+    """
+    Computes the coordinate on [-1, 1] which maximizes the D-optimality
+    criterion for a continuous factor of a single group of runs.
+
+    When the model matrix is a polynomial of degree `d` in the coordinate,
+    so is the product of the determinants of the information matrices.
+    The determinant is evaluated at a few Chebyshev nodes using
+    :py:func:`Dopt.batch_det <pyoptex.doe.fixed_structure.metric.Dopt.batch_det>`,
+    interpolated, and maximized analytically over its stationary points
+    and the boundaries. Denote by :math:`C_k` the coefficient of
+    :math:`x^k` in the altered runs of the model matrix, then the
+    number of nodes is
+
+    .. math::
+
+        1 + 2 n_{ratios} \\min\\left(d r, \\sum_k k \\cdot rank(C_k)\\right)
+
+    with r the number of altered runs. For a single run in a
+    quadratic model, this is five nodes.
+
+    The grid of coordinates of the factor is considered as
+    well, to guarantee feasible candidates under any constraints.
+
+    Parameters
+    ----------
+    Y : np.array(2d)
+        The current design matrix.
+    X : np.array(2d)
+        The current model matrix.
+    params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+        The optimization parameters.
+    update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+        The update being applied to the state, without the new coordinate.
+    degree : int
+        The degree of the model matrix in the coordinate, see
+        :py:func:`poly_degrees <pyoptex.doe.fixed_structure.continuous.poly_degrees>`.
+    coords : np.array(2d)
+        The grid of coordinates of the factor.
+    eps : float
+        The tolerance to detect zero coefficients and real roots.
+
+    Returns
+    -------
+    new_coords : np.array(2d)
+        The optimal feasible coordinate, or no coordinate if the
+        determinant does not depend on the coordinate.
+    """
+    # Extract the runs
+    Yr = Y[update.runs]
+    nruns = len(Yr)
+
+    # Compute the model matrix of the runs as a polynomial in the coordinate
+    t = _cheb_nodes(degree + 1)
+    Yt = np.repeat(np.expand_dims(Yr, 0), len(t), axis=0)
+    Yt[:, :, update.cols] = t[:, np.newaxis, np.newaxis]
+    Xt = params.fn.Y2X(Yt.reshape(-1, Yt.shape[-1])).reshape(len(t), -1)
+    C = polynomial.polyfit(t, Xt, degree).reshape(degree + 1, nruns, -1)
+
+    # Bound the degree of the determinant
+    tol = eps * max(np.max(np.abs(Xt)), 1)
+    rank = sum(k * np.linalg.matrix_rank(C[k], tol=tol) for k in range(1, degree + 1))
+    ndet = 2 * len(params.Vinv) * min(degree * nruns, rank)
+    if ndet == 0:
+        return np.empty((0, 1))
+
+    # Evaluate the determinant at the nodes
+    t = _cheb_nodes(ndet + 1)
+    Yt = np.repeat(np.expand_dims(Yr, 0), len(t), axis=0)
+    Yt[:, :, update.cols] = t[:, np.newaxis, np.newaxis]
+    Xt = params.fn.Y2X(Yt.reshape(-1, Yt.shape[-1]))
+    Xt = Xt.reshape(*Yt.shape[:2], Xt.shape[-1])
+    dets = params.fn.metric.batch_det(
+        Y, X, params, update._replace(new_coord=np.expand_dims(t, 1)), Xt
+    )
+    count_evaluations(len(t))
+    scale = np.max(np.abs(dets))
+    if scale == 0 or not np.isfinite(scale):
+        return np.empty((0, 1))
+
+    # Interpolate the determinant
+    coef = chebyshev.chebfit(t, dets / scale, ndet)
+
+    # Find the stationary points
+    roots = chebyshev.chebroots(chebyshev.chebder(coef))
+    roots = np.real(roots[np.abs(np.imag(roots)) < eps])
+    roots = np.clip(roots[np.abs(roots) <= 1 + eps], -1, 1)
+
+    # Generate the candidates (short-circuit original coordinate)
+    cands = np.unique(np.concatenate(([-1., 1.], roots, coords[:, 0])))
+    cands = cands[cands != update.old_coord[0]]
+
+    # Validate which coordinates are feasible
+    Yc = np.repeat(np.expand_dims(Yr, 0), len(cands), axis=0)
+    Yc[:, :, update.cols] = cands[:, np.newaxis, np.newaxis]
+    feasible = ~np.any(
+        params.fn.constraints(Yc.reshape(-1, Yc.shape[-1])).reshape(Yc.shape[:2]),
+        axis=1
+    )
+    cands = cands[feasible]
+    if len(cands) == 0:
+        return np.empty((0, 1))
+
+    # Select the maximum
+    best = np.argmax(chebyshev.chebval(cands, coef))
+    return cands[best:best+1, np.newaxis]
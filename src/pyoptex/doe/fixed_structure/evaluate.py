@@ -4,9 +4,6 @@ Module containing all the evaluation functions for fixed structure designs.
 
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-from plotly.colors import DEFAULT_PLOTLY_COLORS
-from plotly.subplots import make_subplots
 
 from ...utils.design import encode_design
 from ...utils.model import model2encnames
@@ -94,7 +91,7 @@ def fraction_of_design_space(Y, params, N=10000):
     X = params.fn.Y2X(Y)
     
     # Initialize Iopt
-    iopt = Iopt(n=N, cov=params.fn.metric.cov)
+    iopt = Iopt(n=N, cov=params.fn.metric.cov, exact=False)
     iopt.preinit(params)
     iopt.init(Y, X, params)
 
@@ -136,6 +133,9 @@ def plot_fraction_of_design_space(Y, params, N=10000):
     fig : :py:class:`plotly.graph_objects.Figure`
         The plotly figure with the fraction of design space plot.
     """
+    import plotly.graph_objects as go
+    from plotly.colors import DEFAULT_PLOTLY_COLORS
+
     # Compute prediction variances
     pred_var = fraction_of_design_space(Y, params, N=N)
 
@@ -233,6 +233,9 @@ def plot_estimation_variance_matrix(Y, params, model=None):
     fig : :py:class:`plotly.graph_objects.Figure`
         The plotly figure of a heatmap of the parameter estimation covariance matrix.
     """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
     # Compute estimation variance matrix
     Minv = estimation_variance_matrix(Y, params)
 
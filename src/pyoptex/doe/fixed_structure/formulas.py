@@ -0,0 +1,326 @@
+"""
+Module containing the update formulas for the generic coordinate-exchange algorithm
+"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True)
+def compute_update_UD(Xi_old, Xi_new, VX, Vrr):
+    """
+    Compute the update to the information matrix after making
+    a single coordinate adjustment. This update is expressed
+    in the form: :math:`M^* = M + U^T D U`.
+
+    Contrary to the split^k-plot algorithm, the observation covariance
+    matrix has no nested structure. Only the rows of `Vinv` which
+    belong to the altered runs are required. Denote by :math:`R`
+    these runs and :math:`\\Delta = X^*_R - X_R` the change in the model matrix,
+    then
+
+    .. math::
+
+        U = \\begin{bmatrix} \\Delta \\\\ V^{-1}_{R,:} X^* \\end{bmatrix}
+        \\qquad
+        D = \\begin{bmatrix} -V^{-1}_{R,R} & I \\\\ I & 0 \\end{bmatrix}
+
+    D is not diagonal in this case, but its inverse is known in closed form
+    and returned instead.
+
+    Parameters
+    ----------
+    Xi_old : np.array(2d)
+        The old runs before the update.
+    Xi_new : np.array(2d)
+        The new runs after the update.
+    VX : np.array(3d)
+        The rows :math:`V^{-1}_{R,:} X^*` of the new design matrix
+        for each set of a-priori variance ratios.
+    Vrr : np.array(3d)
+        The submatrix :math:`V^{-1}_{R,R}` for each set of
+        a-priori variance ratios.
+
+    Returns
+    -------
+    U : np.array(3d)
+        The U-matrix of the update for each set of a-priori variance ratios.
+    Dinv : np.array(3d)
+        The inverse of the D-matrix of the update for each set of
+        a-priori variance ratios.
+    """
+    # Initialize U and D
+    nruns = len(Xi_old)
+    U = np.zeros((len(VX), 2*nruns, Xi_old.shape[1]))
+    Dinv = np.zeros((len(VX), 2*nruns, 2*nruns))
+
+    # Change in the model matrix
+    Xdiff = Xi_new - Xi_old
+
+    for j in range(len(VX)):
+        # Store the update
+        U[j, :nruns] = Xdiff
+        U[j, nruns:] = VX[j]
+
+        # Store the inverse of D
+        for i in range(nruns):
+            Dinv[j, i, nruns+i] = 1
+            Dinv[j, nruns+i, i] = 1
+        Dinv[j, nruns:, nruns:] = Vrr[j]
+
+    return U, Dinv
+
+@numba.njit(cache=True)
+def det_update_UD(U, Dinv, Minv):
+    """
+    Compute the determinant adjustment as a factor.
+    In other words: :math:`|M^*|=\\alpha*|M|`. The new
+    information matrix originates from the following update
+    formula: :math:`M^* = M + U^T D U`.
+
+    The actual update is described as
+
+    .. math::
+
+        \\alpha = |D| |P| = |D| |D^{-1} + U M^{-1} U.T|
+
+    where :math:`|D| = (-1)^r` for the D-matrix from
+    :py:func:`compute_update_UD <pyoptex.doe.fixed_structure.formulas.compute_update_UD>`
+    with r the number of altered runs.
+
+    Parameters
+    ----------
+    U : np.array(3d)
+        The U matrix in the update for each set of
+        a-priori variance ratios.
+    Dinv : np.array(3d)
+        The inverse of the D matrix in the update for
+        each set of a-priori variance ratios.
+    Minv: np.array(3d)
+        The current inverses of the information matrices
+        for each set of a-priori variance ratios.
+
+    Returns
+    -------
+    alpha : np.array(1d)
+        The update factor for each set of a-priori variance ratios.
+    P : np.array(3d)
+        The P matrix of the update.
+    """
+    # Create updates
+    P = np.zeros_like(Dinv)
+    updates = np.zeros(len(Dinv), dtype=np.float64)
+    sign = 1 - 2 * ((Dinv.shape[1] // 2) % 2)
+
+    for j in range(len(Dinv)):
+        # Compute P
+        P[j] = Dinv[j] + U[j] @ Minv[j] @ U[j].T
+
+        # Compute update
+        updates[j] = np.linalg.det(P[j]) * sign
+
+    # Compute determinant update
+    return updates, P
+
+@numba.njit(cache=True)
+def inv_update_UD(U, Dinv, Minv, P):
+    """
+    Compute the update of the inverse of the information matrix.
+    In other words: :math:`M^{-1}^* = M^{-1} - M_{up}`. The new
+    information matrix originates from the following update
+    formula: :math:`M^* = M + U^T D U`.
+
+    The actual update is described as
+
+    .. math::
+
+        M_{up} = M^{-1} U^T P^{-1} U M^{-1}
+
+    .. math::
+        P = D^{-1} + U M^{-1} U.T
+
+    Parameters
+    ----------
+    U : np.array(3d)
+        The U matrix in the update for each set of
+        a-priori variance ratios.
+    Dinv : np.array(3d)
+        The inverse of the D matrix in the update for
+        each set of a-priori variance ratios.
+    Minv: np.array(3d)
+        The current inverses of the information matrices
+        for each set of a-priori variance ratios.
+    P : np.array(3d)
+        The P matrix if already pre-computed.
+
+    Returns
+    -------
+    Mup : np.array(3d)
+        The updates to the inverses of the information
+        matrices.
+    """
+    Mup = np.zeros_like(Minv)
+    for i in range(len(Minv)):
+        MU = Minv[i] @ U[i].T
+        Mup[i] = (MU) @ np.linalg.solve(P[i], MU.T)
+    return Mup
+
+@numba.njit(cache=True)
+def inv_update_UD_no_P(U, Dinv, Minv):
+    """
+    See :py:func:`inv_update_UD <pyoptex.doe.fixed_structure.formulas.inv_update_UD>`,
+    but without precomputing the P-matrix.
+    """
+    # Compute P
+    P = np.zeros_like(Dinv)
+    for j in range(len(Dinv)):
+        P[j] = Dinv[j] + U[j] @ Minv[j] @ U[j].T
+
+    return inv_update_UD(U, Dinv, Minv, P)
+
+@numba.njit(cache=True)
+def info_update_UD(U, Dinv):
+    """
+    Compute the update of the information matrix itself.
+    In other words: :math:`M^* = M + M_{up}` with
+    :math:`M_{up} = U^T D U`, computed without explicitly
+    inverting `Dinv`.
+
+    Parameters
+    ----------
+    U : np.array(3d)
+        The U matrix in the update for each set of
+        a-priori variance ratios.
+    Dinv : np.array(3d)
+        The inverse of the D matrix in the update for
+        each set of a-priori variance ratios.
+
+    Returns
+    -------
+    Mup : np.array(3d)
+        The updates to the information matrices.
+    """
+    nruns = Dinv.shape[1] // 2
+    Mup = np.zeros((len(U), U.shape[2], U.shape[2]))
+    for j in range(len(U)):
+        # Extract the components
+        Xdiff = np.ascontiguousarray(U[j, :nruns])
+        XdiffT = np.ascontiguousarray(Xdiff.T)
+        VX = np.ascontiguousarray(U[j, nruns:])
+        Vrr = np.ascontiguousarray(Dinv[j, nruns:, nruns:])
+
+        # Compute the update
+        XVX = XdiffT @ VX
+        Mup[j] = XVX + XVX.T - XdiffT @ Vrr @ Xdiff
+    return Mup
+
+@numba.njit(cache=True)
+def batch_compute_update_UD(Xi_old, Xi_new, VX, Vrr):
+    """
+    Compute the updates to the information matrix for a batch
+    of candidate coordinates at once. See
+    :py:func:`compute_update_UD <pyoptex.doe.fixed_structure.formulas.compute_update_UD>`.
+    As only the altered runs differ between the candidates,
+    :math:`V^{-1}_{R,:} X^* = V^{-1}_{R,:} X + V^{-1}_{R,R} \\Delta` is computed
+    from the rows of the current design matrix.
+
+    Parameters
+    ----------
+    Xi_old : np.array(2d)
+        The old runs before the update.
+    Xi_new : np.array(3d)
+        The new runs for each candidate.
+    VX : np.array(3d)
+        The rows :math:`V^{-1}_{R,:} X` of the current design matrix
+        for each set of a-priori variance ratios.
+    Vrr : np.array(3d)
+        The submatrix :math:`V^{-1}_{R,R}` for each set of
+        a-priori variance ratios.
+
+    Returns
+    -------
+    U : np.array(4d)
+        The U-matrix of the update for each candidate and each set of 
+        a-priori variance ratios.
+    Dinv : np.array(3d)
+        The inverse of the D-matrix of the update for each set of
+        a-priori variance ratios, identical for each candidate.
+    """
+    # Initialize U and D
+    nruns = len(Xi_old)
+    U = np.zeros((len(Xi_new), len(VX), 2*nruns, Xi_old.shape[1]))
+    Dinv = np.zeros((len(VX), 2*nruns, 2*nruns))
+
+    for j in range(len(VX)):
+        # Store the inverse of D
+        for i in range(nruns):
+            Dinv[j, i, nruns+i] = 1
+            Dinv[j, nruns+i, i] = 1
+        Dinv[j, nruns:, nruns:] = Vrr[j]
+
+        # Store the update of each candidate
+        for c in range(len(Xi_new)):
+            Xdiff = Xi_new[c] - Xi_old
+            U[c, j, :nruns] = Xdiff
+            U[c, j, nruns:] = VX[j] + Vrr[j] @ Xdiff
+
+    return U, Dinv
+
+@numba.njit(cache=True)
+def batch_det_update_UD(U, Dinv, Minv):
+    """
+    See :py:func:`det_update_UD <pyoptex.doe.fixed_structure.formulas.det_update_UD>`,
+    but for a batch of candidates as computed by
+    :py:func:`batch_compute_update_UD <pyoptex.doe.fixed_structure.formulas.batch_compute_update_UD>`.
+
+    Returns
+    -------
+    alpha : np.array(2d)
+        The update factor for each candidate and each set of a-priori variance ratios.
+    P : np.array(4d)
+        The P matrix of the update for each candidate.
+    """
+    P = np.zeros((len(U),) + Dinv.shape)
+    updates = np.zeros((len(U), len(Dinv)), dtype=np.float64)
+    for c in range(len(U)):
+        du, Pc = det_update_UD(U[c], Dinv, Minv)
+        updates[c] = du
+        P[c] = Pc
+    return updates, P
+
+@numba.njit(cache=True)
+def batch_inv_update_UD(U, Dinv, Minv, P, valid):
+    """
+    See :py:func:`inv_update_UD <pyoptex.doe.fixed_structure.formulas.inv_update_UD>`,
+    but for a batch of candidates as computed by
+    :py:func:`batch_compute_update_UD <pyoptex.doe.fixed_structure.formulas.batch_compute_update_UD>`.
+    Only the `valid` candidates are computed, the others remain zero.
+
+    Returns
+    -------
+    Mup : np.array(4d)
+        The updates to the inverses of the information
+        matrices for each candidate.
+    """
+    Mup = np.zeros((len(U),) + Minv.shape)
+    for c in range(len(U)):
+        if valid[c]:
+            Mup[c] = inv_update_UD(U[c], Dinv, Minv, P[c])
+    return Mup
+
+@numba.njit(cache=True)
+def batch_info_update_UD(U, Dinv):
+    """
+    See :py:func:`info_update_UD <pyoptex.doe.fixed_structure.formulas.info_update_UD>`,
+    but for a batch of candidates as computed by
+    :py:func:`batch_compute_update_UD <pyoptex.doe.fixed_structure.formulas.batch_compute_update_UD>`.
+
+    Returns
+    -------
+    Mup : np.array(4d)
+        The updates to the information matrices for each candidate.
+    """
+    Mup = np.zeros((len(U), U.shape[1], U.shape[3], U.shape[3]))
+    for c in range(len(U)):
+        Mup[c] = info_update_UD(U[c], Dinv)
+    return Mup
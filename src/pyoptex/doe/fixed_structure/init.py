@@ -8,10 +8,10 @@ from numba.typed import List
 
 from ..._profile import profile
 from ...utils.design import encode_design
-from ..utils.init import init_single_unconstrained
+from ..utils.init import init_single_unconstrained, init_qmc
 
 
-@numba.njit
+@numba.njit(cache=True)
 def __init_unconstrained(effect_types, effect_levels, grps, 
                          coords, Zs, Y, complete=False):
     """
@@ -106,6 +106,7 @@ def __init_unconstrained(effect_types, effect_levels, grps,
 
     return Y
 
+# Not cached, as the signature contains the (process specific) constraints function
 @numba.njit
 def __correct_constraints(effect_types, effect_levels, grps, coords, 
                           constraints, Zs, Y, complete=False):
@@ -281,7 +282,7 @@ def initialize_feasible(params, complete=False, max_tries=1000):
                     
     return Y, (Yenc, Xenc)
 
-def init_random(params, n=1, complete=False):
+def init_random(params, n=1, complete=False, qmc=False):
     """
     Initialize a design with `n` randomly sampled runs. They must
     be within the constraints.
@@ -295,22 +296,30 @@ def init_random(params, n=1, complete=False):
     complete : bool
         Whether to use the coordinates for initialization
         or initialize fully randomly.
+    qmc : bool
+        Whether to sample from scrambled Sobol sequences, see
+        :py:func:`init_qmc <pyoptex.doe.utils.init.init_qmc>`.
+        The number of runs is then rounded up to a multiple of eight.
 
     Returns
     -------
     design : np.array(2d)
         The resulting design.
     """
-    # Initialize
-    run = np.zeros((n, params.colstart[-1]), dtype=np.float64)
-    invalid = np.ones(n, dtype=np.bool_)
-
     # Adjust for completeness
     if complete:
         coords = None
     else:
         coords = params.coords
 
+    # Quasi-random sampling
+    if qmc:
+        return init_qmc(params.colstart, coords, params.effect_types, params.fn.constraints, n)
+
+    # Initialize
+    run = np.zeros((n, params.colstart[-1]), dtype=np.float64)
+    invalid = np.ones(n, dtype=np.bool_)
+
     # Loop until all are valid
     while np.any(invalid):
         run[invalid] = init_single_unconstrained(params.colstart, coords, run[invalid], params.effect_types)
@@ -4,9 +4,12 @@ Module for all metrics of fixed structure designs.
 
 import numpy as np
 
-from ...utils.comp import outer_integral
+from ..utils.moments import exact_moments, sample_moments, moments_key
 from .cov import no_cov
 from .init import init_random
+from .formulas import (compute_update_UD, det_update_UD, inv_update_UD,
+                       info_update_UD, batch_compute_update_UD, batch_det_update_UD,
+                       batch_inv_update_UD, batch_info_update_UD)
 
 
 class Metric:
@@ -18,7 +21,14 @@ class Metric:
     cov : func(Y, X)
         A function computing the covariate parameters
         and potential extra random effects.
+    singular_eps : float
+        The relative determinant below which an updated
+        design is considered singular when using update formulas.
+        Similarly, the update formulas are not used when the inverse 
+        condition number of the current information matrix is below it.
     """
+    singular_eps = 1e-8
+
     def __init__(self, cov=None):
         """
         Creates the metric
@@ -83,6 +93,257 @@ class Metric:
         """
         raise NotImplementedError('Must implement a call function')
 
+    def update(self, Y, X, params, update):
+        """
+        Computes the update to the metric according to
+        `update`. The update to the metric is of the
+        form :math:`m_{new} = m_{old} + up`. By default,
+        the metric is computed from scratch.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The updated design matrix
+        X : np.array(2d)
+            The updated model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state.
+
+        Returns
+        -------
+        up : float
+            The update to the metric.
+        """
+        # Compute from scratch
+        new_metric = self.call(Y, X, params)
+        metric_update = new_metric - update.old_metric
+        return metric_update
+
+    def accepted(self, Y, X, params, update):
+        """
+        Updates the internal state when the updated
+        design was accepted (and therefore better).
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The updated design matrix
+        X : np.array(2d)
+            The updated model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state.
+        """
+        pass
+
+    def batch_update(self, Y, X, params, update, Xi_new):
+        """
+        Computes the updates to the metric for a batch of candidate
+        coordinates of a single factor and group. The `new_coord` of
+        `update` contains the coordinates of every candidate and
+        `Xi_new` the corresponding new runs of the model matrix.
+        By default, :py:func:`update <pyoptex.doe.fixed_structure.metric.Metric.update>`
+        is called for each candidate.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The current design matrix
+        X : np.array(2d)
+            The current model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state, with a 2d array of
+            candidate coordinates.
+        Xi_new : np.array(3d)
+            The new runs of the model matrix for each candidate.
+
+        Returns
+        -------
+        up : np.array(1d)
+            The update to the metric for each candidate.
+        """
+        metric_updates = np.zeros(len(Xi_new), dtype=np.float64)
+        for i in range(len(Xi_new)):
+            # Apply the candidate
+            Y[update.runs, update.cols] = update.new_coord[i]
+            X[update.runs] = Xi_new[i]
+
+            # Compute the update
+            metric_updates[i] = self.update(
+                Y, X, params, update._replace(new_coord=update.new_coord[i])
+            )
+
+        # Restore the design
+        Y[update.runs, update.cols] = update.old_coord
+        X[update.runs] = update.Xi_old
+
+        return metric_updates
+
+    def _batch_cov(self, Y, X, update, Xi_new):
+        """
+        Applies the covariate expansion to the design, the
+        old runs and the new runs of each candidate in a batch.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The current design matrix
+        X : np.array(2d)
+            The current model matrix
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state, with a 2d array of
+            candidate coordinates.
+        Xi_new : np.array(3d)
+            The new runs of the model matrix for each candidate.
+
+        Returns
+        -------
+        X : np.array(2d)
+            The covariate expanded model matrix.
+        Xi_old : np.array(2d)
+            The covariate expanded old runs.
+        Xi_new : np.array(3d)
+            The covariate expanded new runs of each candidate.
+        """
+        # No covariates
+        if self.cov is no_cov:
+            return X, update.Xi_old, Xi_new
+
+        # Covariate expansion
+        _, X = self.cov(Y, X)
+        _, Xi_old = self.cov(
+            np.broadcast_to(update.old_coord, (len(update.Xi_old), len(update.old_coord))), 
+            update.Xi_old,
+            subset=update.runs
+        )
+        Xi_new = np.stack([
+            self.cov(
+                np.broadcast_to(coord, (len(Xi), len(coord))), 
+                Xi, subset=update.runs
+            )[1]
+            for coord, Xi in zip(update.new_coord, Xi_new)
+        ])
+
+        return X, Xi_old, Xi_new
+
+    def _batch_compute_update_UD(self, Y, X, params, update, Xi_new):
+        """
+        Computes the low-rank updates of the information matrix
+        for a batch of candidates, taking the covariates into account.
+        See :py:func:`batch_compute_update_UD <pyoptex.doe.fixed_structure.formulas.batch_compute_update_UD>`.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The current design matrix
+        X : np.array(2d)
+            The current model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state, with a 2d array of
+            candidate coordinates.
+        Xi_new : np.array(3d)
+            The new runs of the model matrix for each candidate.
+
+        Returns
+        -------
+        U : np.array(4d)
+            The U-matrix of the update for each candidate.
+        Dinv : np.array(3d)
+            The inverse of the D-matrix of the update.
+        """
+        X, Xi_old, Xi_new = self._batch_cov(Y, X, update, Xi_new)
+        VX, Vrr = params.Vinv.rows(update.runs, X)
+        return batch_compute_update_UD(Xi_old, Xi_new, VX, Vrr)
+
+    def _compute_update_UD(self, Y, X, params, update):
+        """
+        Computes the low-rank update of the information matrix
+        according to `update`, taking the covariates into account.
+        See :py:func:`compute_update_UD <pyoptex.doe.fixed_structure.formulas.compute_update_UD>`.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The updated design matrix
+        X : np.array(2d)
+            The updated model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state.
+
+        Returns
+        -------
+        U : np.array(3d)
+            The U-matrix of the update.
+        Dinv : np.array(3d)
+            The inverse of the D-matrix of the update.
+        """
+        # Covariate expansion
+        _, X = self.cov(Y, X)
+        _, Xi_old = self.cov(
+            np.broadcast_to(update.old_coord, (len(update.Xi_old), len(update.old_coord))), 
+            update.Xi_old,
+            subset=update.runs
+        )
+
+        # Compute U, D update
+        VX, Vrr = params.Vinv.rows(update.runs, X)
+        return compute_update_UD(Xi_old, X[update.runs], VX, Vrr)
+
+    def _init_M(self, Y, X, params):
+        """
+        Computes the information matrices of the design,
+        taking the covariates into account.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The design matrix
+        X : np.array(2d)
+            The model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+
+        Returns
+        -------
+        M : np.array(3d)
+            The information matrices.
+        """
+        # Covariate expansion
+        _, X = self.cov(Y, X)
+
+        # Compute information matrix
+        return X.T @ params.Vinv @ X
+
+    def _init_Minv(self, M):
+        """
+        Computes the inverses of the information matrices. If any
+        is numerically singular, the update formulas are unreliable and
+        None is returned instead. The metric is then computed from scratch
+        until the design is no longer singular.
+
+        Parameters
+        ----------
+        M : np.array(3d)
+            The information matrices.
+
+        Returns
+        -------
+        Minv : None or np.array(3d)
+            The inverses of the information matrices.
+        """
+        if np.any(np.linalg.cond(M) * self.singular_eps > 1):
+            return None
+        return np.linalg.inv(M)
+
 class Dopt(Metric):
     """
     The D-optimality criterion.
@@ -93,7 +354,210 @@ class Dopt(Metric):
     cov : func(Y, X)
         A function computing the covariate parameters
         and potential extra random effects.
+    M : np.array(3d)
+        The information matrices.
+    Minv : np.array(3d)
+        The inverses of the information matrices.
+    P : np.array(3d)
+        The P-matrix in the update formula.
+    U : np.array(3d)
+        The U-matrix in the update formula.
+    Dinv : np.array(3d)
+        The inverse of the D-matrix in the update formula.
     """
+    def __init__(self, cov=None):
+        """
+        Creates the metric
+
+        Parameters
+        ----------
+        cov : func(Y, X)
+            The covariance function
+        """
+        super().__init__(cov)
+        self.M = None
+        self.Minv = None
+        self.P = None
+        self.U = None
+        self.Dinv = None
+
+    def init(self, Y, X, params):
+        """
+        Initializes the inverse of the information
+        matrix when using update formulas.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The design matrix
+        X : np.array(2d)
+            The model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        """
+        if params.compute_update:
+            self.M = self._init_M(Y, X, params)
+            self.Minv = self._init_Minv(self.M)
+
+    def update(self, Y, X, params, update):
+        """
+        Computes the update to the metric according to
+        `update`. The update to the metric is of the
+        form :math:`m_{new} = m_{old} + up`.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The updated design matrix
+        X : np.array(2d)
+            The updated model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state.
+
+        Returns
+        -------
+        up : float
+            The update to the metric.
+        """
+        if not params.compute_update or self.Minv is None:
+            return super().update(Y, X, params, update)
+
+        # Compute U, D update
+        self.U, self.Dinv = self._compute_update_UD(Y, X, params, update)
+
+        # Compute change in determinant
+        du, self.P = det_update_UD(self.U, self.Dinv, self.Minv)
+        if np.all(du > 0):
+            # Compute power
+            duu = np.power(np.prod(du), 1/(self.Minv.shape[-1] * len(self.Minv)))
+
+            # Return update as addition
+            metric_update = (duu - 1) * update.old_metric
+        else:
+            metric_update = -update.old_metric
+
+        return metric_update
+
+    def batch_update(self, Y, X, params, update, Xi_new):
+        """
+        Computes the updates to the metric for a batch of candidate
+        coordinates using the update formulas.
+        See :py:func:`Metric.batch_update <pyoptex.doe.fixed_structure.metric.Metric.batch_update>`.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The current design matrix
+        X : np.array(2d)
+            The current model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state, with a 2d array of
+            candidate coordinates.
+        Xi_new : np.array(3d)
+            The new runs of the model matrix for each candidate.
+
+        Returns
+        -------
+        up : np.array(1d)
+            The update to the metric for each candidate.
+        """
+        if not params.compute_update or self.Minv is None:
+            return super().batch_update(Y, X, params, update, Xi_new)
+
+        # Compute U, D updates
+        U, Dinv = self._batch_compute_update_UD(Y, X, params, update, Xi_new)
+
+        # Compute change in determinant
+        du, _ = batch_det_update_UD(U, Dinv, self.Minv)
+        valid = np.all(du > 0, axis=1)
+
+        # Compute power
+        duu = np.power(
+            np.prod(np.where(valid[:, np.newaxis], du, 1), axis=1), 
+            1/(self.Minv.shape[-1] * len(self.Minv))
+        )
+
+        # Return update as addition
+        metric_update = np.where(valid, (duu - 1) * update.old_metric, -update.old_metric)
+
+        return metric_update
+
+    def batch_det(self, Y, X, params, update, Xi_new):
+        """
+        Computes the product of the determinants of the information
+        matrices for a batch of candidate coordinates, up to a positive factor
+        which is identical for all candidates. Contrary to the metric itself,
+        this is a polynomial in the coordinates of a continuous factor, see
+        :py:func:`optimal_coords <pyoptex.doe.fixed_structure.continuous.optimal_coords>`.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The current design matrix
+        X : np.array(2d)
+            The current model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state, with a 2d array of
+            candidate coordinates.
+        Xi_new : np.array(3d)
+            The new runs of the model matrix for each candidate.
+
+        Returns
+        -------
+        dets : np.array(1d)
+            The (scaled) product of the determinants for each candidate.
+        """
+        if params.compute_update and self.Minv is not None:
+            # Relative to the current determinants
+            U, Dinv = self._batch_compute_update_UD(Y, X, params, update, Xi_new)
+            du, _ = batch_det_update_UD(U, Dinv, self.Minv)
+            return np.prod(du, axis=1)
+
+        dets = np.zeros(len(Xi_new), dtype=np.float64)
+        for i in range(len(Xi_new)):
+            # Apply the candidate
+            Y[update.runs, update.cols] = update.new_coord[i]
+            X[update.runs] = Xi_new[i]
+
+            # Compute the determinants from scratch
+            _, Xc = self.cov(Y, X)
+            dets[i] = np.prod(np.linalg.det(Xc.T @ params.Vinv @ Xc))
+
+        # Restore the design
+        Y[update.runs, update.cols] = update.old_coord
+        X[update.runs] = update.Xi_old
+
+        return dets
+
+    def accepted(self, Y, X, params, update):
+        """
+        Updates the internal M and Minv attributes
+        according to the last computed update.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The updated design matrix
+        X : np.array(2d)
+            The updated model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state.
+        """
+        if params.compute_update:
+            # Update M and recompute Minv
+            if self.Minv is None:
+                self.M = self._init_M(Y, X, params)
+            else:
+                self.M += info_update_UD(self.U, self.Dinv)
+            self.Minv = self._init_Minv(self.M)
 
     def call(self, Y, X, params):
         """
@@ -138,6 +602,16 @@ class Aopt(Metric):
         and potential extra random effects.
     W : None or np.array(1d)
         The weights for computing A-optimality.
+    M : np.array(3d)
+        The information matrices. Used as a cache.
+    Minv : np.array(3d)
+        The inverses of the information matrices. Used as a cache.
+    Mup : np.array(3d)
+        The update for the inverse information matrix. Used as a cache.
+    U : np.array(3d)
+        The U-matrix in the update formula.
+    Dinv : np.array(3d)
+        The inverse of the D-matrix in the update formula.
     """
     def __init__(self, W=None, cov=None):
         """
@@ -152,6 +626,167 @@ class Aopt(Metric):
         """
         super().__init__(cov)
         self.W = W
+        self.M = None
+        self.Minv = None
+        self.Mup = None
+        self.U = None
+        self.Dinv = None
+
+    def init(self, Y, X, params):
+        """
+        Initializes the inverse of the information
+        matrix when using update formulas.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The design matrix
+        X : np.array(2d)
+            The model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        """
+        if params.compute_update:
+            self.M = self._init_M(Y, X, params)
+            self.Minv = self._init_Minv(self.M)
+
+    def update(self, Y, X, params, update):
+        """
+        Computes the update to the metric according to
+        `update`. The update to the metric is of the
+        form :math:`m_{new} = m_{old} + up`.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The updated design matrix
+        X : np.array(2d)
+            The updated model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state.
+
+        Returns
+        -------
+        up : float
+            The update to the metric.
+        """
+        if not params.compute_update or self.Minv is None:
+            return super().update(Y, X, params, update)
+
+        # Compute U, D update
+        self.U, self.Dinv = self._compute_update_UD(Y, X, params, update)
+
+        # Detect singular designs by the change in determinant
+        du, P = det_update_UD(self.U, self.Dinv, self.Minv)
+        if np.any(du < self.singular_eps):
+            return -np.inf
+
+        # Compute update to Minv
+        try:
+            self.Mup = inv_update_UD(self.U, self.Dinv, self.Minv, P)
+        except np.linalg.LinAlgError as e:
+            # Infeasible design
+            return -np.inf
+        
+        # Extrace variances
+        diag = np.array([np.diag(m) for m in self.Mup])
+
+        # Weight
+        if self.W is not None:
+            diag *= self.W
+
+        # Compute average
+        metric_update = np.mean(np.sum(diag, axis=-1))
+
+        # Numerical instability (negative trace of variances)
+        if metric_update > -update.old_metric:
+            metric_update = -np.inf
+
+        return metric_update
+
+    def batch_update(self, Y, X, params, update, Xi_new):
+        """
+        Computes the updates to the metric for a batch of candidate
+        coordinates using the update formulas.
+        See :py:func:`Metric.batch_update <pyoptex.doe.fixed_structure.metric.Metric.batch_update>`.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The current design matrix
+        X : np.array(2d)
+            The current model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state, with a 2d array of
+            candidate coordinates.
+        Xi_new : np.array(3d)
+            The new runs of the model matrix for each candidate.
+
+        Returns
+        -------
+        up : np.array(1d)
+            The update to the metric for each candidate.
+        """
+        if not params.compute_update or self.Minv is None:
+            return super().batch_update(Y, X, params, update, Xi_new)
+
+        # Compute U, D updates
+        U, Dinv = self._batch_compute_update_UD(Y, X, params, update, Xi_new)
+
+        # Detect singular designs by the change in determinant
+        du, P = batch_det_update_UD(U, Dinv, self.Minv)
+        valid = np.all(du >= self.singular_eps, axis=1)
+
+        # Compute updates to Minv
+        try:
+            Mup = batch_inv_update_UD(U, Dinv, self.Minv, P, valid)
+        except np.linalg.LinAlgError as e:
+            # Evaluate each candidate separately
+            return Metric.batch_update(self, Y, X, params, update, Xi_new)
+
+        # Extract variances
+        diag = np.diagonal(Mup, axis1=-2, axis2=-1)
+
+        # Weight
+        if self.W is not None:
+            diag = diag * self.W
+
+        # Compute average
+        metric_update = np.mean(np.sum(diag, axis=-1), axis=-1)
+
+        # Infeasible or numerically unstable designs
+        metric_update[~valid] = -np.inf
+        metric_update[metric_update > -update.old_metric] = -np.inf
+
+        return metric_update
+
+    def accepted(self, Y, X, params, update):
+        """
+        Updates the internal M and Minv attributes
+        according to the last computed update.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The updated design matrix
+        X : np.array(2d)
+            The updated model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state.
+        """
+        if params.compute_update:
+            # Update M and recompute Minv
+            if self.Minv is None:
+                self.M = self._init_M(Y, X, params)
+            else:
+                self.M += info_update_UD(self.U, self.Dinv)
+            self.Minv = self._init_Minv(self.M)
 
     def call(self, Y, X, params):
         """
@@ -207,12 +842,31 @@ class Iopt(Metric):
         and potential extra random effects.
     moments : np.array(2d)
         The moments matrix.
-    samples : np.array(2d)
-        The covariate expanded samples for the moments matrix.
+    samples : None or np.array(2d)
+        The covariate expanded samples for the moments matrix, or None
+        if the moments matrix is computed exactly.
     n : int
-        The number of samples.
+        The (maximum) number of samples.
+    exact : bool
+        Whether to compute the moments matrix exactly when possible.
+    qmc : bool
+        Whether to sample from scrambled Sobol sequences.
+    tol : None or float
+        The required standard error of the moments matrix.
+    error : np.array(2d)
+        The standard error of each element of the moments matrix.
+    M : np.array(3d)
+        The information matrix. Used as a cache.
+    Minv : np.array(3d)
+        The inverse of the information matrix. Used as a cache.
+    Mup : np.array(3d)
+        The update to the inverse of the information matrix. Used as a cache.
+    U : np.array(3d)
+        The U-matrix in the update formula.
+    Dinv : np.array(3d)
+        The inverse of the D-matrix in the update formula.
     """
-    def __init__(self, n=10000, cov=None, complete=True):
+    def __init__(self, n=10000, cov=None, complete=True, exact=True, qmc=True, tol=None):
         """
         Creates the metric
 
@@ -226,11 +880,34 @@ class Iopt(Metric):
             Whether to only use the coordinates or completely
             randomly initialize the samples to generate the
             moments matrix.
+        exact : bool
+            Whether to compute the moments matrix exactly for
+            polynomial models without constraints or covariates, see
+            :py:func:`exact_moments <pyoptex.doe.utils.moments.exact_moments>`.
+            Otherwise, it is estimated from `n` samples.
+        qmc : bool
+            Whether to draw the samples from scrambled Sobol sequences
+            instead of independent random runs, see
+            :py:func:`init_qmc <pyoptex.doe.utils.init.init_qmc>`.
+        tol : None or float
+            The required standard error of the elements of the moments matrix. 
+            If specified, `n` is the maximum number of samples, see
+            :py:func:`sample_moments <pyoptex.doe.utils.moments.sample_moments>`.
         """
         super().__init__(cov)
         self.complete = complete
+        self.exact = exact
+        self.qmc = qmc
+        self.tol = tol
         self.moments = None
+        self.samples = None
+        self.error = None
         self.n = n
+        self.M = None
+        self.Minv = None
+        self.Mup = None
+        self.U = None
+        self.Dinv = None
 
     def preinit(self, params):
         """
@@ -241,15 +918,166 @@ class Iopt(Metric):
         params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
             The optimization parameters.
         """
-        # Create the random samples
-        samples = init_random(params, self.n, complete=self.complete)
-        self.samples = params.fn.Y2X(samples)
+        # Compute the exact moments matrix
+        if self.exact and self.cov is no_cov:
+            self.moments = exact_moments(params, complete=self.complete)
+            if self.moments is not None:
+                self.error = np.zeros_like(self.moments)
+                return
 
-        # Expand covariates
-        _, self.samples = self.cov(samples, self.samples, random=True)
+        # Create the random samples with expanded covariates
+        def sample(n):
+            samples = init_random(params, n, complete=self.complete, qmc=self.qmc)
+            _, X = self.cov(samples, params.fn.Y2X(samples), random=True)
+            return X
 
         # Compute moments matrix and normalization factor
-        self.moments = outer_integral(self.samples)  # Correct up to volume factor (Monte Carlo integration), can be ignored
+        # Correct up to volume factor (Monte Carlo integration), can be ignored
+        key = moments_key(params, self.n, self.tol, self.complete, self.qmc) \
+                if self.cov is no_cov else None
+        self.samples, self.moments, self.error = sample_moments(sample, self.n, self.tol, key=key)
+
+    def init(self, Y, X, params):
+        """
+        Initializes the inverse of the information
+        matrix when using update formulas.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The design matrix
+        X : np.array(2d)
+            The model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        """
+        if params.compute_update:
+            self.M = self._init_M(Y, X, params)
+            self.Minv = self._init_Minv(self.M)
+
+    def update(self, Y, X, params, update):
+        """
+        Computes the update to the metric according to
+        `update`. The update to the metric is of the
+        form :math:`m_{new} = m_{old} + up`.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The updated design matrix
+        X : np.array(2d)
+            The updated model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state.
+
+        Returns
+        -------
+        up : float
+            The update to the metric.
+        """
+        if not params.compute_update or self.Minv is None:
+            return super().update(Y, X, params, update)
+
+        # Compute U, D update
+        self.U, self.Dinv = self._compute_update_UD(Y, X, params, update)
+
+        # Detect singular designs by the change in determinant
+        du, P = det_update_UD(self.U, self.Dinv, self.Minv)
+        if np.any(du < self.singular_eps):
+            return -np.inf
+
+        # Compute update to Minv
+        try:
+            self.Mup = inv_update_UD(self.U, self.Dinv, self.Minv, P)
+        except np.linalg.LinAlgError as e:
+            # Infeasible design
+            return -np.inf
+
+        # Compute update to metric (double negation with update)
+        metric_update = np.mean(np.sum(self.Mup * self.moments.T, axis=(1, 2)))
+
+        # Numerical instability (negative variance)
+        if metric_update > -update.old_metric:
+            metric_update = -np.inf
+
+        return metric_update
+
+    def batch_update(self, Y, X, params, update, Xi_new):
+        """
+        Computes the updates to the metric for a batch of candidate
+        coordinates using the update formulas.
+        See :py:func:`Metric.batch_update <pyoptex.doe.fixed_structure.metric.Metric.batch_update>`.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The current design matrix
+        X : np.array(2d)
+            The current model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state, with a 2d array of
+            candidate coordinates.
+        Xi_new : np.array(3d)
+            The new runs of the model matrix for each candidate.
+
+        Returns
+        -------
+        up : np.array(1d)
+            The update to the metric for each candidate.
+        """
+        if not params.compute_update or self.Minv is None:
+            return super().batch_update(Y, X, params, update, Xi_new)
+
+        # Compute U, D updates
+        U, Dinv = self._batch_compute_update_UD(Y, X, params, update, Xi_new)
+
+        # Detect singular designs by the change in determinant
+        du, P = batch_det_update_UD(U, Dinv, self.Minv)
+        valid = np.all(du >= self.singular_eps, axis=1)
+
+        # Compute updates to Minv
+        try:
+            Mup = batch_inv_update_UD(U, Dinv, self.Minv, P, valid)
+        except np.linalg.LinAlgError as e:
+            # Evaluate each candidate separately
+            return Metric.batch_update(self, Y, X, params, update, Xi_new)
+
+        # Compute update to metric (double negation with update)
+        metric_update = np.mean(np.sum(Mup * self.moments.T, axis=(-2, -1)), axis=-1)
+
+        # Infeasible or numerically unstable designs
+        metric_update[~valid] = -np.inf
+        metric_update[metric_update > -update.old_metric] = -np.inf
+
+        return metric_update
+
+    def accepted(self, Y, X, params, update):
+        """
+        Updates the internal M and Minv attributes
+        according to the last computed update.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The updated design matrix
+        X : np.array(2d)
+            The updated model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state.
+        """
+        if params.compute_update:
+            # Update M and recompute Minv
+            if self.Minv is None:
+                self.M = self._init_M(Y, X, params)
+            else:
+                self.M += info_update_UD(self.U, self.Dinv)
+            self.Minv = self._init_Minv(self.M)
 
     def call(self, Y, X, params):
         """
@@ -308,6 +1136,10 @@ class Aliasing(Metric):
         The indices of the effects in the model matrix to alias from.
     alias : np.array(1d)
         The indices of the effects in the model matrix to alias to.
+    M : np.array(3d)
+        The information matrices. Used as a cache.
+    Mup : np.array(3d)
+        The update to the information matrices. Used as a cache.
     """
     def __init__(self, effects, alias, cov=None, W=None):
         """
@@ -328,6 +1160,166 @@ class Aliasing(Metric):
         self.W = W
         self.effects = effects
         self.alias = alias
+        self.M = None
+        self.Mup = None
+
+    def _call_M(self, M):
+        """
+        Computes the aliasing criterion directly from
+        the information matrices.
+
+        Parameters
+        ----------
+        M : np.array(3d or 4d)
+            The information matrices, optionally for a batch
+            of candidates in the first dimension.
+
+        Returns
+        -------
+        metric : float or np.array(1d)
+            The negative of the aliasing criterion value.
+        """
+        # Compute aliasing matrix
+        A = np.linalg.solve(
+            M[..., self.effects, :][..., self.effects], 
+            M[..., self.effects, :][..., self.alias]
+        )
+
+        # Multiply by weights
+        if self.W is not None:
+            A *= self.W
+
+        # Compute mean of SS
+        return -np.power(
+            np.mean(np.sum(np.square(A), axis=(-1, -2)), axis=-1), 
+            1/(M.shape[-1] * M.shape[-3])
+        )
+
+    def init(self, Y, X, params):
+        """
+        Initializes the information matrix 
+        when using update formulas.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The design matrix
+        X : np.array(2d)
+            The model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        """
+        if params.compute_update:
+            # Covariate expansion
+            _, X = self.cov(Y, X)
+
+            # Compute information matrix
+            self.M = X.T @ params.Vinv @ X
+
+    def update(self, Y, X, params, update):
+        """
+        Computes the update to the metric according to
+        `update`. The update to the metric is of the
+        form :math:`m_{new} = m_{old} + up`.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The updated design matrix
+        X : np.array(2d)
+            The updated model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state.
+
+        Returns
+        -------
+        up : float
+            The update to the metric.
+        """
+        if not params.compute_update:
+            return super().update(Y, X, params, update)
+
+        # Compute the update to the information matrix
+        U, Dinv = self._compute_update_UD(Y, X, params, update)
+        self.Mup = info_update_UD(U, Dinv)
+
+        # Compute the new metric
+        try:
+            new_metric = self._call_M(self.M + self.Mup)
+        except np.linalg.LinAlgError as e:
+            # Infeasible design
+            return -np.inf
+
+        return new_metric - update.old_metric
+
+    def batch_update(self, Y, X, params, update, Xi_new):
+        """
+        Computes the updates to the metric for a batch of candidate
+        coordinates using the update formulas.
+        See :py:func:`Metric.batch_update <pyoptex.doe.fixed_structure.metric.Metric.batch_update>`.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The current design matrix
+        X : np.array(2d)
+            The current model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state, with a 2d array of
+            candidate coordinates.
+        Xi_new : np.array(3d)
+            The new runs of the model matrix for each candidate.
+
+        Returns
+        -------
+        up : np.array(1d)
+            The update to the metric for each candidate.
+        """
+        if not params.compute_update:
+            return super().batch_update(Y, X, params, update, Xi_new)
+
+        # Compute the updates to the information matrix
+        U, Dinv = self._batch_compute_update_UD(Y, X, params, update, Xi_new)
+        Mup = batch_info_update_UD(U, Dinv)
+
+        # Compute the new metrics
+        try:
+            metric_update = self._call_M(self.M + Mup) - update.old_metric
+        except np.linalg.LinAlgError as e:
+            # Evaluate each candidate separately
+            metric_update = np.zeros(len(Mup), dtype=np.float64)
+            for i in range(len(Mup)):
+                try:
+                    metric_update[i] = self._call_M(self.M + Mup[i]) - update.old_metric
+                except np.linalg.LinAlgError as e:
+                    # Infeasible design
+                    metric_update[i] = -np.inf
+
+        return metric_update
+
+    def accepted(self, Y, X, params, update):
+        """
+        Updates the internal M attribute
+        according to the last computed update.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The updated design matrix
+        X : np.array(2d)
+            The updated model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.utils.Update>`
+            The update being applied to the state.
+        """
+        if params.compute_update:
+            # Update M
+            self.M += self.Mup
 
     def call(self, Y, X, params):
         """
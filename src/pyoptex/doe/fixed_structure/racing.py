@@ -0,0 +1,103 @@
+"""
+Module for racing the random starts of the coordinate-exchange algorithms.
+"""
+
+import numpy as np
+
+
+class Race:
+    """
+    Abandons random starts of the coordinate-exchange algorithm
+    which can no longer plausibly beat the best design found so far.
+
+    The metric is recorded after every full pass of a random start. Once
+    `min_tries` random starts have completed, a random start with metric
+    :math:`m_k` after k passes is abandoned if
+
+    .. math::
+
+        m_k + (1 + margin) \\cdot \\max_j (m^j_{final} - m^j_k) < m_{best}
+
+    where the maximum is taken over the completed random starts j, i.e., even
+    the largest improvement after k passes of any completed random start,
+    increased by the margin, does not reach the best metric.
+
+    .. note::
+        When distributing the random starts over multiple processes,
+        each process only observes its own completed random starts.
+
+    Attributes
+    ----------
+    min_tries : int
+        The number of completed random starts before abandoning any.
+    margin : float
+        The relative margin on the largest observed improvement.
+    trajectories : list(np.array(1d))
+        The metric after each pass of the completed random starts,
+        starting from the initial design.
+    best : float
+        The best metric of any random start.
+    """
+
+    def __init__(self, min_tries=5, margin=0.5):
+        """
+        Creates the race.
+
+        Parameters
+        ----------
+        min_tries : int
+            The number of completed random starts before abandoning any.
+        margin : float
+            The relative margin on the largest observed improvement.
+        """
+        assert min_tries > 0, 'Must complete at least one random start before racing'
+        assert margin >= 0, 'The margin must be positive'
+        self.min_tries = min_tries
+        self.margin = margin
+        self.trajectories = []
+        self.best = -np.inf
+
+    def add(self, trajectory, completed=True):
+        """
+        Adds a finished random start to the race.
+
+        Parameters
+        ----------
+        trajectory : list(float) or np.array(1d)
+            The metric after each pass, starting from the initial design.
+        completed : bool
+            Whether the random start ran until convergence. Only
+            completed random starts are used to bound the improvements.
+        """
+        trajectory = np.asarray(trajectory, dtype=np.float64)
+        if np.isfinite(trajectory[-1]):
+            self.best = max(self.best, trajectory[-1])
+            if completed:
+                self.trajectories.append(trajectory)
+
+    def abandon(self, k, metric):
+        """
+        Determines whether to abandon a random start.
+
+        Parameters
+        ----------
+        k : int
+            The number of passes of the random start.
+        metric : float
+            The metric of the random start after k passes.
+
+        Returns
+        -------
+        abandon : bool
+            Whether the random start can no longer plausibly beat the best design.
+        """
+        # Require sufficient completed random starts
+        if len(self.trajectories) < self.min_tries or not np.isfinite(metric):
+            return False
+
+        # Largest improvement after k passes
+        gain = max(t[-1] - t[min(k, len(t) - 1)] for t in self.trajectories)
+        if not np.isfinite(gain):
+            return False
+
+        return metric + (1 + self.margin) * gain < self.best
@@ -6,7 +6,7 @@ import numba
 import numpy as np
 
 
-@numba.njit
+@numba.njit(cache=True)
 def compute_update_UD(
         level, grp, Xi_old, X, 
         plot_sizes, c, thetas, thetas_inv
@@ -127,7 +127,7 @@ def compute_update_UD(
     # Return values
     return U, D
 
-@numba.njit
+@numba.njit(cache=True)
 def det_update_UD(U, D, Minv):
     """
     Compute the determinant adjustment as a factor.
@@ -176,7 +176,7 @@ def det_update_UD(U, D, Minv):
     # Compute determinant update
     return updates, P
 
-@numba.njit
+@numba.njit(cache=True)
 def inv_update_UD(U, D, Minv, P):
     """
     Compute the update of the inverse of the information matrix.
@@ -219,7 +219,7 @@ def inv_update_UD(U, D, Minv, P):
         Mup[i] = (MU) @ np.linalg.solve(P[i], MU.T)
     return Mup
 
-@numba.njit
+@numba.njit(cache=True)
 def inv_update_UD_no_P(U, D, Minv):
     """
     See :py:func:`inv_update_UD <pyoptex.doe.splitk_plot.formulas.inv_update_UD>`,
@@ -233,3 +233,114 @@ def inv_update_UD_no_P(U, D, Minv):
             P[j, i, i] += 1/D[j, i]
     
     return inv_update_UD(U, D, Minv, P)
+
+@numba.njit(cache=True)
+def batch_compute_update_UD(
+        level, grp, Xi_old, Xi_new, X,
+        plot_sizes, c, thetas, thetas_inv
+    ):
+    """
+    Compute the updates to the information matrix for a batch
+    of candidate coordinates at once. See
+    :py:func:`compute_update_UD <pyoptex.doe.fixed_structure.splitk_plot.formulas.compute_update_UD>`.
+
+    Parameters
+    ----------
+    level: int
+        The stratum at which the update occurs (0 for the lowest).
+    grp : int
+        The group within this stratum for which the update occurs.
+    Xi_old : np.array(2d)
+        The old runs before the update.
+    Xi_new : np.array(3d)
+        The new runs for each candidate.
+    X : np.array(2d)
+        The current design matrix X (before the update).
+    plot_sizes : np.array(1d)
+        The size of each stratum b_i.
+    c : np.array(2d)
+        The coefficients c (every row specifies one set of a priori variance ratios). 
+        The second dimension is added for Bayesian approaches.
+    thetas : np.array(1d)
+        The array of thetas.
+        thetas = np.cumprod(np.concatenate((np.array([1]), plot_sizes)))
+    thetas_inv : np.array(1d)
+        The array of 1/thetas.
+        thetas_inv = np.cumsum(np.concatenate((np.array([0], dtype=np.float64), 1/thetas[1:])))
+
+    Returns
+    -------
+    U : np.array(3d)
+        The U-matrix of the update for each candidate.
+    D : np.array(3d)
+        The diagonal D-matrices of the update for each candidate.
+    """
+    # Runs of the update
+    jmp = thetas[level]
+    runs = slice(grp*jmp, (grp+1)*jmp)
+
+    # Compute the first candidate
+    X = np.copy(X)
+    X[runs] = Xi_new[0]
+    U0, D0 = compute_update_UD(
+        level, grp, Xi_old, X, plot_sizes, c, thetas, thetas_inv
+    )
+
+    # Initialize U and D
+    U = np.zeros((len(Xi_new),) + U0.shape)
+    D = np.zeros((len(Xi_new),) + D0.shape)
+    U[0] = U0
+    D[0] = D0
+
+    # Compute the other candidates
+    for i in range(1, len(Xi_new)):
+        X[runs] = Xi_new[i]
+        Ui, Di = compute_update_UD(
+            level, grp, Xi_old, X, plot_sizes, c, thetas, thetas_inv
+        )
+        U[i] = Ui
+        D[i] = Di
+
+    return U, D
+
+@numba.njit(cache=True)
+def batch_det_update_UD(U, D, Minv):
+    """
+    See :py:func:`det_update_UD <pyoptex.doe.fixed_structure.splitk_plot.formulas.det_update_UD>`,
+    but for a batch of candidates as computed by
+    :py:func:`batch_compute_update_UD <pyoptex.doe.fixed_structure.splitk_plot.formulas.batch_compute_update_UD>`.
+
+    Returns
+    -------
+    alpha : np.array(2d)
+        The update factor for each candidate and each set of a-priori variance ratios.
+    P : np.array(4d)
+        The P matrix of the update for each candidate.
+    """
+    P = np.zeros((len(U), D.shape[1], D.shape[2], D.shape[2]))
+    updates = np.zeros((len(U), D.shape[1]), dtype=np.float64)
+    for i in range(len(U)):
+        du, Pi = det_update_UD(U[i], D[i], Minv)
+        updates[i] = du
+        P[i] = Pi
+    return updates, P
+
+@numba.njit(cache=True)
+def batch_inv_update_UD(U, D, Minv, P, valid):
+    """
+    See :py:func:`inv_update_UD <pyoptex.doe.fixed_structure.splitk_plot.formulas.inv_update_UD>`,
+    but for a batch of candidates as computed by
+    :py:func:`batch_compute_update_UD <pyoptex.doe.fixed_structure.splitk_plot.formulas.batch_compute_update_UD>`.
+    Only the `valid` candidates are computed, the others remain zero.
+
+    Returns
+    -------
+    Mup : np.array(4d)
+        The updates to the inverses of the information
+        matrices for each candidate.
+    """
+    Mup = np.zeros((len(U),) + Minv.shape)
+    for i in range(len(U)):
+        if valid[i]:
+            Mup[i] = inv_update_UD(U[i], D[i], Minv, P[i])
+    return Mup
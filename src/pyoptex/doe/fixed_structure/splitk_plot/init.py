@@ -11,7 +11,7 @@ from ....utils.numba import numba_all_axis1
 from ....utils.design import encode_design
 
 
-@numba.njit
+@numba.njit(cache=True)
 def __init_unconstrained(effect_types, effect_levels, grps, thetas, 
                          coords, Y, complete=False):
     """
@@ -104,6 +104,7 @@ def __init_unconstrained(effect_types, effect_levels, grps, thetas,
 
     return Y
 
+# Not cached, as the signature contains the (process specific) constraints function
 @numba.njit
 def __correct_constraints(effect_types, effect_levels, grps, thetas, coords, 
                           plot_sizes, constraints, Y, complete=False):
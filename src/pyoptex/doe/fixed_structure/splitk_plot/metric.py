@@ -7,13 +7,15 @@ import warnings
 import numpy as np
 
 from ..metric import (
+    Metric,
     Dopt as Dopto, 
     Aopt as Aopto, 
     Iopt as Iopto,
     Aliasing as Aliasingo,
 )
 from .formulas import (compute_update_UD, det_update_UD, inv_update_UD,
-                       inv_update_UD_no_P)
+                       inv_update_UD_no_P, batch_compute_update_UD, 
+                       batch_det_update_UD, batch_inv_update_UD)
 
 
 class SplitkPlotMetricMixin:
@@ -119,6 +121,67 @@ class SplitkPlotMetricMixin:
 
         return metric_update
 
+    def _batch_update(self, Y, X, params, update, Xi_new):
+        """
+        Computes the updates to the metric for a batch of
+        candidate coordinates. This is
+        only called for when applying update formulas.
+        By default, :py:func:`_update <pyoptex.doe.fixed_structure.splitk_plot.metric.SplitkPlotMetricMixin._update>`
+        is called for each candidate.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The current design matrix
+        X : np.array(2d)
+            The current model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.splitk_plot.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.splitk_plot.utils.Update>`
+            The update being applied to the state, with a 2d array of
+            candidate coordinates.
+        Xi_new : np.array(3d)
+            The new runs of the model matrix for each candidate.
+
+        Returns
+        -------
+        up : np.array(1d)
+            The update to the metric for each candidate.
+        """
+        return Metric.batch_update(self, Y, X, params, update, Xi_new)
+
+    def batch_update(self, Y, X, params, update, Xi_new):
+        """
+        Computes the updates to the metric for a batch of
+        candidate coordinates of a single factor and group.
+        See :py:func:`Metric.batch_update <pyoptex.doe.fixed_structure.metric.Metric.batch_update>`.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The current design matrix
+        X : np.array(2d)
+            The current model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.splitk_plot.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.splitk_plot.utils.Update>`
+            The update being applied to the state, with a 2d array of
+            candidate coordinates.
+        Xi_new : np.array(3d)
+            The new runs of the model matrix for each candidate.
+
+        Returns
+        -------
+        up : np.array(1d)
+            The update to the metric for each candidate.
+        """
+        if params.compute_update:
+            # Use update formulas
+            return self._batch_update(Y, X, params, update, Xi_new)
+
+        # Compute from scratch
+        return Metric.batch_update(self, Y, X, params, update, Xi_new)
+
     def _accepted(self, Y, X, params, update):
         """
         Updates the internal state when the updated
@@ -251,7 +314,7 @@ class Dopt(SplitkPlotMetricMixin, Dopto):
 
         # Compute change in determinant
         du, self.P = det_update_UD(self.U, self.D, self.Minv)
-        if du > 0:
+        if np.all(du > 0):
             # Compute power
             duu = np.power(np.prod(du), 1/(X.shape[1] * len(self.Minv)))
 
@@ -262,6 +325,92 @@ class Dopt(SplitkPlotMetricMixin, Dopto):
 
         return metric_update
 
+    def _batch_update(self, Y, X, params, update, Xi_new):
+        """
+        Computes the updates to the metric for a batch of
+        candidate coordinates using the update formulas.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The current design matrix
+        X : np.array(2d)
+            The current model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.splitk_plot.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.splitk_plot.utils.Update>`
+            The update being applied to the state, with a 2d array of
+            candidate coordinates.
+        Xi_new : np.array(3d)
+            The new runs of the model matrix for each candidate.
+
+        Returns
+        -------
+        up : np.array(1d)
+            The update to the metric for each candidate.
+        """
+        # Compute U, D updates
+        X, Xi_old, Xi_new = self._batch_cov(Y, X, update, Xi_new)
+        U, D = batch_compute_update_UD(
+            update.level, update.grp, Xi_old, Xi_new, X,
+            params.plot_sizes, params.c, params.thetas, params.thetas_inv
+        )
+
+        # Compute change in determinant
+        du, _ = batch_det_update_UD(U, D, self.Minv)
+        valid = np.all(du > 0, axis=1)
+
+        # Compute power
+        duu = np.power(
+            np.prod(np.where(valid[:, np.newaxis], du, 1), axis=1), 
+            1/(X.shape[1] * len(self.Minv))
+        )
+
+        # Return update as addition
+        metric_update = np.where(valid, (duu - 1) * update.old_metric, -update.old_metric)
+
+        return metric_update
+
+    def batch_det(self, Y, X, params, update, Xi_new):
+        """
+        Computes the product of the determinants of the information
+        matrices for a batch of candidate coordinates, up to a positive factor.
+        See :py:func:`Dopt.batch_det <pyoptex.doe.fixed_structure.metric.Dopt.batch_det>`.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The current design matrix
+        X : np.array(2d)
+            The current model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.splitk_plot.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.splitk_plot.utils.Update>`
+            The update being applied to the state, with a 2d array of
+            candidate coordinates.
+        Xi_new : np.array(3d)
+            The new runs of the model matrix for each candidate.
+
+        Returns
+        -------
+        dets : np.array(1d)
+            The (scaled) product of the determinants for each candidate.
+        """
+        if not params.compute_update:
+            # Compute from scratch
+            return Dopto.batch_det(self, Y, X, params, update, Xi_new)
+
+        # Compute U, D updates
+        X, Xi_old, Xi_new = self._batch_cov(Y, X, update, Xi_new)
+        U, D = batch_compute_update_UD(
+            update.level, update.grp, Xi_old, Xi_new, X,
+            params.plot_sizes, params.c, params.thetas, params.thetas_inv
+        )
+
+        # Compute change in determinant
+        du, _ = batch_det_update_UD(U, D, self.Minv)
+        return np.prod(du, axis=1)
+
     def _accepted(self, Y, X, params, update):
         """
         Updates the internal Minv attribute
@@ -397,6 +546,64 @@ class Aopt(SplitkPlotMetricMixin, Aopto):
 
         return metric_update
 
+    def _batch_update(self, Y, X, params, update, Xi_new):
+        """
+        Computes the updates to the metric for a batch of
+        candidate coordinates using the update formulas.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The current design matrix
+        X : np.array(2d)
+            The current model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.splitk_plot.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.splitk_plot.utils.Update>`
+            The update being applied to the state, with a 2d array of
+            candidate coordinates.
+        Xi_new : np.array(3d)
+            The new runs of the model matrix for each candidate.
+
+        Returns
+        -------
+        up : np.array(1d)
+            The update to the metric for each candidate.
+        """
+        # Compute U, D updates
+        X, Xi_old, Xi_new = self._batch_cov(Y, X, update, Xi_new)
+        U, D = batch_compute_update_UD(
+            update.level, update.grp, Xi_old, Xi_new, X,
+            params.plot_sizes, params.c, params.thetas, params.thetas_inv
+        )
+
+        # Detect singular designs by the change in determinant
+        du, P = batch_det_update_UD(U, D, self.Minv)
+        valid = np.all(du >= self.singular_eps, axis=1)
+
+        # Compute updates to Minv
+        try:
+            Mup = batch_inv_update_UD(U, D, self.Minv, P, valid)
+        except np.linalg.LinAlgError as e:
+            # Evaluate each candidate separately
+            return Metric.batch_update(self, Y, X, params, update, Xi_new)
+
+        # Extract variances
+        diag = np.diagonal(Mup, axis1=-2, axis2=-1)
+
+        # Weight
+        if self.W is not None:
+            diag = diag * self.W
+
+        # Compute average
+        metric_update = np.mean(np.sum(diag, axis=-1), axis=-1)
+
+        # Infeasible or numerically unstable designs
+        metric_update[~valid] = -np.inf
+        metric_update[metric_update > -update.old_metric] = -np.inf
+
+        return metric_update
+
     def _accepted(self, Y, X, params, update):
         """
         Updates the internal Minv attribute
@@ -425,8 +632,9 @@ class Iopt(SplitkPlotMetricMixin, Iopto):
     ----------
     moments : np.array(2d)
         The moments matrix.
-    samples : np.array(2d)
-        The covariate expanded samples for the moments matrix.
+    samples : None or np.array(2d)
+        The covariate expanded samples for the moments matrix, or None
+        if the moments matrix is computed exactly.
     n : int
         The number of samples.
     Minv : np.array(3d)
@@ -434,7 +642,7 @@ class Iopt(SplitkPlotMetricMixin, Iopto):
     Mup : np.array(3d)
         The update to the inverse of the information matrix. Used as a cache.
     """
-    def __init__(self, n=10000, cov=None, complete=True):
+    def __init__(self, n=10000, cov=None, complete=True, exact=True, qmc=True, tol=None):
         """
         Creates the metric
 
@@ -448,8 +656,17 @@ class Iopt(SplitkPlotMetricMixin, Iopto):
             Whether to only use the coordinates or completely
             randomly initialize the samples to generate the
             moments matrix.
-        """
-        super().__init__(n, cov, complete)
+        exact : bool
+            Whether to compute the moments matrix exactly for
+            polynomial models without constraints or covariates, see
+            :py:func:`exact_moments <pyoptex.doe.utils.moments.exact_moments>`.
+        qmc : bool
+            Whether to draw the samples from scrambled Sobol sequences
+            instead of independent random runs.
+        tol : None or float
+            The required standard error of the elements of the moments matrix.
+        """
+        super().__init__(n, cov, complete, exact, qmc, tol)
         self.Minv = None
         self.Mup = None
 
@@ -526,6 +743,57 @@ class Iopt(SplitkPlotMetricMixin, Iopto):
 
         return metric_update
 
+    def _batch_update(self, Y, X, params, update, Xi_new):
+        """
+        Computes the updates to the metric for a batch of
+        candidate coordinates using the update formulas.
+
+        Parameters
+        ----------
+        Y : np.array(2d)
+            The current design matrix
+        X : np.array(2d)
+            The current model matrix
+        params : :py:class:`Parameters <pyoptex.doe.fixed_structure.splitk_plot.utils.Parameters>`
+            The optimization parameters.
+        update : :py:class:`Update <pyoptex.doe.fixed_structure.splitk_plot.utils.Update>`
+            The update being applied to the state, with a 2d array of
+            candidate coordinates.
+        Xi_new : np.array(3d)
+            The new runs of the model matrix for each candidate.
+
+        Returns
+        -------
+        up : np.array(1d)
+            The update to the metric for each candidate.
+        """
+        # Compute U, D updates
+        X, Xi_old, Xi_new = self._batch_cov(Y, X, update, Xi_new)
+        U, D = batch_compute_update_UD(
+            update.level, update.grp, Xi_old, Xi_new, X,
+            params.plot_sizes, params.c, params.thetas, params.thetas_inv
+        )
+
+        # Detect singular designs by the change in determinant
+        du, P = batch_det_update_UD(U, D, self.Minv)
+        valid = np.all(du >= self.singular_eps, axis=1)
+
+        # Compute updates to Minv
+        try:
+            Mup = batch_inv_update_UD(U, D, self.Minv, P, valid)
+        except np.linalg.LinAlgError as e:
+            # Evaluate each candidate separately
+            return Metric.batch_update(self, Y, X, params, update, Xi_new)
+
+        # Compute update to metric (double negation with update)
+        metric_update = np.mean(np.sum(Mup * self.moments.T, axis=(-2, -1)), axis=-1)
+
+        # Infeasible or numerically unstable designs
+        metric_update[~valid] = -np.inf
+        metric_update[metric_update > -update.old_metric] = -np.inf
+
+        return metric_update
+
     def _accepted(self, Y, X, params, update):
         """
         Updates the internal Minv attribute
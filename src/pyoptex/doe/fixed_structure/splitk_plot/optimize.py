@@ -2,17 +2,20 @@
 Module for the split^k-plot coordinate-exchange algorithm.
 """
 
-import numpy as np
+import time
 import warnings
 
-from ...._profile import profile
+import numpy as np
+
+from ...._profile import profile, count_evaluations
 from ..validation import validate_state
 from ..utils import State
+from ..continuous import optimal_coords
 from .utils import Update
 
 
 @profile
-def optimize(params, max_it=10000, validate=False, eps=1e-4):
+def optimize(params, max_it=10000, validate=False, eps=1e-4, deadline=None, race=None):
     """
     Optimize a model iteratively using the coordinate-exchange algorithm.
     Only specific groups at each level are updated to allow design augmentation.
@@ -28,6 +31,12 @@ def optimize(params, max_it=10000, validate=False, eps=1e-4):
         to debug.
     eps : float
         A relative increase of at least epsilon is required to accept the change.
+    deadline : None or float
+        The time, as a timestamp of `time.time()`, at which to stop
+        the optimization and return the current design.
+    race : None or :py:class:`Race <pyoptex.doe.fixed_structure.racing.Race>`
+        The race with the other random starts. The optimization is
+        abandoned after a pass when it can no longer plausibly beat the best design.
 
     Returns
     -------
@@ -42,11 +51,24 @@ def optimize(params, max_it=10000, validate=False, eps=1e-4):
     # Initialization
     params.fn.metric.init(Y, X, params)
     metric = params.fn.metric.call(Y, X, params)
+    count_evaluations()
     state = State(Y, X, metric)
     if validate:
         validate_state(state, params)
 
+    # Index the feasibility of each run
+    feasibility = params.fn.feasibility
+    if feasibility is not None:
+        idx = feasibility.index(Y)
+    else:
+        idx = np.full(len(Y), -1, dtype=np.int64)
+
     # Make sure we are not stuck in finite loop
+    expired = False
+    params.stats['it'] = 0
+    params.stats['converged'] = False
+    params.stats['abandoned'] = False
+    params.stats['trajectory'] = [state.metric]
     for it in range(max_it):
         # Start with updated false
         updated = False
@@ -61,71 +83,117 @@ def optimize(params, max_it=10000, validate=False, eps=1e-4):
             # Loop over all run-groups
             for grp in params.grps[i]:
 
-                # Generate coordinates
-                possible_coords = params.coords[i]
+                # Stop at the deadline
+                if deadline is not None and time.time() >= deadline:
+                    expired = True
+                    break
+
+                # Extract the columns and runs
                 cols = slice(params.colstart[i], params.colstart[i+1])
                 runs = slice(grp*jmp, (grp+1)*jmp)
 
-                # Extract current coordinate (as best)
+                # Extract current coordinate
                 Ycoord = np.copy(state.Y[runs.start, cols])
                 Xrows = np.copy(state.X[runs])
-                co = Ycoord
-
-                # Loop over possible new coordinates
-                for new_coord in possible_coords:
-
-                    # Short-circuit original coordinates
-                    if np.any(new_coord != co):
-
-                        # Check validity of new coordinates
-                        state.Y[runs, cols] = new_coord
-
-                        # Validate whether to check the coordinate
-                        if not np.any(params.fn.constraints(state.Y[runs])):
-                            # Update the X
-                            state.X[runs] = params.fn.Y2X(state.Y[runs])
-
-                            # Check if the update is accepted
-                            update = Update(level, grp, runs, cols, new_coord, Ycoord, Xrows, state.metric)
-                            up = params.fn.metric.update(state.Y, state.X, params, update)
+                update = Update(level, grp, runs, cols, None, Ycoord, Xrows, state.metric)
 
-                            # New best design
-                            if ((state.metric == 0 or np.isinf(state.metric)) and up > 0) or up / np.abs(state.metric) > eps:
-                                # Mark the metric as accepted
-                                params.fn.metric.accepted(state.Y, state.X, params, update)
-
-                                # Store the best coordinates
-                                Ycoord = new_coord
-                                Xrows = np.copy(state.X[runs])
-                                if np.isinf(up):
-                                    metric = params.fn.metric.call(state.Y, state.X, params)
-                                else:
-                                    metric = state.metric + up
-                                state = State(state.Y, state.X, metric)
-
-                                # Validate the state
-                                if validate:
-                                    validate_state(state, params)
-
-                                # Set update
-                                updated = True
-
-                    # Set the correct coordinates
-                    state.Y[runs, cols] = Ycoord
-                    state.X[runs] = Xrows
+                # Generate coordinates
+                if params.cont_degrees[i] >= 0:
+                    possible_coords = optimal_coords(
+                        state.Y, state.X, params, update, 
+                        params.cont_degrees[i], params.coords[i]
+                    )
+                else:
+                    possible_coords = params.coords[i]
+
+                # Short-circuit original coordinates
+                candidates = np.any(possible_coords != Ycoord, axis=1)
+
+                # Lookup the feasible coordinates
+                lookup = params.cont_degrees[i] < 0 and np.all(idx[runs] >= 0)
+                if lookup:
+                    candidates &= np.all(feasibility.feasible(idx[runs], i), axis=0)
+
+                # Generate all candidate runs
+                new_coords = possible_coords[candidates]
+                Yc = np.repeat(np.expand_dims(state.Y[runs], 0), len(new_coords), axis=0)
+                Yc[:, :, cols] = np.expand_dims(new_coords, 1)
+
+                # Validate which coordinates to check
+                if not lookup:
+                    feasible = ~np.any(
+                        params.fn.constraints(Yc.reshape(-1, Yc.shape[-1])).reshape(Yc.shape[:2]), 
+                        axis=1
+                    )
+                    new_coords, Yc = new_coords[feasible], Yc[feasible]
+
+                if len(new_coords) > 0:
+                    # Compute the X of all candidates
+                    Xc = params.fn.Y2X(Yc.reshape(-1, Yc.shape[-1]))
+                    Xc = Xc.reshape(*Yc.shape[:2], Xc.shape[-1])
+
+                    # Compute the updates of all candidates
+                    update = update._replace(new_coord=new_coords)
+                    ups = params.fn.metric.batch_update(state.Y, state.X, params, update, Xc)
+                    count_evaluations(len(new_coords))
+                    ups[np.isnan(ups)] = -np.inf
+
+                    # Select the best candidate
+                    best = np.argmax(ups)
+                    up = ups[best]
+
+                    # New best design
+                    if ((state.metric == 0 or np.isinf(state.metric)) and up > 0) or up / np.abs(state.metric) > eps:
+                        # Apply the best candidate
+                        state.Y[runs, cols] = new_coords[best]
+                        state.X[runs] = Xc[best]
+                        update = update._replace(new_coord=new_coords[best])
+                        if feasibility is not None:
+                            idx[runs] = feasibility.index(state.Y[runs])
+
+                        # Mark the metric as accepted
+                        up = params.fn.metric.update(state.Y, state.X, params, update)
+                        params.fn.metric.accepted(state.Y, state.X, params, update)
+
+                        # Store the new metric
+                        if np.isinf(up):
+                            metric = params.fn.metric.call(state.Y, state.X, params)
+                            count_evaluations()
+                        else:
+                            metric = state.metric + up
+                        state = State(state.Y, state.X, metric)
+
+                        # Set update
+                        updated = True
 
                 # Validate the state
                 if validate:
                     validate_state(state, params)
+
+            if expired:
+                break
             
         # Recompute metric for numerical stability
         old_metric = state.metric
         state = state._replace(metric=params.fn.metric.call(state.Y, state.X, params))
-        if ((state.metric == 0 and old_metric > 0) or (np.isinf(state.metric) and ~np.isinf(state.metric))) and params.compute_update:
+        count_evaluations()
+        if ((state.metric == 0 and old_metric > 0) or (np.isinf(state.metric) and not np.isinf(old_metric))) and params.compute_update:
             warnings.warn('Update formulas are very unstable for this problem, try rerunning without update formulas', RuntimeWarning)
             
         # Stop if nothing updated for an entire iteration
+        params.stats['it'] = it + 1
+        params.stats['trajectory'].append(state.metric)
         if not updated:
+            params.stats['converged'] = not expired
+            break
+
+        # Stop at the deadline
+        if expired:
+            break
+
+        # Abandon an unpromising random start
+        if race is not None and race.abandon(it + 1, state.metric):
+            params.stats['abandoned'] = True
             break
 
     validate_state(state, params)
@@ -5,11 +5,13 @@ Module for the interface to run the split^k-plot algorithm
 import numpy as np
 import pandas as pd
 from numba.typed import List
-from tqdm import tqdm
 
 from ...constraints import no_constraints, mixture_constraints
 from ....utils.design import decode_design
+from ...utils.parallel import optimize_tries
 from ..utils import Factor, FunctionSet, State
+from ..continuous import poly_degrees
+from ..racing import Race
 from .init import initialize_feasible
 from .optimize import optimize
 from .utils import (Parameters, Plot, extend_design, level_grps, obs_var, obs_var_Zs)
@@ -92,9 +94,12 @@ def default_fn(factors, metric, Y2X, constraints=no_constraints, init=initialize
     if constraints is None:
         constraints = no_constraints
 
-    return FunctionSet(metric, Y2X, constraints.encode(), constraints.func(), init)
+    return FunctionSet(
+        metric, Y2X, constraints.encode(), constraints.func(), init,
+        constraints.feasibility(factors)
+    )
 
-def create_parameters(factors, fn, prior=None, grps=None, use_formulas=True):
+def create_parameters(factors, fn, prior=None, grps=None, use_formulas=True, continuous=False):
     """
     Creates the parameters object by preprocessing the inputs. 
     This is a utility function to transform each variable 
@@ -115,6 +120,13 @@ def create_parameters(factors, fn, prior=None, grps=None, use_formulas=True):
         for that factor.
     use_formulas : bool
         Whether to use the internal update formulas or not.
+    continuous : bool
+        Whether to optimize the continuous factors over the entire
+        interval rather than over their coordinates. Only supported by
+        the D-optimality criterion. Factors with explicit levels, mixture
+        components and factors for which the model is not polynomial
+        remain optimized over their coordinates. See
+        :py:func:`optimal_coords <pyoptex.doe.fixed_structure.continuous.optimal_coords>`.
 
     Returns
     -------
@@ -177,6 +189,13 @@ def create_parameters(factors, fn, prior=None, grps=None, use_formulas=True):
         np.cumsum(np.where(effect_types == 1, effect_types, effect_types - 1))
     ))
 
+    # Detect the polynomial degree of each continuous factor
+    if continuous:
+        assert hasattr(fn.metric, 'batch_det'), 'Continuous coordinates are only supported by the D-optimality criterion'
+        cont_degrees = poly_degrees(factors, fn.Y2X, colstart)
+    else:
+        cont_degrees = -np.ones(len(factors), dtype=np.int64)
+
     # Alphas and thetas
     alphas = np.cumprod(plot_sizes[::-1])[::-1]
     thetas = np.cumprod(np.concatenate((np.array([1]), plot_sizes)))
@@ -248,13 +267,15 @@ def create_parameters(factors, fn, prior=None, grps=None, use_formulas=True):
     # Create the parameters
     params = Parameters(
         fn, factors, nruns, effect_types, effect_levels, grps, ratios, 
-        coords, prior, colstart, Zs, Vinv, plot_sizes, cs, alphas, thetas, thetas_inv,
-        use_formulas
+        coords, prior, colstart, Zs, Vinv, use_formulas, cont_degrees, {},
+        plot_sizes, cs, alphas, thetas, thetas_inv
     )
     
     return params
 
-def create_splitk_plot_design(params, n_tries=10, max_it=10000, validate=False):
+def create_splitk_plot_design(params, n_tries=10, max_it=10000, validate=False,
+                              n_jobs=1, seed=None, time_budget=None,
+                              racing=False):
     """
     Creates an optimal split^k-plot design using the parameters.
 
@@ -269,6 +290,28 @@ def create_splitk_plot_design(params, n_tries=10, max_it=10000, validate=False):
         coordinate-exchange algorithm. Prevents infinite loop scenario.
     validate : bool
         Whether to validate each state.
+    n_jobs : int
+        The number of processes over which to distribute the random starts.
+        -1 uses all available CPUs. Each process obtains its own copy
+        of the metric, as it keeps a mutable internal state.
+    seed : None or int
+        The master seed from which the seed of each random start is
+        generated. If None, it is drawn from the global numpy random state.
+        Without `racing` or a `time_budget`, the result is identical for any
+        number of jobs. With racing, each process races only its own random
+        starts. With a time budget, the number of completed random starts
+        depends on the timing.
+    time_budget : None or float
+        The wall-clock time in seconds after which to stop and return the 
+        best design found. A random start which is still running at that time
+        stops with its current design. No new random starts are launched once
+        the remaining time is shorter than their mean duration.
+        `n_tries` is the maximum number of random starts.
+    racing : bool
+        Whether to abandon the random starts which can no longer plausibly beat
+        the best design after a full pass, based on the improvements of the
+        completed random starts. See 
+        :py:class:`Race <pyoptex.doe.fixed_structure.racing.Race>`.
 
     Returns
     -------
@@ -278,25 +321,20 @@ def create_splitk_plot_design(params, n_tries=10, max_it=10000, validate=False):
     best_state : :py:class:`State <pyoptex.doe.fixed_structure.splitk_plot.utils.State>`
         The state corresponding to the returned design. 
         Contains the encoded design, model matrix, metric, etc.
+        The work performed is stored in `params.stats`: the number of
+        completed random starts (`n_tries`), the number of iterations (`its`) and
+        whether each random start converged (`converged`) or was 
+        abandoned (`abandoned`), and the elapsed time in seconds (`elapsed`).
     """
     assert n_tries > 0, 'Must specify at least one random initialization (n_tries > 0)'
     assert max_it > 0, 'Must specify at least one iteration of the coordinate-exchange per random initialization'
+    assert time_budget is None or time_budget > 0, 'The time budget must be positive'
 
-    # Pre initialize metric
-    params.fn.metric.preinit(params)
-
-    # Main loop
-    best_metric = -np.inf
-    best_state = None
-    for _ in tqdm(range(n_tries)):
-
-        # Optimize the design
-        Y, state = optimize(params, max_it, validate=validate)
-
-        # Store the results
-        if state.metric > best_metric:
-            best_metric = state.metric
-            best_state = State(np.copy(state.Y), np.copy(state.X), state.metric)
+    # Optimize the random starts
+    best_state = optimize_tries(
+        optimize, params, n_tries, max_it, validate, n_jobs, seed, 
+        time_budget, Race() if racing else None
+    )
 
     # Decode the design
     Y = decode_design(best_state.Y, params.effect_types, coords=params.coords)
@@ -7,9 +7,10 @@ import numpy as np
 
 from ...utils.factor import FactorMixin
 
-FunctionSet = namedtuple('FunctionSet', 'metric Y2X constraints constraintso init')
-Parameters = namedtuple('Parameters', 'fn factors nruns effect_types effect_levels grps ratios coords prior colstart Zs Vinv')
+FunctionSet = namedtuple('FunctionSet', 'metric Y2X constraints constraintso init feasibility', defaults=(None,))
+Parameters = namedtuple('Parameters', 'fn factors nruns effect_types effect_levels grps ratios coords prior colstart Zs Vinv compute_update cont_degrees stats')
 State = namedtuple('State', 'Y X metric')
+Update = namedtuple('Update', 'level grp runs cols new_coord old_coord Xi_old old_metric')
 
 __RandomEffect__ = namedtuple('__RandomEffect__', 'Z ratio', defaults=(None, 1))
 class RandomEffect(__RandomEffect__):
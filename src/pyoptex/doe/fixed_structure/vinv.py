@@ -0,0 +1,191 @@
+"""
+Module containing the structured inverse of the observation covariance matrix.
+"""
+
+import numpy as np
+from scipy import sparse
+
+
+class StructuredVinv:
+    """
+    The inverses of the observation covariance matrices
+    :math:`V = I + \\sum_l \\sigma_l Z_l Z_l^T` for each set of
+    a-priori variance ratios, without storing them as dense (N x N) matrices.
+
+    Denote by :math:`Z` the concatenation of all (sparse) grouping matrices,
+    with q columns in total, and by :math:`G` the diagonal matrix with
+    the corresponding variance ratios. By the Woodbury identity
+
+    .. math::
+
+        V^{-1} = I - Z K Z^T \\qquad K = G (I + Z^T Z G)^{-1}
+
+    Only the small (q x q) matrix K is stored for each set of a-priori
+    variance ratios. Any product with the model matrix reduces to per-group
+    sums of X, both for nested and crossed random effects.
+
+    The object supports the matrix multiplication operator from both sides
+    with a dense matrix, e.g., `X.T @ Vinv @ X`, returning one result
+    for each set of a-priori variance ratios.
+
+    Attributes
+    ----------
+    N : int
+        The number of runs.
+    Z : :py:class:`scipy.sparse.csr_array`
+        The (N x q) concatenated grouping matrices.
+    K : np.array(3d)
+        The (q x q) group-level matrices for each set of a-priori
+        variance ratios.
+    """
+    # Make sure numpy defers the matrix multiplications
+    __array_ufunc__ = None
+
+    def __init__(self, Zs, ratios, N):
+        """
+        Creates the structured inverse of the observation covariance matrices.
+
+        Parameters
+        ----------
+        Zs : list(np.array(1d))
+            The grouping of the runs for each random effect.
+        ratios : np.array(2d)
+            The variance ratios of each random effect (columns) for
+            every set of a-priori variance ratios (rows).
+        N : int
+            The number of runs.
+        """
+        ratios = np.asarray(ratios, dtype=np.float64)
+        assert ratios.ndim == 2 and ratios.shape[1] == len(Zs), 'Must specify the variance ratios of each random effect'
+        assert len(ratios) > 0, 'Must specify at least one set of a-priori variance ratios'
+
+        # Create the concatenated grouping matrix
+        ngrps = [int(np.max(Zi)) + 1 for Zi in Zs]
+        offsets = np.concatenate(([0], np.cumsum(ngrps, dtype=np.int64)))
+        q = int(offsets[-1])
+        rows = np.tile(np.arange(N), len(Zs))
+        cols = np.concatenate([np.asarray(Zi, dtype=np.int64) + o for Zi, o in zip(Zs, offsets)]) \
+                if len(Zs) > 0 else np.zeros(0, dtype=np.int64)
+        self.N = N
+        self.Z = sparse.csr_array((np.ones(len(rows)), (rows, cols)), shape=(N, q))
+
+        # Compute the group-level matrices
+        ZtZ = (self.Z.T @ self.Z).toarray()
+        self.K = np.zeros((len(ratios), q, q))
+        for j, r in enumerate(ratios):
+            g = np.repeat(r, ngrps)
+            self.K[j] = np.linalg.solve((np.eye(q) + ZtZ * g).T, np.diag(g)).T
+
+    @property
+    def shape(self):
+        """
+        The shape of the equivalent dense array.
+        """
+        return (len(self.K), self.N, self.N)
+
+    def __len__(self):
+        return len(self.K)
+
+    def __matmul__(self, B):
+        """
+        Computes :math:`V^{-1} B` for each set of a-priori variance ratios.
+
+        Parameters
+        ----------
+        B : np.array(2d)
+            The (N x p) matrix.
+
+        Returns
+        -------
+        VB : np.array(3d)
+            The (N x p) result for each set of a-priori variance ratios.
+        """
+        # No random effects
+        if self.Z.shape[1] == 0:
+            return np.broadcast_to(B, (len(self.K), *B.shape)).copy()
+
+        # Compute the group sums
+        KZtB = self.K @ (self.Z.T @ B)
+
+        # Expand the groups
+        ZKZtB = self.Z @ np.moveaxis(KZtB, 0, 1).reshape(KZtB.shape[1], -1)
+        ZKZtB = np.moveaxis(ZKZtB.reshape(self.N, len(self.K), -1), 1, 0)
+
+        return B - ZKZtB
+
+    def __rmatmul__(self, A):
+        """
+        Computes :math:`A V^{-1}` for each set of a-priori variance ratios.
+
+        Parameters
+        ----------
+        A : np.array(2d)
+            The (p x N) matrix.
+
+        Returns
+        -------
+        AV : np.array(3d)
+            The (p x N) result for each set of a-priori variance ratios.
+        """
+        return np.swapaxes(self @ np.ascontiguousarray(A.T), -2, -1)
+
+    def __getitem__(self, j):
+        """
+        Retrieves the dense inverse of the observation covariance
+        matrix for a single set of a-priori variance ratios.
+
+        Parameters
+        ----------
+        j : int
+            The index of the set of a-priori variance ratios.
+
+        Returns
+        -------
+        Vinv : np.array(2d)
+            The dense (N x N) inverse of the observation covariance matrix.
+        """
+        Z = self.Z.toarray()
+        return np.eye(self.N) - Z @ self.K[j] @ Z.T
+
+    def toarray(self):
+        """
+        Converts to the dense representation.
+
+        Returns
+        -------
+        Vinv : np.array(3d)
+            The dense inverses of the observation covariance matrices.
+        """
+        return np.array([self[j] for j in range(len(self))])
+
+    def rows(self, runs, X):
+        """
+        Computes the rows `runs` of the product :math:`V^{-1} X` and the
+        submatrix of :math:`V^{-1}` with both the rows and columns
+        in `runs`, as required by the update formulas.
+
+        Parameters
+        ----------
+        runs : np.array(1d)
+            The indices of the runs.
+        X : np.array(2d)
+            The model matrix.
+
+        Returns
+        -------
+        VX : np.array(3d)
+            The (r x p) product :math:`V^{-1}_{R,:} X` for each set of a-priori
+            variance ratios.
+        Vrr : np.array(3d)
+            The (r x r) submatrix :math:`V^{-1}_{R,R}` for each set of a-priori
+            variance ratios.
+        """
+        # Extract the groups of the runs
+        Zr = self.Z[runs].toarray()
+        ZrK = Zr @ self.K
+
+        # Compute the rows
+        VX = X[runs] - ZrK @ (self.Z.T @ X)
+        Vrr = np.eye(len(runs)) - ZrK @ Zr.T
+
+        return np.ascontiguousarray(VX), np.ascontiguousarray(Vrr)
@@ -4,16 +4,17 @@ Module for the interface to run the generic coordinate-exchange algorithm
 
 import numpy as np
 import pandas as pd
-import numba
 from numba.typed import List
-from tqdm import tqdm
-from threadpoolctl import threadpool_limits
 
 from ..constraints import no_constraints, mixture_constraints
-from ...utils.design import decode_design, obs_var_from_Zs
+from ...utils.design import decode_design
+from ..utils.parallel import optimize_tries
 from .utils import (Factor, RandomEffect, FunctionSet, State, Parameters)
 from .init import initialize_feasible
 from .optimize import optimize
+from .vinv import StructuredVinv
+from .continuous import poly_degrees
+from .racing import Race
 
 
 def default_fn(factors, metric, Y2X, constraints=None, init=initialize_feasible):
@@ -63,9 +64,13 @@ def default_fn(factors, metric, Y2X, constraints=None, init=initialize_feasible)
     if constraints is None:
         constraints = no_constraints
 
-    return FunctionSet(metric, Y2X, constraints.encode(), constraints.func(), init)
+    return FunctionSet(
+        metric, Y2X, constraints.encode(), constraints.func(), init,
+        constraints.feasibility(factors)
+    )
 
-def create_parameters(factors, fn, nruns, block_effects=(), prior=None, grps=None):
+def create_parameters(factors, fn, nruns, block_effects=(), prior=None, grps=None, use_formulas=True,
+                      continuous=False):
     """
     Creates the parameters object by preprocessing the inputs. 
     This is a utility function to transform each variable 
@@ -83,6 +88,15 @@ def create_parameters(factors, fn, nruns, block_effects=(), prior=None, grps=Non
         Not implemented yet.
     grps : None
         Not implemented yet.
+    use_formulas : bool
+        Whether to use the internal update formulas or not.
+    continuous : bool
+        Whether to optimize the continuous factors over the entire
+        interval rather than over their coordinates. Only supported by
+        the D-optimality criterion. Factors with explicit levels, mixture
+        components and factors for which the model is not polynomial
+        remain optimized over their coordinates. See
+        :py:func:`optimal_coords <pyoptex.doe.fixed_structure.continuous.optimal_coords>`.
 
     Returns
     -------
@@ -131,10 +145,10 @@ def create_parameters(factors, fn, nruns, block_effects=(), prior=None, grps=Non
 
         # Split regular and blocking ratios
         if nblocks == 0:
-            be_ratios = np.empty_like(ratios, shape=(0, ratios.shape[1]))
+            be_ratios = np.empty_like(ratios, shape=(ratios.shape[0], 0))
         else:
             be_ratios = ratios[:, -len(block_effects):]
-            ratios = ratios[:, :len(block_effects)]
+            ratios = ratios[:, :-len(block_effects)]
     else:
 
         # No blocking ratios
@@ -152,24 +166,27 @@ def create_parameters(factors, fn, nruns, block_effects=(), prior=None, grps=Non
         np.cumsum(np.where(effect_types == 1, effect_types, effect_types - 1))
     ))
 
+    # Detect the polynomial degree of each continuous factor
+    if continuous:
+        assert hasattr(fn.metric, 'batch_det'), 'Continuous coordinates are only supported by the D-optimality criterion'
+        cont_degrees = poly_degrees(factors, fn.Y2X, colstart)
+    else:
+        cont_degrees = -np.ones(len(factors), dtype=np.int64)
+
     # Compute Zs and Vinv
     if len(re) > 0:
         Zs = np.array([np.array(r.Z) for r in re], dtype=np.int64)
-        V = np.array([obs_var_from_Zs(Zs, N=nruns, ratios=r) for r in ratios])
     else:
         Zs = np.empty((0, 0), dtype=np.int64)
-        V = np.expand_dims(np.eye(nruns), 0)
-
-    # Augment V with the random blocking effects
-    if len(block_effects) > 0:
-        beZs = np.array([np.array(be.Z) for be in block_effects], dtype=np.int64)
-        V += np.array([
-            obs_var_from_Zs(beZs, N=nruns, ratios=r, include_error=False) 
-            for r in be_ratios
-        ])
-        
-    # Invert V
-    Vinv = np.linalg.inv(V)
+    beZs = [np.array(be.Z, dtype=np.int64) for be in block_effects]
+
+    # Create the structured inverse of V (including the random blocking effects)
+    if len(ratios) > 0:
+        Vinv = StructuredVinv(
+            list(Zs) + beZs, np.concatenate((ratios, be_ratios), axis=1), nruns
+        )
+    else:
+        Vinv = StructuredVinv([], np.empty((1, 0)), nruns)
         
     # Define which groups to optimize
     lgrps = [np.arange(nruns, dtype=np.int64)] + [np.arange(np.max(Z)+1) for Z in Zs]
@@ -178,12 +195,14 @@ def create_parameters(factors, fn, nruns, block_effects=(), prior=None, grps=Non
     # Create the parameters
     params = Parameters(
         fn, factors, nruns, effect_types, effect_levels, grps, ratios, 
-        coords, prior, colstart, Zs, Vinv
+        coords, prior, colstart, Zs, Vinv, use_formulas, cont_degrees, {}
     )
     
     return params
 
-def create_fixed_structure_design(params, n_tries=10, max_it=10000, validate=False):
+def create_fixed_structure_design(params, n_tries=10, max_it=10000, validate=False,
+                                  n_jobs=1, seed=None, time_budget=None,
+                                  racing=False):
     """
     Creates an optimal design for the specified factors, using the parameters.
 
@@ -198,6 +217,27 @@ def create_fixed_structure_design(params, n_tries=10, max_it=10000, validate=Fal
         coordinate-exchange algorithm. Prevents infinite loop scenario.
     validate : bool
         Whether to validate each state.
+    n_jobs : int
+        The number of processes over which to distribute the random starts.
+        -1 uses all available CPUs.
+    seed : None or int
+        The master seed from which the seed of each random start is
+        generated. If None, it is drawn from the global numpy random state.
+        Without `racing` or a `time_budget`, the result is identical for any
+        number of jobs. With racing, each process races only its own random
+        starts. With a time budget, the number of completed random starts
+        depends on the timing.
+    time_budget : None or float
+        The wall-clock time in seconds after which to stop and return the 
+        best design found. A random start which is still running at that time
+        stops with its current design. No new random starts are launched once
+        the remaining time is shorter than their mean duration.
+        `n_tries` is the maximum number of random starts.
+    racing : bool
+        Whether to abandon the random starts which can no longer plausibly beat
+        the best design after a full pass, based on the improvements of the
+        completed random starts. See 
+        :py:class:`Race <pyoptex.doe.fixed_structure.racing.Race>`.
 
     Returns
     -------
@@ -207,28 +247,20 @@ def create_fixed_structure_design(params, n_tries=10, max_it=10000, validate=Fal
     best_state : :py:class:`State <pyoptex.doe.fixed_structure.utils.State>`
         The state corresponding to the returned design. 
         Contains the encoded design, model matrix, metric, etc.
+        The work performed is stored in `params.stats`: the number of
+        completed random starts (`n_tries`), the number of iterations (`its`) and
+        whether each random start converged (`converged`) or was 
+        abandoned (`abandoned`), and the elapsed time in seconds (`elapsed`).
     """
     assert n_tries > 0, 'Must specify at least one random initialization (n_tries > 0)'
     assert max_it > 0, 'Must specify at least one iteration of the coordinate-exchange per random initialization'
+    assert time_budget is None or time_budget > 0, 'The time budget must be positive'
 
-    numba.set_num_threads(1)
-    with threadpool_limits(limits=1, user_api='blas'):
-
-        # Pre initialize metric
-        params.fn.metric.preinit(params)
-
-        # Main loop
-        best_metric = -np.inf
-        best_state = None
-        for _ in tqdm(range(n_tries)):
-
-            # Optimize the design
-            Y, state = optimize(params, max_it, validate=validate)
-
-            # Store the results
-            if state.metric > best_metric:
-                best_metric = state.metric
-                best_state = State(np.copy(state.Y), np.copy(state.X), state.metric)
+    # Optimize the random starts
+    best_state = optimize_tries(
+        optimize, params, n_tries, max_it, validate, n_jobs, seed, 
+        time_budget, Race() if racing else None
+    )
 
     # Decode the design
     Y = decode_design(best_state.Y, params.effect_types, coords=params.coords)
@@ -4,8 +4,6 @@ Module containing all the generic evaluation functions
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from numba.typed import List
 
 from ...utils.design import encode_design
@@ -30,6 +28,8 @@ def design_heatmap(Y, factors):
     fig : :py:class:`plotly.graph_objects.Figure`
         The heatmap of the design as a Plotly figure.
     """
+    import plotly.graph_objects as go
+
     # Subselect the factors
     Y = Y.copy()
     col_names = [str(f.name) for f in factors]
@@ -159,6 +159,8 @@ def plot_correlation_map(Y, factors, Y2X, model=None, method='pearson', drop_nan
     fig : :py:class:`plotly.graph_objects.Figure`
         The figure of the map of correlations.
     """
+    import plotly.express as px
+
     # Compute correlation map
     corr = correlation_map(Y, factors, Y2X, model, method)
     
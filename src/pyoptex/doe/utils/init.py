@@ -6,7 +6,7 @@ import numba
 import numpy as np
 
 
-@numba.njit
+@numba.njit(cache=True)
 def init_single_unconstrained(colstart, coords, run, effect_types):
     """
     Initializes a run at random. There are three possibilities:
@@ -35,8 +35,7 @@ def init_single_unconstrained(colstart, coords, run, effect_types):
         for i in range(colstart.size - 1):
             if effect_types[i] == 1:
                 # Sample continuous function
-                for j in range(run.shape[0]):
-                    run[:, colstart[i]] = np.random.rand(run.shape[0]) * 2 - 1
+                run[:, colstart[i]] = np.random.rand(run.shape[0]) * 2 - 1
             else:
                 # Sample categorical variable
                 coords_ = np.concatenate((np.eye(effect_types[i]-1), -np.ones((1, effect_types[i]-1))))
@@ -49,6 +48,118 @@ def init_single_unconstrained(colstart, coords, run, effect_types):
                 run[j, colstart[i]:colstart[i+1]] = coords[i][np.random.randint(len(coords[i]))]
     return run
 
+def init_qmc_unconstrained(colstart, coords, u, effect_types):
+    """
+    Maps points of the unit hypercube, with one dimension per factor, to runs.
+    See :py:func:`init_single_unconstrained <pyoptex.doe.utils.init.init_single_unconstrained>`
+    for the distribution of each factor.
+
+    Parameters
+    ----------
+    colstart : np.array(1d)
+        The starting column of each factor.
+    coords : list(np.array(2d) or None)
+        The coordinates to sample from.
+    u : np.array(2d)
+        The points in the unit hypercube.
+    effect_types : np.array(1d)
+        The type of each effect in case no coordinates are specified.
+
+    Returns
+    -------
+    run : np.array(2d)
+        The sampled runs.
+    """
+    run = np.zeros((len(u), colstart[-1]), dtype=np.float64)
+    for i in range(colstart.size - 1):
+        if coords is None:
+            if effect_types[i] == 1:
+                # Sample continuous function
+                run[:, colstart[i]] = u[:, i] * 2 - 1
+            else:
+                # Sample categorical variable
+                coords_ = np.concatenate((np.eye(effect_types[i]-1), -np.ones((1, effect_types[i]-1))))
+                run[:, colstart[i]:colstart[i+1]] = coords_[(u[:, i] * effect_types[i]).astype(np.int64)]
+        else:
+            # Coords based sampling
+            run[:, colstart[i]:colstart[i+1]] = coords[i][(u[:, i] * len(coords[i])).astype(np.int64)]
+    return run
+
+def init_qmc(colstart, coords, effect_types, constraints, n, replicates=8, min_accept=0.01):
+    """
+    Samples `n` runs within the constraints using a scrambled Sobol sequence,
+    which covers the design space more evenly than independent random runs.
+    The runs are generated in `replicates` blocks of equal size, each from
+    an independently scrambled sequence, allowing to estimate the accuracy 
+    of any average over the runs from the variation between blocks.
+
+    Runs which violate the constraints are rejected, and each sequence is
+    continued (doubling its length) until sufficient runs are accepted.
+    The accepted runs remain evenly spread over the feasible region.
+    However, only the first accepted runs of each sequence are kept. With
+    constraints, the blocks are therefore no longer balanced as a power 
+    of two, and averages only approximate the convergence rate of 
+    quasi-Monte Carlo.
+
+    Parameters
+    ----------
+    colstart : np.array(1d)
+        The starting column of each factor.
+    coords : list(np.array(2d) or None)
+        The coordinates to sample from, or None to sample the continuous factors
+        uniformly and the categorical factors from their effect encoded levels.
+    effect_types : np.array(1d)
+        The type of each effect.
+    constraints : func(Y)
+        The constraints function, on the encoded design matrix.
+    n : int
+        The number of runs, rounded up to a multiple of `replicates`.
+    replicates : int
+        The number of independently scrambled sequences.
+    min_accept : float
+        The minimum fraction of runs within the constraints. A ValueError
+        is raised when a sequence accepts fewer runs, e.g., when the 
+        feasible region is empty.
+
+    Returns
+    -------
+    run : np.array(2d)
+        The sampled runs, ordered per replicate.
+    """
+    from scipy.stats import qmc
+
+    nrep = -(-n // replicates)
+    m = max(int(np.ceil(np.log2(max(nrep, 1)))), 1)
+
+    runs = []
+    for _ in range(replicates):
+        # Scramble a new sequence (reproducible from the numpy seed)
+        sobol = qmc.Sobol(colstart.size - 1, scramble=True, seed=np.random.randint(2**31))
+        u = sobol.random_base2(m)
+
+        # Continue the sequence until sufficient feasible runs
+        accepted = []
+        naccepted = 0
+        while True:
+            run = init_qmc_unconstrained(colstart, coords, u, effect_types)
+            run = run[~constraints(run)]
+            accepted.append(run)
+            naccepted += len(run)
+            if naccepted >= nrep:
+                break
+
+            # Limit the length of the sequence
+            if sobol.num_generated * min_accept >= nrep:
+                raise ValueError(
+                    f'Less than {min_accept:.2%} of the sampled runs are within the constraints, '
+                    'the feasible region may be empty'
+                )
+            u = sobol.random_base2(int(np.log2(sobol.num_generated)))
+
+        runs.append(np.concatenate(accepted)[:nrep])
+
+    return np.concatenate(runs)
+
 def full_factorial(colstart, coords, Y=None):
     """
     Generates a full factorial design.
@@ -0,0 +1,204 @@
+"""
+Module containing the exact computation of the moments matrix.
+"""
+
+import numpy as np
+
+from ...utils.comp import outer_integral
+from ...utils import cache
+
+
+def product_moments(modelenc, colstart, coords):
+    """
+    Computes the moments matrix :math:`E[x x^T]` of a polynomial model
+    exactly, when the factors are independently distributed.
+    Each continuous factor is uniform on [-1, 1], each other factor
+    is uniform over a finite set of (encoded) coordinates.
+
+    Every element of the moments matrix is a monomial in the encoded
+    columns. By independence, its expectation is the product of the
+    expectations per factor, which are :math:`1 / (k+1)` for an even
+    power k of a uniform factor, zero for an odd power,
+    and the average over the coordinates otherwise.
+
+    Parameters
+    ----------
+    modelenc : np.array(2d)
+        The encoded model, specified as in MATLAB.
+    colstart : np.array(1d)
+        The start column of each factor in the encoded design matrix.
+    coords : list(None or np.array(2d))
+        The coordinates of each factor, or None for a uniform factor
+        on [-1, 1].
+
+    Returns
+    -------
+    moments : np.array(2d)
+        The moments matrix.
+    """
+    # The exponents of every pair of terms
+    powers = np.expand_dims(modelenc, 1) + np.expand_dims(modelenc, 0)
+
+    moments = np.ones(powers.shape[:2], dtype=np.float64)
+    for i, c in enumerate(coords):
+        if c is None:
+            # Uniform factor on [-1, 1]
+            p = powers[:, :, colstart[i]]
+            moments *= np.where(p % 2 == 0, 1 / (p + 1), 0)
+        else:
+            # Average over the coordinates
+            p = powers[:, :, np.newaxis, colstart[i]:colstart[i+1]]
+            moments *= np.mean(np.prod(c ** p, axis=-1), axis=-1)
+
+    return moments
+
+def exact_moments(params, complete=True):
+    """
+    Computes the moments matrix of the I-optimality criterion exactly,
+    if possible. This requires a polynomial model created by
+    :py:func:`model2Y2X <pyoptex.utils.model.model2Y2X>` and a design
+    space without constraints, in which case the random runs drawn by
+    the sampling approach are independent per factor, see
+    :py:func:`product_moments <pyoptex.doe.utils.moments.product_moments>`.
+
+    Parameters
+    ----------
+    params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>` or :py:class:`Parameters <pyoptex.doe.cost_optimal.utils.Parameters>`
+        The parameters of the design generation.
+    complete : bool
+        Whether the continuous factors are uniform on [-1, 1] and the categorical
+        factors uniform over their effect encoded levels, or every factor
+        uniform over its coordinates.
+
+    Returns
+    -------
+    moments : None or np.array(2d)
+        The moments matrix, or None if it cannot be computed exactly.
+    """
+    # Require a polynomial model
+    modelenc = getattr(params.fn.Y2X, 'modelenc', None)
+    if modelenc is None or getattr(params.fn.Y2X, 'me_idx', None) is not None \
+            or np.any(modelenc < 0) or np.any(modelenc % 1 != 0):
+        return None
+
+    # Require no constraints
+    feasibility = params.fn.feasibility
+    if feasibility is None or len(feasibility.cols) > 0 or not np.all(feasibility.table):
+        return None
+
+    # Distribution of each factor
+    if complete:
+        coords = [
+            None if et == 1 else np.concatenate((np.eye(et - 1), -np.ones((1, et - 1))))
+            for et in params.effect_types
+        ]
+    else:
+        coords = params.coords
+
+    return product_moments(modelenc, params.colstart, coords)
+
+def moments_key(params, *args):
+    """
+    Computes the key of the sampled moments matrix in the on-disk cache,
+    see :py:mod:`cache <pyoptex.utils.cache>`. The key is determined by the
+    factors, their coordinates, the model, the constraints and 
+    any other arguments of the sampling.
+    This requires a model created by 
+    :py:func:`model2Y2X <pyoptex.utils.model.model2Y2X>` or
+    :py:func:`mixtureY2X <pyoptex.utils.model.mixtureY2X>`, and constraints
+    created by :py:class:`Col <pyoptex.doe.constraints.Col>`,
+    such as :py:func:`parse_constraints_script <pyoptex.doe.constraints.parse_constraints_script>`.
+
+    Parameters
+    ----------
+    params : :py:class:`Parameters <pyoptex.doe.fixed_structure.utils.Parameters>` or :py:class:`Parameters <pyoptex.doe.cost_optimal.utils.Parameters>`
+        The parameters of the design generation.
+    args : iterable(obj)
+        The other arguments determining the samples.
+
+    Returns
+    -------
+    key : None or str
+        The key, or None if the cache is disabled or the
+        model or constraints cannot be identified.
+    """
+    if cache.cache_dir() is None:
+        return None
+
+    # Identify the model and constraints
+    modelenc = getattr(params.fn.Y2X, 'modelenc', None)
+    source = getattr(params.fn.constraints, 'source', None)
+    if modelenc is None or source is None:
+        return None
+
+    return cache.cache_key(
+        'moments', params.effect_types, params.colstart, list(params.coords),
+        modelenc, getattr(params.fn.Y2X, 'me_idx', None), source, *args
+    )
+
+def sample_moments(sample, n, tol=None, replicates=8, n_min=1024, key=None):
+    """
+    Estimates the moments matrix from random samples, together with the
+    standard error of each element. The samples are split in `replicates`
+    blocks, as generated by 
+    :py:func:`init_qmc <pyoptex.doe.utils.init.init_qmc>`, and the standard 
+    error is estimated from the variation of the moments matrices of the blocks.
+
+    If a tolerance is specified, the number of samples is doubled, starting
+    from `n_min`, until the largest standard error is below the tolerance, 
+    or `n` samples are drawn.
+
+    Parameters
+    ----------
+    sample : func(n)
+        A function drawing `n` samples, returning the
+        (covariate expanded) model matrix of the samples.
+    n : int
+        The (maximum) number of samples.
+    tol : None or float
+        The required standard error of the elements of the moments matrix.
+    replicates : int
+        The number of blocks to estimate the standard error.
+    n_min : int
+        The initial number of samples when a tolerance is specified.
+    key : None or str
+        The key in the on-disk cache, see
+        :py:func:`moments_key <pyoptex.doe.utils.moments.moments_key>`.
+
+    Returns
+    -------
+    samples : np.array(2d)
+        The samples.
+    moments : np.array(2d)
+        The moments matrix.
+    error : np.array(2d)
+        The standard error of each element of the moments matrix.
+    """
+    # Load from the cache
+    if key is not None:
+        arrays = cache.load(key)
+        if arrays is not None and {'samples', 'moments', 'error'} <= arrays.keys():
+            return arrays['samples'], np.array(arrays['moments']), np.array(arrays['error'])
+
+    n_ = n if tol is None else min(n_min, n)
+    while True:
+        # Estimate the moments matrix of each block
+        samples = sample(n_)
+        blocks = np.array_split(samples, replicates)
+        estimates = np.array([outer_integral(b) for b in blocks])
+        sizes = np.array([len(b) for b in blocks])
+
+        # Combine the blocks
+        moments = np.average(estimates, axis=0, weights=sizes)
+        error = np.std(estimates, axis=0, ddof=1) / np.sqrt(replicates)
+
+        # Verify the accuracy
+        if tol is None or np.max(error) <= tol or n_ >= n:
+            break
+        n_ = min(2 * n_, n)
+
+    # Store in the cache
+    if key is not None:
+        cache.store(key, samples=samples, moments=moments, error=error)
+
+    return samples, moments, error
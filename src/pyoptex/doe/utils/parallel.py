@@ -0,0 +1,442 @@
+"""
+Module containing the functions to distribute the random starts
+of the algorithms over multiple processes.
+"""
+
+import multiprocessing
+import os
+import signal
+import time
+import warnings
+
+import numba
+import numpy as np
+from threadpoolctl import threadpool_limits
+from tqdm import tqdm
+
+from ..._seed import set_seed, generate_seeds
+
+# The function evaluated by each worker process
+_worker_fn = None
+_worker_limits = None
+_worker_deadline = None
+
+def _init_worker(fn, deadline):
+    """
+    Initializes a worker process. The function to evaluate
+    is shipped only once per worker and numba and BLAS are restricted
+    to a single thread. Interrupts are ignored, as they are handled
+    by the main process.
+
+    Parameters
+    ----------
+    fn : func(i, deadline)
+        The function to evaluate for each random start.
+    deadline : None or tuple(float, multiprocessing.Array)
+        The deadline of all random starts and the progress shared
+        between the processes, see
+        :py:func:`try_deadline <pyoptex.doe.utils.parallel.try_deadline>`.
+    """
+    global _worker_fn, _worker_limits, _worker_deadline
+    _worker_fn = fn
+    _worker_deadline = deadline
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    numba.set_num_threads(1)
+    _worker_limits = threadpool_limits(limits=1, user_api='blas')
+
+def _run_try(args):
+    """
+    Evaluates a single random start with its own seed.
+
+    Parameters
+    ----------
+    args : tuple(int, int)
+        The index of the random start and its seed.
+
+    Returns
+    -------
+    i : int
+        The index of the random start.
+    skipped : bool
+        Whether the random start was skipped as it could not
+        complete before the deadline.
+    result : obj
+        The result of the function for this random start.
+    """
+    i, seed = args
+
+    # Without deadline
+    if _worker_deadline is None:
+        set_seed(seed)
+        return i, False, _worker_fn(i, None)
+
+    # Check if the random start can complete in time
+    deadline, progress = _worker_deadline
+    with progress.get_lock():
+        if i > 0 and (progress[2] or not try_deadline(deadline, progress[0], progress[1])):
+            progress[2] = 1
+            return i, True, None
+        progress[3] += 1
+
+    # Evaluate the random start
+    set_seed(seed)
+    start = time.time()
+    result = _worker_fn(i, deadline)
+
+    # Store its duration
+    with progress.get_lock():
+        progress[0] += time.time() - start
+        progress[1] += 1
+
+    return i, False, result
+
+def try_deadline(deadline, elapsed, n_done):
+    """
+    Determines whether a new random start can still complete before
+    the deadline. Its duration is estimated by the mean duration of
+    the completed random starts. As long as no random start
+    completed, new random starts are launched until the deadline.
+
+    Parameters
+    ----------
+    deadline : float
+        The deadline of all random starts, as a timestamp of `time.time()`.
+    elapsed : float
+        The total duration of the completed random starts in seconds.
+    n_done : int
+        The number of completed random starts.
+
+    Returns
+    -------
+    launch : bool
+        Whether to launch a new random start.
+    """
+    duration = elapsed / n_done if n_done > 0 else 0
+    return time.time() + duration < deadline
+
+def _threading_layer():
+    """
+    Retrieves the numba threading layer, if it was already launched.
+
+    Returns
+    -------
+    layer : None or str
+        The name of the threading layer, or None if not launched.
+    """
+    try:
+        return numba.threading_layer()
+    except ValueError:
+        return None
+
+def get_n_jobs(n_jobs, n_tries):
+    """
+    Computes the effective number of processes. A negative
+    number follows the joblib convention: -1 uses all CPUs,
+    -2 all but one, etc.
+
+    Parameters
+    ----------
+    n_jobs : int
+        The requested number of processes.
+    n_tries : int
+        The number of random starts.
+
+    Returns
+    -------
+    n_jobs : int
+        The effective number of processes.
+    """
+    assert n_jobs != 0, 'The number of jobs cannot be zero'
+    if n_jobs < 0:
+        n_jobs = max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    return min(n_jobs, n_tries)
+
+def _run_serial(fn, seeds, pbar=None, warmup=None, deadline=None):
+    """
+    Evaluates the random starts serially in the main process, see
+    :py:func:`run_tries <pyoptex.doe.utils.parallel.run_tries>`.
+    Numba is restricted to a single thread only if its threading layer
+    is already running, as launching it (e.g. tbb) prevents forking
+    afterwards. The previous number of threads is restored at the end.
+
+    Parameters
+    ----------
+    fn : func(i, deadline)
+        The function to evaluate for each random start.
+    seeds : list(int)
+        The seed of each random start.
+    pbar : None or tqdm
+        A progress bar which is updated after each random start.
+    warmup : None or func()
+        A function to compile all numba functions, called
+        only with a deadline.
+    deadline : None or float
+        The deadline of all random starts, as a timestamp of `time.time()`.
+
+    Returns
+    -------
+    results : generator
+        The results of each random start, in order.
+    """
+    # Restrict numba to a single thread, without launching its threading layer
+    n_threads = numba.get_num_threads() if _threading_layer() is not None else None
+    if n_threads is not None:
+        numba.set_num_threads(1)
+
+    try:
+        # Compile all functions
+        if deadline is not None and warmup is not None:
+            set_seed(seeds[0])
+            warmup()
+
+        elapsed = 0
+        for i, seed in enumerate(seeds):
+            # Skip random starts which cannot complete in time
+            if deadline is not None and i > 0 and not try_deadline(deadline, elapsed, i):
+                if pbar is not None:
+                    pbar.update(len(seeds) - i)
+                break
+
+            set_seed(seed)
+            t = time.time()
+            result = fn(i, deadline)
+            elapsed += time.time() - t
+            if pbar is not None:
+                pbar.update(1)
+            yield result
+
+    finally:
+        # Restore the number of threads
+        if n_threads is not None:
+            numba.set_num_threads(n_threads)
+
+def run_tries(fn, seeds, n_jobs=1, pbar=None, warmup=None, deadline=None):
+    """
+    Evaluates `fn(i, deadline)` for each random start `i`, each after seeding
+    numpy and numba with `seeds[i]`. The results are yielded
+    in order of the random starts, independent of the number of
+    processes. As a result, reducing them in order provides
+    bit-identical results to a serial run with the same seeds.
+
+    If a `deadline` is specified, `fn` is called with it and must stop
+    by that time. No new random starts are launched once the remaining
+    time is shorter than the mean duration of the completed random starts, see
+    :py:func:`try_deadline <pyoptex.doe.utils.parallel.try_deadline>`.
+    These skipped random starts, except for the first one, do
+    not yield a result. Without a deadline, `fn` is called with None.
+
+    When using multiple processes, the first random start is evaluated
+    in the main process to compile all numba functions once, unless a
+    (cheaper) `warmup` function is provided. With a deadline, the `warmup`
+    is also called for a serial run, so the compilation does not
+    inflate the estimated duration of a random start. The 
+    remaining starts are distributed over a pool of forked processes,
+    which inherit `fn` and everything it references (such as
+    the preinitialized metric) without recomputation or pickling.
+    If forking is unavailable on this platform, the random starts 
+    are evaluated serially.
+
+    On a KeyboardInterrupt, the pool is terminated and the results
+    of the already completed random starts are yielded before
+    raising the interrupt.
+
+    .. note::
+        The caller is responsible for restricting BLAS to a 
+        single thread in the main process. Numba is only restricted
+        in the main process when running serially and its threading
+        layer is already running, as launching it before forking is unsafe.
+
+    Parameters
+    ----------
+    fn : func(i, deadline)
+        The function to evaluate for each random start. The result must
+        be picklable.
+    seeds : list(int)
+        The seed of each random start, see
+        :py:func:`generate_seeds <pyoptex._seed.generate_seeds>`.
+    n_jobs : int
+        The number of processes.
+    pbar : None or tqdm
+        A progress bar which is updated as soon as any random
+        start completes, irrespective of the order.
+    warmup : None or func()
+        A function to compile all numba functions in the main
+        process before forking. Only called when using multiple
+        processes, or with a deadline.
+    deadline : None or float
+        The deadline of all random starts, as a timestamp of `time.time()`.
+
+    Returns
+    -------
+    results : generator
+        The results of each random start, in order.
+    """
+    # Compute the number of processes
+    n_jobs = get_n_jobs(n_jobs, len(seeds))
+    if n_jobs > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+        warnings.warn('Parallel random starts require the fork start method, running serially')
+        n_jobs = 1
+    if n_jobs > 1 and _threading_layer() == 'tbb':
+        warnings.warn('The numba tbb threading layer is not fork-safe, running serially')
+        n_jobs = 1
+
+    # Serial evaluation
+    if n_jobs == 1:
+        yield from _run_serial(fn, seeds, pbar, warmup, deadline)
+        return
+
+    # Compile all functions before forking
+    if warmup is None:
+        set_seed(seeds[0])
+        result = fn(0, deadline)
+        if pbar is not None:
+            pbar.update(1)
+        yield result
+        start = 1
+    else:
+        set_seed(seeds[0])
+        warmup()
+        start = 0
+
+    # Distribute the remaining starts
+    ctx = multiprocessing.get_context('fork')
+    if deadline is not None:
+        # The total duration and number of completed random starts,
+        # whether the random starts were stopped and the number of
+        # launched random starts
+        progress = ctx.Array('d', 4)
+        deadline = (deadline, progress)
+    with ctx.Pool(n_jobs, initializer=_init_worker, initargs=(fn, deadline)) as pool:
+        # Buffer the results which complete out of order
+        buffer = dict()
+        next_i = start
+        n_recv, n_done = 0, 0
+        try:
+            for i, skipped, result in pool.imap_unordered(_run_try, enumerate(seeds[start:], start=start)):
+                if pbar is not None:
+                    pbar.update(1)
+                buffer[i] = (skipped, result)
+                n_recv += 1
+                n_done += not skipped
+
+                # Yield the results in order
+                while next_i in buffer:
+                    skipped, result = buffer.pop(next_i)
+                    if not skipped:
+                        yield result
+                    next_i += 1
+
+                # Stop once all launched random starts completed
+                if deadline is not None:
+                    with progress.get_lock():
+                        stopped = progress[2] and n_done == progress[3]
+                    if stopped:
+                        pool.terminate()
+                        if pbar is not None:
+                            pbar.update(len(seeds) - start - n_recv)
+                        for i in sorted(buffer.keys()):
+                            skipped, result = buffer[i]
+                            if not skipped:
+                                yield result
+                        return
+
+        except KeyboardInterrupt:
+            # Yield the completed results before interrupting
+            pool.terminate()
+            for i in sorted(buffer.keys()):
+                skipped, result = buffer[i]
+                if not skipped:
+                    yield result
+            raise
+
+def optimize_tries(optimize, params, n_tries, max_it=10000, validate=False,
+                   n_jobs=1, seed=None, time_budget=None, race=None):
+    """
+    Runs the random starts of a coordinate-exchange algorithm and
+    retains the best design. The random starts are distributed
+    using :py:func:`run_tries <pyoptex.doe.utils.parallel.run_tries>`.
+
+    Parameters
+    ----------
+    optimize : func(params, max_it, validate, deadline, race)
+        The optimization function of a single random start, returning
+        the parameters and the final state. The work performed
+        is stored in `params.stats` (`it`, `converged`, `abandoned`
+        and `trajectory`).
+    params : obj
+        The simulation parameters.
+    n_tries : int
+        The number of random starts.
+    max_it : int
+        The maximum number of iterations per random start.
+    validate : bool
+        Whether to validate each state.
+    n_jobs : int
+        The number of processes over which to distribute the random starts.
+    seed : None or int
+        The master seed from which the seed of each random start is
+        generated.
+    time_budget : None or float
+        The wall-clock time in seconds after which to stop.
+    race : None or :py:class:`Race <pyoptex.doe.fixed_structure.racing.Race>`
+        The race of the random starts (within each process).
+
+    Returns
+    -------
+    best_state : namedtuple
+        The state with the highest metric. The work performed is
+        stored in `params.stats` (`n_tries`, `its`, `converged`,
+        `abandoned` and `elapsed`).
+    """
+    # Compute the deadline
+    start = time.time()
+    deadline = start + time_budget if time_budget is not None else None
+
+    with threadpool_limits(limits=1, user_api='blas'):
+
+        # Pre initialize metric
+        params.fn.metric.preinit(params)
+
+        # Generate a seed for each random start
+        seeds = generate_seeds(n_tries, seed)
+
+        # Single random start
+        def _optimize(i, deadline):
+            _, state = optimize(params, max_it, validate=validate, deadline=deadline, race=race)
+            if race is not None:
+                race.add(params.stats['trajectory'], completed=params.stats['converged'])
+            return state, params.stats['it'], params.stats['converged'], params.stats['abandoned']
+
+        # Compile all functions with a single iteration, as the first 
+        # random start may stop before it
+        def _warmup():
+            optimize(params, 1)
+
+        # Main loop
+        best_metric = -np.inf
+        best_state = None
+        its, converged, abandoned = [], [], []
+        with tqdm(total=n_tries) as pbar:
+            for state, it, conv, aband in run_tries(
+                    _optimize, seeds, n_jobs, pbar=pbar, deadline=deadline,
+                    warmup=_warmup if deadline is not None else None
+                ):
+
+                # Store the work
+                its.append(it)
+                converged.append(conv)
+                abandoned.append(aband)
+
+                # Store the results
+                if state.metric > best_metric:
+                    best_metric = state.metric
+                    best_state = state._replace(Y=np.copy(state.Y), X=np.copy(state.X))
+
+    # Store the performed work
+    params.stats['n_tries'] = len(its)
+    params.stats['its'] = np.array(its, dtype=np.int64)
+    params.stats['converged'] = np.array(converged, dtype=np.bool_)
+    params.stats['abandoned'] = np.array(abandoned, dtype=np.bool_)
+    params.stats['elapsed'] = time.time() - start
+
+    return best_state
@@ -0,0 +1,304 @@
+"""
+Module for the persistent on-disk cache of computational artifacts.
+"""
+
+import hashlib
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# The environment variables configuring the cache
+CACHE_DIR_ENV = 'PYOPTEX_CACHE_DIR'
+CACHE_SIZE_ENV = 'PYOPTEX_CACHE_SIZE'
+
+# The default maximum size of the cache in bytes
+DEFAULT_CACHE_SIZE = 2**30
+
+
+def cache_dir():
+    """
+    Retrieves the cache directory from the `PYOPTEX_CACHE_DIR` environment
+    variable. The cache is disabled if it is not set.
+
+    Returns
+    -------
+    path : None or str
+        The cache directory.
+    """
+    path = os.environ.get(CACHE_DIR_ENV)
+    return path if path else None
+
+def cache_key(*parts):
+    """
+    Computes a content-addressed key from the parts. Arrays
+    are hashed by their type, shape and content, lists and tuples
+    recursively, and any other object by its representation.
+
+    Parameters
+    ----------
+    parts : iterable(obj)
+        The objects determining the cached content.
+
+    Returns
+    -------
+    key : str
+        The hexadecimal key.
+    """
+    h = hashlib.sha256()
+
+    def update(part):
+        if isinstance(part, np.ndarray):
+            h.update(f'array{part.dtype.str}{part.shape}'.encode())
+            h.update(np.ascontiguousarray(part).tobytes())
+        elif isinstance(part, (list, tuple)) or type(part).__name__ == 'List':
+            h.update(f'list{len(part)}'.encode())
+            for p in part:
+                update(p)
+        else:
+            h.update(f'{type(part).__name__}{part!r}'.encode())
+        h.update(b'|')
+
+    for part in parts:
+        update(part)
+    return h.hexdigest()
+
+def load(key):
+    """
+    Loads the arrays of an entry in the cache as read-only memory-mapped
+    arrays, and marks the entry as recently used.
+
+    Parameters
+    ----------
+    key : str
+        The key of the entry, see
+        :py:func:`cache_key <pyoptex.utils.cache.cache_key>`.
+
+    Returns
+    -------
+    arrays : None or dict(str, np.array)
+        The arrays, or None if the cache is disabled or the
+        entry does not exist.
+    """
+    root = cache_dir()
+    if root is None:
+        return None
+
+    path = os.path.join(root, key)
+    try:
+        arrays = {
+            f[:-4]: np.load(os.path.join(path, f), mmap_mode='r')
+            for f in os.listdir(path) if f.endswith('.npy')
+        }
+        os.utime(path)
+    except (FileNotFoundError, NotADirectoryError):
+        # Entry does not exist (or was evicted concurrently)
+        return None
+
+    return arrays
+
+def path(key):
+    """
+    Retrieves the directory of an entry in the cache, and marks
+    the entry as recently used.
+
+    Parameters
+    ----------
+    key : str
+        The key of the entry, see
+        :py:func:`cache_key <pyoptex.utils.cache.cache_key>`.
+
+    Returns
+    -------
+    path : None or str
+        The directory of the entry, or None if the cache is disabled or the
+        entry does not exist.
+    """
+    root = cache_dir()
+    if root is None:
+        return None
+
+    path = os.path.join(root, key)
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+
+    return path
+
+def _publish(key, write):
+    """
+    Writes an entry to a temporary directory and atomically
+    renames it, such that concurrent readers either observe the complete
+    entry or no entry. Afterwards, the least recently used entries are
+    evicted until the cache is below `PYOPTEX_CACHE_SIZE` bytes
+    (default 1 GiB).
+
+    Parameters
+    ----------
+    key : str
+        The key of the entry, see
+        :py:func:`cache_key <pyoptex.utils.cache.cache_key>`.
+    write : func(path)
+        Writes the files of the entry to the directory.
+
+    Returns
+    -------
+    path : None or str
+        The directory of the entry, or None if the cache is disabled.
+    """
+    root = cache_dir()
+    if root is None:
+        return None
+    os.makedirs(root, exist_ok=True)
+
+    # Write the entry
+    tmp = tempfile.mkdtemp(prefix='.tmp-', dir=root)
+    try:
+        write(tmp)
+
+        # Publish the entry (fails if a concurrent writer published it first)
+        try:
+            os.rename(tmp, os.path.join(root, key))
+        except OSError:
+            pass
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    evict(int(os.environ.get(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE)))
+    return os.path.join(root, key)
+
+def store(key, **arrays):
+    """
+    Stores arrays as an entry in the cache, as one .npy file per array.
+    See :py:func:`_publish <pyoptex.utils.cache._publish>`.
+
+    Parameters
+    ----------
+    key : str
+        The key of the entry, see
+        :py:func:`cache_key <pyoptex.utils.cache.cache_key>`.
+    arrays : dict(str, np.array)
+        The arrays to store.
+    """
+    def write(tmp):
+        for name, arr in arrays.items():
+            np.save(os.path.join(tmp, f'{name}.npy'), np.asarray(arr))
+
+    _publish(key, write)
+
+def store_text(key, **files):
+    """
+    Stores text files as an entry in the cache.
+    See :py:func:`_publish <pyoptex.utils.cache._publish>`.
+
+    Parameters
+    ----------
+    key : str
+        The key of the entry, see
+        :py:func:`cache_key <pyoptex.utils.cache.cache_key>`.
+    files : dict(str, str)
+        The content of each file by name.
+
+    Returns
+    -------
+    path : None or str
+        The directory of the entry, or None if the cache is disabled.
+    """
+    def write(tmp):
+        for name, text in files.items():
+            with open(os.path.join(tmp, name), 'w') as f:
+                f.write(text)
+
+    return _publish(key, write)
+
+def load_module(key, source):
+    """
+    Loads generated source code as a module from an entry in the cache,
+    storing the entry first if required. Numba functions in the module compiled
+    with `cache=True` persist their machine code next to the module, avoiding
+    the compilation in any later process.
+
+    Parameters
+    ----------
+    key : str
+        The key of the entry, see
+        :py:func:`cache_key <pyoptex.utils.cache.cache_key>`.
+    source : str
+        The source code of the module.
+
+    Returns
+    -------
+    module : None or module
+        The loaded module, or None if the cache is disabled or the
+        entry could not be loaded.
+    """
+    # Check if already loaded
+    name = f'pyoptex_cache_{key}'
+    if name in sys.modules:
+        return sys.modules[name]
+
+    # Retrieve or store the entry
+    entry = path(key) or store_text(key, **{'module.py': source})
+    if entry is None:
+        return None
+
+    try:
+        # Register the module for numba to rebuild the cached environment
+        spec = importlib.util.spec_from_file_location(name, os.path.join(entry, 'module.py'))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    except OSError:
+        # Entry was evicted concurrently
+        sys.modules.pop(name, None)
+        return None
+
+    return module
+
+def evict(max_size):
+    """
+    Removes the least recently used entries until the cache
+    is below `max_size` bytes.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum size of the cache in bytes.
+    """
+    root = cache_dir()
+    if root is None or not os.path.isdir(root):
+        return
+
+    # Collect the size and last use of each entry
+    entries = []
+    for key in os.listdir(root):
+        path = os.path.join(root, key)
+        if key.startswith('.'):
+            # Remove abandoned temporary entries
+            try:
+                if time.time() - os.path.getmtime(path) > 3600:
+                    shutil.rmtree(path, ignore_errors=True)
+            except FileNotFoundError:
+                pass
+            continue
+        try:
+            size = sum(
+                os.path.getsize(os.path.join(d, f))
+                for d, _, files in os.walk(path) for f in files
+            )
+            entries.append((os.path.getmtime(path), size, path))
+        except FileNotFoundError:
+            continue
+
+    # Evict the least recently used
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_size:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
@@ -6,7 +6,7 @@ import numba
 import numpy as np
 
 
-@numba.njit
+@numba.njit(cache=True)
 def outer_integral(arr):
     """
     Computes the integral of the outer products of the array rows 
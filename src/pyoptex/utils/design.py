@@ -4,6 +4,7 @@ Module for utility functions related to the design matrices.
 import numba
 import numpy as np
 
+from . import cache
 from .numba import numba_all_axis2, numba_take_advanced
 
 
@@ -32,7 +33,7 @@ def create_default_coords(effect_type):
 
 ################################################
 
-@numba.njit
+@numba.njit(cache=True)
 def x2fx(Yenc, modelenc):
     """
     Create the model matrix from the design matrix and model specification.
@@ -70,7 +71,89 @@ def x2fx(Yenc, modelenc):
         Xenc[..., i] = p
     return Xenc
 
-@numba.njit
+def x2fx_compile(modelenc, me_idx=None):
+    """
+    Generates specialized, numba-compiled functions to create the 
+    model matrix from the design matrix for a specific model. See
+    :py:func:`x2fx <pyoptex.utils.design.x2fx>` for the specification 
+    of the model.
+
+    The products of each term are unrolled, and the products shared between
+    terms are computed only once, e.g., A*B is reused in A*B*C. Integer
+    powers are computed by multiplication.
+
+    The function has signature `f(Yenc, Xenc)` for 2d C-contiguous
+    matrices, writes into the provided model matrix `Xenc` and returns it. Recomputing only the terms
+    involving some columns is not faster, as the shared products are cheap
+    compared to the overhead of selecting the terms.
+
+    When the on-disk cache is enabled, see :py:mod:`cache <pyoptex.utils.cache>`, the
+    generated module is stored in the cache and the machine code is persisted
+    across processes.
+
+    Parameters
+    ----------
+    modelenc : np.array(2d)
+        The encoded model, specified as in MATLAB.
+    me_idx : None or np.array(1d)
+        If not None, the final column of the model is a mixture component
+        which is computed as one minus the sum of these columns.
+
+    Returns
+    -------
+    x2fx_ : func(Yenc, Xenc)
+        The function computing the model matrix.
+    """
+    names = dict()
+    shared = []
+
+    def product(key):
+        # Compute the name of a (shared) product of powers
+        if len(key) == 0:
+            return '1.0'
+        if key not in names:
+            if len(key) == 1:
+                j, p = key[0]
+                if p == 1:
+                    return f'y{j}'
+                if float(p).is_integer() and p > 1:
+                    expr = f'{product(((j, int(p) - 1),))} * y{j}'
+                else:
+                    expr = f'y{j} ** {float(p)!r}'
+            else:
+                expr = f'{product(key[:-1])} * {product(key[-1:])}'
+            names[key] = f'p{len(names)}'
+            shared.append(f'{names[key]} = {expr}')
+        return names[key]
+
+    # Extract the factors of each term (sorted by column)
+    keys = [tuple((j, term[j]) for j in range(len(term)) if term[j] != 0) for term in modelenc]
+    cols = sorted({j for key in keys for j, _ in key})
+
+    # Load the columns of the design matrix
+    ncols = modelenc.shape[1] - (0 if me_idx is None else 1)
+    load = [f'y{j} = Y__[r__, {j}]' for j in cols if j < ncols]
+    if me_idx is not None and ncols in cols:
+        load.extend(f'y{j} = Y__[r__, {j}]' for j in me_idx if j not in cols)
+        load.append(f'y{ncols} = 1.0 - (' + ' + '.join(f'y{j}' for j in me_idx) + ')')
+
+    # Full computation with shared products
+    assign = [f'X__[r__, {i}] = {product(key)}' for i, key in enumerate(keys)]
+    body = '\n        '.join(load + shared + assign)
+    src = f'def x2fx__(Y__, X__):\n    for r__ in range(Y__.shape[0]):\n        {body}\n    return X__'
+
+    # Load the module from the on-disk cache
+    src = f'import numba\n\n@numba.njit(cache=True)\n{src}\n'
+    module = cache.load_module(cache.cache_key('x2fx', src), src)
+    if module is not None:
+        return module.x2fx__
+
+    # Compile in-process
+    env = dict()
+    exec(src.replace('@numba.njit(cache=True)', '@numba.njit'), env)
+    return env['x2fx__']
+
+@numba.njit(cache=True)
 def force_Zi_asc(Zi):
     """
     Force ascending groups. In other words [0, 0, 2, 1, 1, 1]
@@ -140,7 +223,7 @@ def obs_var_from_Zs(Zs, N, ratios=None, include_error=True):
 
 ################################################
 
-@numba.njit
+@numba.njit(cache=True)
 def encode_design(Y, effect_types, coords=None):
     """
     Encode the design according to the effect types.
@@ -189,7 +272,7 @@ def encode_design(Y, effect_types, coords=None):
 
     return Yenc
 
-@numba.njit
+@numba.njit(cache=True)
 def decode_design(Y, effect_types, coords=None):
     """
     Decode the design according to the effect types.
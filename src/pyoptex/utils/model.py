@@ -7,7 +7,7 @@ from collections import Counter
 import numpy as np
 import pandas as pd
 
-from .design import x2fx
+from .design import x2fx, x2fx_compile
 from .numba import numba_choice_bool_axis0
 
 
@@ -148,6 +148,49 @@ def encode_model(model, effect_types):
 
     return model
 
+def _compile_Y2X(modelenc, me_idx=None):
+    """
+    Creates a Y2X function from an encoded model using the
+    specialized functions of
+    :py:func:`x2fx_compile <pyoptex.utils.design.x2fx_compile>`.
+    The function accepts an optional C-contiguous output buffer `out`.
+    As with :py:func:`x2fx <pyoptex.utils.design.x2fx>`, the design
+    matrix may have any number of leading dimensions.
+    The encoded model and mixture components are exposed as the 
+    `modelenc` and `me_idx` attributes.
+
+    Parameters
+    ----------
+    modelenc : np.array(2d)
+        The encoded model, specified as in MATLAB.
+    me_idx : None or np.array(1d)
+        The encoded columns of the mixture components, if the final 
+        column of the model is the final mixture component.
+
+    Returns
+    -------
+    Y2X : func(Y, out=None)
+        The function transforming the design matrix (Y) to
+        the model matrix (X).
+    """
+    x2fx_ = x2fx_compile(modelenc, me_idx)
+
+    def Y2X(Y, out=None):
+        Y = np.ascontiguousarray(Y, dtype=np.float64)
+        if out is None:
+            out = np.empty((*Y.shape[:-1], len(modelenc)), dtype=np.float64)
+        assert out.flags.c_contiguous, 'The output buffer must be C-contiguous'
+
+        # Compute on the flattened runs
+        x2fx_(Y.reshape(-1, Y.shape[-1]), out.reshape(-1, out.shape[-1]))
+        return out
+
+    # Expose the polynomial model
+    Y2X.modelenc = modelenc
+    Y2X.me_idx = me_idx
+
+    return Y2X
+
 def model2Y2X(model, factors):
     """
     Creates a Y2X function from a model.
@@ -161,9 +204,10 @@ def model2Y2X(model, factors):
 
     Returns
     -------
-    Y2X : func(Y)
+    Y2X : func(Y, out=None)
         The function transforming the design matrix (Y) to
-        the model matrix (X).
+        the model matrix (X), optionally writing into
+        the provided buffer `out`.
     """
     # Validation
     assert isinstance(model, pd.DataFrame), 'Model must be a dataframe'
@@ -182,9 +226,7 @@ def model2Y2X(model, factors):
     modelenc = encode_model(model, effect_types)
 
     # Create transformation function for polynomial models
-    Y2X = lambda Y: x2fx(Y, modelenc)
-
-    return Y2X
+    return _compile_Y2X(modelenc)
 
 def mixture_scheffe_model(mixture_effects, process_effects=dict(), cross_order=None, mcomp='_mixture_comp_'):
     """
@@ -460,14 +502,7 @@ def mixtureY2X(factors, mixture_effects, process_effects=dict(), cross_order=Non
     modelenc = encode_model(model, effect_types)
 
     # Define Y2X
-    def Y2X(Y):
-        Y = np.concatenate((
-            Y,
-            np.expand_dims(1 - np.sum(Y[:, me_idx_enc], axis=1), 1)
-        ), axis=1)
-        return x2fx(Y, modelenc)
-
-    return Y2X
+    return _compile_Y2X(modelenc, me_idx_enc)
 
 def identityY2X(Y):
     """
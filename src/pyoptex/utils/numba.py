@@ -6,7 +6,7 @@ import numba
 import numpy as np
 
 
-@numba.njit
+@numba.njit(cache=True)
 def numba_diff(x):
     """
     Numba compatible implementation of np.diff(...) for
@@ -24,7 +24,7 @@ def numba_diff(x):
     """
     return x[1:] - x[:-1]
 
-@numba.njit
+@numba.njit(cache=True)
 def numba_diff_axis0(x):
     """
     Numba compatible implementation of np.diff(..., axis=0) for
@@ -45,7 +45,7 @@ def numba_diff_axis0(x):
         diff[:, i] = x[1:, i] - x[:-1, i]
     return diff
 
-@numba.njit
+@numba.njit(cache=True)
 def numba_any_axis1(x):
     """
     Numba compatible implementation of np.any(..., axis=1) for
@@ -66,7 +66,7 @@ def numba_any_axis1(x):
         res = np.logical_or(res, x[:, i])
     return res
 
-@numba.njit
+@numba.njit(cache=True)
 def numba_all_axis1(x):
     """
     Numba compatible implementation of np.all(..., axis=1) for
@@ -87,7 +87,7 @@ def numba_all_axis1(x):
         out[i] = np.all(x[i, :])
     return out
 
-@numba.njit
+@numba.njit(cache=True)
 def numba_all_axis2(x):
     """
     Numba compatible implementation of np.all(..., axis=2) for
@@ -108,7 +108,7 @@ def numba_all_axis2(x):
         res = np.logical_and(res, x[:, :, i])
     return res
 
-@numba.njit
+@numba.njit(cache=True)
 def numba_delete_axis0(x, pos):
     """
     Numba compatible implementation of np.delete(..., axis=0) for
@@ -128,7 +128,7 @@ def numba_delete_axis0(x, pos):
     mask[pos] = False
     return np.copy(x[mask])
 
-@numba.njit
+@numba.njit(cache=True)
 def numba_insert(x, pos, value):
     """
     Numba compatible implementation of np.insert(...) for
@@ -151,7 +151,7 @@ def numba_insert(x, pos, value):
     a[pos+1:] = x[pos:]
     return a
 
-@numba.njit
+@numba.njit(cache=True)
 def numba_insert_axis0(x, pos, value):
     """
     Numba compatible implementation of np.insert(..., axis=0) for
@@ -173,7 +173,7 @@ def numba_insert_axis0(x, pos, value):
     a[pos+1:] = x[pos:]
     return a
 
-@numba.njit
+@numba.njit(cache=True)
 def numba_take_advanced(arr, idx, out=None):
     """
     Numba compatible implementation of the advanced
@@ -194,7 +194,7 @@ def numba_take_advanced(arr, idx, out=None):
     # Reshape and return
     return out.reshape((*shape, *arr.shape[1:]))
 
-@numba.njit
+@numba.njit(cache=True)
 def numba_choice_bool_axis0(valids):
     """
     For each row in valids, chooses a random index of the true
@@ -223,7 +223,7 @@ def numba_choice_bool_axis0(valids):
             out[i] = np.random.choice(idx)
     return out
 
-@numba.njit
+@numba.njit(cache=True)
 def numba_int2bool(arr, size):
     """
     Converts an ndarray of integers to a boolean representation.
@@ -0,0 +1,23 @@
+import os
+import warnings
+
+import pytest
+
+from pyoptex.doe.utils.parallel import run_tries, _threading_layer
+
+
+def _pid(i, deadline):
+    return os.getpid()
+
+@pytest.mark.skipif(_threading_layer() is not None, reason='numba threading layer already launched')
+def test_serial_then_parallel():
+    # Serial run does not launch the numba threading layer
+    assert list(run_tries(_pid, [1, 2], n_jobs=1)) == [os.getpid()] * 2
+    assert _threading_layer() is None
+
+    # The following parallel run still forks
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        pids = list(run_tries(_pid, [1, 2, 3], n_jobs=2))
+    assert pids[0] == os.getpid()
+    assert all(pid != os.getpid() for pid in pids[1:])